@@ -0,0 +1,144 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+
+"""
+Measures the parsing of the Caffe .prototxt file with the google.protobuf.text_format and with the TextProtoParser.
+The synthetic ResNet-like topology is parsed if the file is not specified. The parsed messages are compared.
+
+$ python3 benchmarks/caffe_prototxt.py --blocks 500 --repeats 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from google.protobuf import text_format
+from google.protobuf.internal import api_implementation
+
+from mo.front.caffe.proto import caffe_pb2
+from mo.front.caffe.text_proto_parser import parse_text_proto
+
+INPUT_TEMPLATE = '''name: "benchmark"
+layer {{
+  name: "data"
+  type: "Input"
+  top: "{top}"
+  input_param {{ shape: {{ dim: 1 dim: 64 dim: 56 dim: 56 }} }}
+}}
+'''
+
+BLOCK_TEMPLATE = '''layer {{
+  name: "{name}/conv"
+  type: "Convolution"
+  bottom: "{bottom}"
+  top: "{name}/conv"
+  param {{ lr_mult: 1 decay_mult: 1 }}
+  convolution_param {{
+    num_output: 64
+    bias_term: false
+    pad: 1
+    kernel_size: 3
+    stride: 1
+    weight_filler {{ type: "msra" }}
+  }}
+}}
+layer {{
+  name: "{name}/bn"
+  type: "BatchNorm"
+  bottom: "{name}/conv"
+  top: "{name}/conv"
+  batch_norm_param {{ use_global_stats: true eps: 1e-5 }}
+}}
+layer {{
+  name: "{name}/scale"
+  type: "Scale"
+  bottom: "{name}/conv"
+  top: "{name}/conv"
+  scale_param {{ bias_term: true }}
+}}
+layer {{
+  name: "{name}/sum"
+  type: "Eltwise"
+  bottom: "{bottom}"
+  bottom: "{name}/conv"
+  top: "{name}/sum"
+  eltwise_param {{ operation: SUM }}
+}}
+layer {{
+  name: "{name}/relu"
+  type: "ReLU"
+  bottom: "{name}/sum"
+  top: "{name}/relu"
+}}
+'''
+
+
+def build_prototxt(num_blocks: int):
+    text = [INPUT_TEMPLATE.format(top='data')]
+    bottom = 'data'
+    for i in range(num_blocks):
+        name = 'block_{}'.format(i)
+        text.append(BLOCK_TEMPLATE.format(name=name, bottom=bottom))
+        bottom = name + '/relu'
+    return ''.join(text)
+
+
+def text_format_parse(text: str):
+    proto = caffe_pb2.NetParameter()
+    text_format.Merge(text, proto)
+    return proto
+
+
+def measure(parse: callable, text: str, repeats: int):
+    best, proto = None, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        proto = parse(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, proto
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--prototxt', help='Caffe .prototxt file to parse instead of the synthetic one')
+    parser.add_argument('--blocks', type=int, default=500)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.prototxt:
+        with open(args.prototxt, 'r') as file:
+            text = file.read()
+    else:
+        text = build_prototxt(args.blocks)
+
+    text_format_time, expected = measure(text_format_parse, text, args.repeats)
+    parser_time, parsed = measure(lambda t: parse_text_proto(t, caffe_pb2.NetParameter()), text, args.repeats)
+    assert parsed.SerializeToString() == expected.SerializeToString(), 'Parsed messages differ'
+
+    print('{} layers, {:.1f} KB, {} protobuf implementation'.format(len(parsed.layer) + len(parsed.layers),
+                                                                    len(text) / 1024,
+                                                                    api_implementation.Type()))
+    print('{:<20}{:.3f} s'.format('text_format:', text_format_time))
+    print('{:<20}{:.3f} s, speedup {:.2f}x'.format('TextProtoParser:', parser_time, text_format_time / parser_time))
+
+
+if __name__ == '__main__':
+    main()
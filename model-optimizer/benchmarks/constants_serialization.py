@@ -0,0 +1,97 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Compares serialize_constants with the sequential serialization with SHA-512 hashes of all blobs on a synthetic graph
+with a part of blobs being duplicates. The resulting bin files are checked to be identical.
+
+$ python3 benchmarks/constants_serialization.py --blobs 300 --blob_size_mb 4 --duplicates 0.2
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.back.ie_ir_ver_2.emitter import serialize_constants, serialize_constants_recursively
+from mo.graph.graph import Graph
+
+
+def build_graph(num_blobs: int, blob_size: int, duplicates: float):
+    graph = Graph()
+    graph.add_node('op', kind='op', type='Op')
+    rng = np.random.default_rng(0)
+    unique = []
+    for i in range(num_blobs):
+        if unique and rng.random() < duplicates:
+            value = unique[rng.integers(len(unique))].copy()
+        else:
+            # most of the real weights have different shapes, some of them have the same
+            value = rng.random(blob_size // 4 - i % 8, dtype=np.float32)
+            unique.append(value)
+        name = 'w_{}'.format(i)
+        graph.add_node(name, kind='data', value=value, shape=np.array(value.shape, dtype=np.int64))
+        graph.add_edge(name, 'op', bin='weights')
+    return graph
+
+
+def legacy_serialize_constants(graph: Graph, bin_file_name: str):
+    with open(bin_file_name, 'wb') as bin_file:
+        serialize_constants_recursively(graph, bin_file, np.float32, {})
+
+
+def measure(func: callable, graph: Graph, bin_file_name: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(graph, bin_file_name)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blobs', type=int, default=300)
+    parser.add_argument('--blob_size_mb', type=float, default=4)
+    parser.add_argument('--duplicates', type=float, default=0.2, help='Probability of the blob to be a duplicate')
+    args = parser.parse_args()
+
+    blob_size = int(args.blob_size_mb * 2 ** 20)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_file, new_file = os.path.join(tmp_dir, 'legacy.bin'), os.path.join(tmp_dir, 'new.bin')
+        legacy_time, legacy_peak = measure(legacy_serialize_constants,
+                                           build_graph(args.blobs, blob_size, args.duplicates), legacy_file)
+        new_time, new_peak = measure(serialize_constants, build_graph(args.blobs, blob_size, args.duplicates),
+                                     new_file)
+        with open(legacy_file, 'rb') as legacy, open(new_file, 'rb') as new:
+            assert legacy.read() == new.read(), 'The bin files differ'
+        size = os.path.getsize(new_file)
+
+    print('{} blobs, bin file {:.1f} MB'.format(args.blobs, size / 2 ** 20))
+    print('{:<12}{:>10}{:>16}'.format('', 'time, s', 'peak mem, MB'))
+    print('{:<12}{:>10.2f}{:>16.1f}'.format('sequential', legacy_time, legacy_peak / 2 ** 20))
+    print('{:<12}{:>10.2f}{:>16.1f}'.format('parallel', new_time, new_peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
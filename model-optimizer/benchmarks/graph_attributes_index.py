@@ -0,0 +1,83 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Compares the indexed Graph.get_op_nodes with the linear scan over all the graph nodes on a synthetic graph. Every
+simulated transformation queries nodes with one operation type as most of the Model Optimizer transformations do.
+
+$ python3 benchmarks/graph_attributes_index.py --nodes 100000 --transformations 600
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.graph.graph import Graph, Node
+
+
+def build_chain(num_nodes: int, num_ops: int):
+    graph = Graph()
+    prev = None
+    for i in range(num_nodes // 2):
+        op_name = 'op_{}'.format(i)
+        graph.add_node(op_name, kind='op', op='Op{}'.format(i % num_ops), type='Op{}'.format(i % num_ops))
+        graph.add_node(op_name + '_d', kind='data', shape=None, value=None)
+        if prev is not None:
+            graph.add_edge(prev, op_name, **{'in': 0})
+        graph.add_edge(op_name, op_name + '_d', **{'out': 0})
+        prev = op_name + '_d'
+    return graph
+
+
+def scan_op_nodes(graph: Graph, **attrs):
+    attrs = dict(kind='op', **attrs)
+    return [Node(graph, n) for n, d in graph.nodes(data=True) if all(a in d.items() for a in attrs.items())]
+
+
+def measure(func: callable, graph: Graph, transformations: int, num_ops: int):
+    start = time.perf_counter()
+    found = 0
+    for i in range(transformations):
+        found += len(func(op='Op{}'.format(i % (2 * num_ops))))
+    return time.perf_counter() - start, found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nodes', type=int, default=100000)
+    parser.add_argument('--transformations', type=int, default=600)
+    parser.add_argument('--ops', type=int, default=150, help='Number of distinct operation types in the graph')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = build_chain(args.nodes, args.ops)
+    print('Graph with {} nodes is built in {:.2f} s'.format(graph.number_of_nodes(), time.perf_counter() - start))
+
+    scan_time, scan_found = measure(lambda **attrs: scan_op_nodes(graph, **attrs), graph, args.transformations,
+                                    args.ops)
+    index_time, index_found = measure(graph.get_op_nodes, graph, args.transformations, args.ops)
+    assert scan_found == index_found
+
+    print('Linear scan: {:.3f} s'.format(scan_time))
+    print('Index:       {:.3f} s'.format(index_time))
+    print('Speedup:     {:.1f}x'.format(scan_time / index_time))
+
+
+if __name__ == '__main__':
+    main()
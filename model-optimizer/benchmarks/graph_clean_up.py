@@ -0,0 +1,121 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Counts the graph clean-ups triggered by the model conversion and measures them. The conversion is run in the new
+process with the --full_clean_up option, so all clean-ups check all the nodes, and with the default incremental
+clean-ups. The resulting IRs are compared: the weights must be the same and the XML files may differ only by the
+numbers in the generated names as the full clean-up re-creates the Const operations with the new names.
+
+A synthetic ONNX model of convolutional blocks is converted by default, other models are converted with the Model
+Optimizer arguments given after "--", for example, the TensorFlow model:
+
+$ python3 benchmarks/graph_clean_up.py --blocks 50
+$ python3 benchmarks/graph_clean_up.py -- --input_model model.pb --input_shape [1,224,224,3]
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+MO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+RUN_SCRIPT = """
+import json, logging, sys, time
+import mo.graph.graph
+from mo.main import main
+from mo.utils.cli_parser import get_all_cli_parser
+
+stats = {{'clean_ups': 0, 'full': 0, 'clean_up_time': 0}}
+clean_up, mark_output_reachable_nodes = mo.graph.graph.Graph.clean_up, mo.graph.graph.mark_output_reachable_nodes
+
+def timed_clean_up(*args, **kwargs):
+    start = time.perf_counter()
+    clean_up(*args, **kwargs)
+    stats['clean_up_time'] += time.perf_counter() - start
+    stats['clean_ups'] += 1
+
+def counted_mark_output_reachable_nodes(graph):
+    stats['full'] += 1
+    mark_output_reachable_nodes(graph)
+
+mo.graph.graph.Graph.clean_up = timed_clean_up
+mo.graph.graph.mark_output_reachable_nodes = counted_mark_output_reachable_nodes
+sys.argv = ['mo.py'] + {args!r}
+start = time.perf_counter()
+try:
+    main(get_all_cli_parser(), None)
+finally:
+    stats['time'] = time.perf_counter() - start
+    with open({stats_file!r}, 'w') as f:
+        json.dump(stats, f)
+"""
+
+
+def convert(mo_args: list, output_dir: str, full: bool):
+    stats_file = os.path.join(output_dir, 'stats.json')
+    args = mo_args + ['--output_dir', output_dir, '--model_name', 'model'] + (['--full_clean_up'] if full else [])
+    subprocess.check_call([sys.executable, '-c', RUN_SCRIPT.format(args=args, stats_file=stats_file)], cwd=MO_ROOT,
+                          stdout=subprocess.DEVNULL)
+    with open(stats_file, 'r') as f:
+        stats = json.load(f)
+    print('{:<12} {} clean-ups ({} full) {:.3f} s, conversion {:.3f} s'.format(
+        'Full:' if full else 'Incremental:', stats['clean_ups'], stats['full'], stats['clean_up_time'],
+        stats['time']))
+
+
+def read_ir(output_dir: str):
+    with open(os.path.join(output_dir, 'model.xml'), 'r') as f:
+        xml = f.read()
+    # the meta data contains the command line parameters, the numbers in the names are generated
+    xml = re.sub(r'name="[^"]*"', lambda m: re.sub(r'\d+', '', m.group(0)), xml.split('<meta_data>')[0])
+    with open(os.path.join(output_dir, 'model.bin'), 'rb') as f:
+        return xml, f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=50, help='Number of blocks of the synthetic ONNX model')
+    parser.add_argument('mo_args', nargs=argparse.REMAINDER, help='Model Optimizer arguments after "--"')
+    args = parser.parse_args()
+    mo_args = args.mo_args[1:] if args.mo_args[:1] == ['--'] else args.mo_args
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if len(mo_args) == 0:
+            import onnx
+            from onnx_extraction import build_model
+            model_file = os.path.join(tmp_dir, 'model.onnx')
+            onnx.save(build_model(args.blocks), model_file)
+            mo_args = ['--input_model', model_file]
+
+        irs = []
+        for full in [True, False]:
+            output_dir = os.path.join(tmp_dir, 'full' if full else 'incremental')
+            convert(mo_args, output_dir, full)
+            irs.append(read_ir(output_dir))
+
+    assert irs[0][1] == irs[1][1], 'Weights differ'
+    assert irs[0][0] == irs[1][0], 'IRs differ'
+
+
+if __name__ == '__main__':
+    main()
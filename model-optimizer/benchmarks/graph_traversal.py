@@ -0,0 +1,214 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Measures the graph traversals used by the Model Optimizer on the synthetic graphs of the growing size: the
+pseudo-topological sort of the graph, the sort of the nodes before the IR emission, the BFS search and the sort of the
+transformations dependency graph. The legacy list-based and recursive implementations are measured for the graphs up
+to the --legacy_max_nodes size because they are quadratic. The orders of the nodes are compared between the
+implementations.
+
+$ python3 benchmarks/graph_traversal.py --max_nodes 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.graph.graph import Graph, Node
+from mo.graph.traversal import topological_order
+from mo.pipeline.common import determined_sort
+from mo.utils.class_registration import DependencyGraph
+from mo.utils.graph import bfs_search
+
+
+def legacy_dfs(graph: Graph, node_name: str, visited: set):
+    order = []
+    stack = [node_name]
+    while len(stack) != 0:
+        node_name = stack[0]
+        stack.pop(0)
+        visited.add(node_name)
+        has_child = False
+        for _, out_node_name in graph.out_edges(node_name):
+            if out_node_name not in visited:
+                stack.insert(0, node_name)
+                stack.insert(0, out_node_name)
+                has_child = True
+                break
+        if not has_child:
+            order.append(node_name)
+    return order
+
+
+def legacy_pseudo_topological_sort(graph: Graph):
+    nodes_without_inputs = list()
+    for node_name in graph.nodes():
+        if len(graph.in_edges(node_name)) == 0:
+            nodes_without_inputs.append(node_name)
+    order = list()
+    visited = set()
+    for node_name in nodes_without_inputs:
+        if node_name not in visited:
+            order.extend(legacy_dfs(graph, node_name, visited))
+    return list(reversed([Node(graph, node) for node in order]))
+
+
+def legacy_determined_sort(outputs: list):
+    op_order = []
+    data_order = []
+    stack = list(outputs)
+    visited = set()
+    while len(stack) != 0:
+        node = stack[0]
+        node_id = node.id
+        stack.pop(0)
+        visited.add(node_id)
+        has_child = False
+        in_names = [n.id if isinstance(node.in_nodes(), list) else node.in_node(n).id for n in node.in_nodes()]
+        for in_node_name in in_names:
+            if in_node_name not in visited:
+                stack.insert(0, node)
+                stack.insert(0, Node(node.graph, in_node_name))
+                has_child = True
+                break
+        if not has_child:
+            if node.kind == 'op':
+                op_order.append(node_id)
+            if node.kind == 'data':
+                data_order.append(node_id)
+    return op_order, data_order
+
+
+def legacy_bfs_search(graph: Graph):
+    result = list()
+    start_nodes = [node_name for node_name in graph.nodes() if len(graph.in_edges(node_name)) == 0]
+    visited = set(start_nodes)
+    d = deque(start_nodes)
+    while len(d) != 0:
+        cur_node_name = d.popleft()
+        result.append(cur_node_name)
+        for src_node, dst_node in graph.out_edges(cur_node_name):
+            if dst_node not in visited:
+                d.append(dst_node)
+                visited.add(dst_node)
+    return result
+
+
+def legacy_dependency_sort(graph: DependencyGraph):
+    def sort_util(v, visited, stack):
+        visited.append(v)
+        for i in sorted([child for _, child in graph.out_edges(v)], key=lambda x: x.__name__):
+            if i not in visited:
+                sort_util(i, visited, stack)
+        stack.insert(0, v)
+
+    transforms = sorted([cls for cls in graph.nodes() if len(graph.in_edges(cls)) == 0], key=lambda x: x.__name__)
+    order, visited = [], []
+    for transform in transforms:
+        sort_util(transform, visited, order)
+    return order
+
+
+def dependency_sort(graph: DependencyGraph):
+    transforms = sorted([cls for cls, in_degree in graph.in_degree() if in_degree == 0], key=lambda x: x.__name__)
+    return topological_order(transforms, graph.sorted_children)
+
+
+def build_model_graph(num_nodes: int):
+    """
+    Builds the deep graph of the model with the op and data nodes: Parameter followed by the blocks of the Convolution
+    and the Add with the residual connection, four nodes per block.
+    """
+    graph = Graph()
+    graph.add_node('input', kind='op', op='Parameter')
+    graph.add_node('input_data', kind='data')
+    graph.add_edge('input', 'input_data', out=0)
+    prev = 'input_data'
+    for i in range((num_nodes - 4) // 4):
+        conv, add = 'conv_{}'.format(i), 'add_{}'.format(i)
+        graph.add_nodes_from([(conv, {'kind': 'op', 'op': 'Convolution'}), (conv + '_data', {'kind': 'data'}),
+                              (add, {'kind': 'op', 'op': 'Add'}), (add + '_data', {'kind': 'data'})])
+        graph.add_edges_from([(prev, conv, {'in': 0}), (conv, conv + '_data', {'out': 0}),
+                              (conv + '_data', add, {'in': 0}), (prev, add, {'in': 1}),
+                              (add, add + '_data', {'out': 0})])
+        prev = add + '_data'
+    graph.add_node('output', kind='op', op='Result')
+    graph.add_edge(prev, 'output', **{'in': 0})
+    return graph
+
+
+def build_dependency_graph(num_nodes: int):
+    """
+    Builds the graph of the transformations where every transformation runs after two previous ones
+    """
+    classes = [type('Transform{}'.format(i), (), {}) for i in range(num_nodes)]
+    graph = DependencyGraph()
+    graph.add_nodes_from(classes)
+    graph.add_edges_from((classes[(i - 1) // k], classes[i]) for i in range(1, num_nodes) for k in [2, 3])
+    return graph
+
+
+def measure(func, *args):
+    # the garbage of the graph building is not collected during the measurement
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--max_nodes', type=int, default=1000000)
+    parser.add_argument('--legacy_max_nodes', type=int, default=20000)
+    args = parser.parse_args()
+
+    sizes = []
+    num_nodes = 1000
+    while num_nodes <= args.max_nodes:
+        sizes.append(num_nodes)
+        num_nodes *= 10
+
+    benchmarks = [
+        ('pseudo_topological_sort', build_model_graph, lambda g: [n.id for n in legacy_pseudo_topological_sort(g)],
+         lambda g: [n.id for n in g.pseudo_topological_sort()]),
+        ('determined_sort', build_model_graph, lambda g: legacy_determined_sort([Node(g, 'output')]),
+         lambda g: determined_sort([Node(g, 'output')])),
+        ('bfs_search', build_model_graph, legacy_bfs_search, bfs_search),
+        ('DependencyGraph sort', build_dependency_graph, legacy_dependency_sort, dependency_sort),
+    ]
+    print('{:<24}{:>10}{:>12}{:>12}'.format('', 'nodes', 'legacy, s', 'new, s'))
+    for title, build, legacy_func, func in benchmarks:
+        for num_nodes in sizes:
+            graph = build(num_nodes)
+            new_time, order = measure(func, graph)
+            legacy_time = None
+            if num_nodes <= args.legacy_max_nodes:
+                legacy_time, legacy_order = measure(legacy_func, graph)
+                assert order == legacy_order, 'Order of {} differs'.format(title)
+            print('{:<24}{:>10}{:>12}{:>12.3f}'.format(title, graph.number_of_nodes(),
+                                                       '-' if legacy_time is None else '{:.3f}'.format(legacy_time),
+                                                       new_time))
+            del graph
+
+
+if __name__ == '__main__':
+    main()
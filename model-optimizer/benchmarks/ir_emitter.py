@@ -0,0 +1,104 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Compares the time and the peak memory of the streaming generate_ie_ir with the previous implementation which built
+the whole ElementTree and pretty printed it with minidom. The peak memory is measured with tracemalloc, so it
+includes only allocations made by Python. The outputs of both implementations are checked to be identical.
+
+$ python3 benchmarks/ir_emitter.py --layers 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from xml.etree.ElementTree import Element, tostring
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from defusedxml.minidom import parseString
+
+from mo.back.ie_ir_ver_2.emitter import generate_ie_ir, serialize_network, add_quantization_statistics, \
+    add_meta_data, add_quantization_info_section
+from mo.graph.graph import Graph
+
+layer_schema = [('layer', [('id', lambda node: node.node), 'name', 'type', 'version'], [
+    ('data', ['axis', 'pads_begin', 'pads_end', 'auto_pad'], []),
+    ('output', [], [('port', [('id', lambda node: 0), ('precision', lambda node: 'FP32')], [
+        ('dim', [], []), ]), ]),
+])]
+
+
+def build_graph(num_layers: int):
+    graph = Graph()
+    graph.name = 'model'
+    graph.graph['ir_version'] = 10
+    for i in range(num_layers):
+        graph.add_node('op_{:08}'.format(i), kind='op', name='layer/name_{}'.format(i), type='Convolution',
+                       version='opset1', axis=i % 4, pads_begin='0,0', pads_end='1,1', auto_pad='explicit',
+                       IE=layer_schema)
+    return graph
+
+
+def legacy_generate_ie_ir(graph: Graph, file_name: str, meta_info: dict):
+    net = Element('net')
+    net.set('name', graph.name)
+    net.set('version', str((graph.graph['ir_version'])))
+    serialize_network(graph, net, set())
+    add_quantization_statistics(graph, net)
+    add_meta_data(net, meta_info)
+    add_quantization_info_section(net, meta_info)
+    pretty_xml_as_string = parseString(tostring(net)).toprettyxml()
+    with open(file_name, 'wb') as file:
+        file.write(bytes(pretty_xml_as_string, "UTF-8"))
+
+
+def measure(func: callable, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--layers', type=int, default=100000)
+    args = parser.parse_args()
+
+    graph = build_graph(args.layers)
+    meta_info = {'input_model': 'model.onnx', 'unset': []}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_file, streaming_file = os.path.join(tmp_dir, 'legacy.xml'), os.path.join(tmp_dir, 'streaming.xml')
+        legacy_time, legacy_peak = measure(legacy_generate_ie_ir, graph, legacy_file, meta_info)
+        streaming_time, streaming_peak = measure(generate_ie_ir, graph, streaming_file, (), (), (), meta_info)
+        with open(legacy_file, 'rb') as legacy, open(streaming_file, 'rb') as streaming:
+            assert legacy.read() == streaming.read(), 'The streaming writer output differs from the minidom one'
+        size = os.path.getsize(streaming_file)
+
+    print('IR XML with {} layers, {:.1f} MB'.format(args.layers, size / 2 ** 20))
+    print('{:<12}{:>10}{:>16}'.format('', 'time, s', 'peak mem, MB'))
+    print('{:<12}{:>10.2f}{:>16.1f}'.format('minidom', legacy_time, legacy_peak / 2 ** 20))
+    print('{:<12}{:>10.2f}{:>16.1f}'.format('streaming', streaming_time, streaming_peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
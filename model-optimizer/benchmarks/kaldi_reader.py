@@ -0,0 +1,95 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Compares tokenizing of a synthetic Kaldi model read with the buffered file object and with the memory-mapped reader.
+Every component is found with find_end_of_component, its region is taken with get_parameters and the weights
+matrix is read from the region, the same way the Kaldi loader does.
+
+$ python3 benchmarks/kaldi_reader.py --components 200 --weights 256
+"""
+
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.front.kaldi.loader.utils import find_next_tag, find_end_of_component, get_parameters, open_kaldi_model, \
+    collect_until_token
+from mo.front.kaldi.utils import read_binary_matrix
+
+
+def write_model(path: str, num_components: int, weights: int):
+    matrix = np.random.default_rng(0).random((weights, weights), dtype=np.float32)
+    with open(path, 'wb') as f:
+        f.write(b'<Nnet> ')
+        for _ in range(num_components):
+            f.write(b'<AffineTransform> <LearnRateCoef> \x04' + struct.pack('f', 1.0) + b' <Weights> FM ' +
+                    b'\x04' + struct.pack('I', weights) + b'\x04' + struct.pack('I', weights) + matrix.tobytes() +
+                    b'<!EndOfComponent> ')
+        f.write(b'</Nnet> ')
+
+
+def tokenize(file_desc):
+    assert find_next_tag(file_desc) == '<Nnet>'
+    weights_sum = 0.0
+    while True:
+        tag = find_next_tag(file_desc)
+        if tag == '</Nnet>':
+            return weights_sum
+        if tag == '<!EndOfComponent>':
+            continue
+        start_index = file_desc.tell()
+        end_tag, end_index = find_end_of_component(file_desc, 'affinetransform')
+        pb = get_parameters(file_desc, start_index, end_index - len(end_tag))
+        collect_until_token(pb, b'<Weights>')
+        weights, _ = read_binary_matrix(pb)
+        weights_sum += weights[0]
+
+
+def measure(open_func: callable, path: str):
+    start = time.perf_counter()
+    result = tokenize(open_func(path))
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--components', type=int, default=200)
+    parser.add_argument('--weights', type=int, default=256, help='Size of the square weights matrix')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'model.nnet')
+        write_model(path, args.components, args.weights)
+        print('Model size: {:.1f} MB'.format(os.path.getsize(path) / 2 ** 20))
+        file_time, file_result = measure(lambda p: open(p, 'rb'), path)
+        mapped_time, mapped_result = measure(open_kaldi_model, path)
+        assert file_result == mapped_result
+
+    print('File reader:   {:.3f} s'.format(file_time))
+    print('Mapped reader: {:.3f} s'.format(mapped_time))
+    print('Speedup:       {:.1f}x'.format(file_time / mapped_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Measures the hot Node accessors used by almost every transformation: in_nodes, out_nodes, get_inputs and get_outputs.
+Every accessor is called for every operation node of a synthetic graph and compared with the implementation reading
+edges from the networkx adjacency views on every call.
+
+$ python3 benchmarks/node_accessors.py --nodes 20000 --repeats 5
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.graph.graph import Graph, Node
+
+
+def build_graph(num_nodes: int):
+    graph = Graph()
+    prev = None
+    for i in range(num_nodes // 2):
+        op_name = 'op_{}'.format(i)
+        graph.add_node(op_name, kind='op', op='Op', type='Op')
+        graph.add_node(op_name + '_d', kind='data', shape=None, value=None)
+        if prev is not None:
+            graph.add_edge(prev, op_name, **{'in': 0})
+            # every second operation has two inputs
+            if i % 2:
+                graph.add_edge(prev, op_name, **{'in': 1})
+        graph.add_edge(op_name, op_name + '_d', **{'out': 0})
+        prev = op_name + '_d'
+    graph.stage = 'middle'
+    return graph
+
+
+def legacy_get_inputs(node: Node, control_flow: bool = False):
+    in_edges = node.graph.in_edges(node.id, data=True)
+    if not control_flow:
+        in_edges = [(u, v, d) for u, v, d in in_edges if 'control_flow_edge' not in d or not d['control_flow_edge']]
+    return [(u, d) for u, v, d in in_edges]
+
+
+def legacy_get_outputs(node: Node, control_flow: bool = False):
+    out_edges = node.graph.out_edges(node.id, data=True)
+    if not control_flow:
+        out_edges = [(u, v, d) for u, v, d in out_edges if 'control_flow_edge' not in d or not d['control_flow_edge']]
+    return [(v, d) for u, v, d in out_edges]
+
+
+def legacy_in_nodes(node: Node):
+    assert node.has('kind')
+    assert node.kind in ['op', 'data']
+    return collections.OrderedDict(sorted({d['in']: Node(node.graph, n) for n, d in legacy_get_inputs(node)}.items(),
+                                          key=lambda t: t[0]))
+
+
+def legacy_out_nodes(node: Node):
+    assert node.has('kind')
+    assert node.kind in ['op', 'data']
+    return collections.OrderedDict(sorted({d['out']: Node(node.graph, n) for n, d in legacy_get_outputs(node)}.items(),
+                                          key=lambda t: t[0]))
+
+
+# accessor name -> (implementation before the edges cache, current implementation)
+ACCESSORS = {
+    'in_nodes': (legacy_in_nodes, lambda node: node.in_nodes()),
+    'out_nodes': (legacy_out_nodes, lambda node: node.out_nodes()),
+    'get_inputs': (legacy_get_inputs, lambda node: node.get_inputs()),
+    'get_outputs': (legacy_get_outputs, lambda node: node.get_outputs()),
+}
+
+
+def measure(nodes: list, accessor: callable, repeats: int):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for node in nodes:
+            accessor(node)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nodes', type=int, default=20000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    graph = build_graph(args.nodes)
+    ops = [Node(graph, n) for n in graph.nodes() if graph.node[n]['kind'] == 'op']
+    calls = len(ops) * args.repeats
+    print('{:<12}{:>14}{:>14}{:>10}'.format('accessor', 'legacy, us', 'current, us', 'speedup'))
+    for name, (legacy, current) in ACCESSORS.items():
+        for node in ops[:100]:
+            assert legacy(node) == current(node)
+        legacy_time = measure(ops, legacy, args.repeats)
+        current_time = measure(ops, current, args.repeats)
+        print('{:<12}{:>14.2f}{:>14.2f}{:>9.1f}x'.format(name, legacy_time / calls * 1e6, current_time / calls * 1e6,
+                                                         legacy_time / current_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Measures extract_node_attrs on a synthetic ONNX graph of convolutional blocks. The extraction with the attributes index
+built once per node and the extractors checked for duplicates once is compared with the search of the attribute in the
+protobuf message on every onnx_attr call and the check of the extractors for every node. The extraction with the cache
+of the attributes extracted for the nodes with the same definition is measured as well and its result is compared with
+the extraction without the cache.
+
+$ python3 benchmarks/onnx_extraction.py --blocks 2000 --repeats 3
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import logging as log
+
+import numpy as np
+from onnx import helper, numpy_helper, TensorProto
+
+from mo.front.common.register_custom_ops import check_for_duplicates, update_extractors_with_extensions
+from mo.front.extractor import extract_node_attrs
+from mo.front.onnx.extractor import onnx_extraction_key, onnx_op_extractor, onnx_op_extractors
+from mo.front.onnx.extractors import utils
+from mo.front.onnx.loader import protobuf2nx
+from mo.front.onnx.register_custom_ops import get_front_classes
+from mo.graph.graph import Graph
+from mo.utils import import_extensions
+
+
+def build_model(num_blocks: int):
+    nodes, initializers = [], []
+    prev = 'input'
+    for i in range(num_blocks):
+        name = 'block_{}'.format(i)
+        initializers.append(numpy_helper.from_array(np.ones([4, 4, 3, 3], dtype=np.float32), name + '/weights'))
+        nodes.append(helper.make_node('Conv', [prev, name + '/weights'], [name + '/conv'], name=name + '/conv',
+                                      kernel_shape=[3, 3], pads=[1, 1, 1, 1], strides=[1, 1], dilations=[1, 1],
+                                      group=1))
+        nodes.append(helper.make_node('LeakyRelu', [name + '/conv'], [name + '/relu'], name=name + '/relu',
+                                      alpha=0.1))
+        nodes.append(helper.make_node('MaxPool', [name + '/relu'], [name + '/pool'], name=name + '/pool',
+                                      kernel_shape=[3, 3], pads=[1, 1, 1, 1], strides=[1, 1], auto_pad='NOTSET',
+                                      storage_order=0))
+        nodes.append(helper.make_node('Transpose', [name + '/pool'], [name + '/transpose'], name=name + '/transpose',
+                                      perm=[0, 1, 3, 2]))
+        prev = name + '/transpose'
+    graph = helper.make_graph(nodes, 'benchmark', [helper.make_tensor_value_info('input', TensorProto.FLOAT,
+                                                                               [1, 4, 16, 16])],
+                              [helper.make_tensor_value_info(prev, TensorProto.FLOAT, [1, 4, 16, 16])], initializers)
+    return helper.make_model(graph, opset_imports=[helper.make_opsetid('', 11)])
+
+
+def search_attrs_index(node):
+    # the attributes of the protobuf message are searched on every call
+    index = {}
+    for a in node.pb.attribute:
+        index.setdefault(a.name, []).append(a)
+    return index
+
+
+def measure(model, repeats: int, check_once: bool, cache: bool = False):
+    best, graph = None, None
+    for _ in range(repeats):
+        graph = Graph()
+        graph.graph['fw_opset_version'] = 11
+        protobuf2nx(graph, model)
+        start = time.perf_counter()
+        if cache:
+            extractors = check_for_duplicates(onnx_op_extractors)
+            extract_node_attrs(graph, lambda node: onnx_op_extractor(node, extractors),
+                               lambda node: onnx_extraction_key(node, extractors))
+        elif check_once:
+            extractors = check_for_duplicates(onnx_op_extractors)
+            extract_node_attrs(graph, lambda node: onnx_op_extractor(node, extractors))
+        else:
+            extract_node_attrs(graph, lambda node: onnx_op_extractor(node, check_for_duplicates(onnx_op_extractors)))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, graph
+
+
+def cache_hit_rate(model):
+    graph = Graph()
+    protobuf2nx(graph, model)
+    extractors = check_for_duplicates(onnx_op_extractors)
+    keys = [onnx_extraction_key(node, extractors) for node in graph.get_op_nodes()]
+    keys = [key for key in keys if key is not None]
+    return (len(keys) - len(set(keys))) / len(keys) if keys else 0.0
+
+
+def attrs_summary(graph: Graph):
+    # the functions and the protobuf messages are not compared
+    return {node.id: {key: re.sub(' at 0x[0-9a-f]+', '', str(value)) for key, value in node.graph.node[node.id].items()
+                      if not callable(value) and key not in ['pb', 'pb_init', 'pb_attrs']}
+            for node in graph.get_op_nodes()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=2000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    log.disable(log.WARNING)
+    import_extensions.load_dirs('onnx', [], get_front_classes)
+    update_extractors_with_extensions(onnx_op_extractors)
+    model = build_model(args.blocks)
+
+    indexed_attrs = utils.onnx_attrs_index
+    utils.onnx_attrs_index = search_attrs_index
+    legacy_time, _ = measure(model, args.repeats, check_once=False)
+    search_time, _ = measure(model, args.repeats, check_once=True)
+    utils.onnx_attrs_index = indexed_attrs
+    index_time, graph = measure(model, args.repeats, check_once=True)
+    cache_time, cached_graph = measure(model, args.repeats, check_once=True, cache=True)
+    assert attrs_summary(graph) == attrs_summary(cached_graph), 'Cached attributes differ'
+
+    print('{} nodes'.format(len(model.graph.node)))
+    print('{:<52}{:.3f} s'.format('attributes search, duplicates check per node:', legacy_time))
+    print('{:<52}{:.3f} s'.format('attributes search, duplicates check once:', search_time))
+    print('{:<52}{:.3f} s, speedup {:.2f}x'.format('attributes index, duplicates check once:', index_time,
+                                                   legacy_time / index_time))
+    print('{:<52}{:.3f} s, speedup {:.2f}x, hit rate {:.1%}'.format('attributes index, extraction cache:', cache_time,
+                                                                    legacy_time / cache_time,
+                                                                    cache_hit_rate(model)))
+
+
+if __name__ == '__main__':
+    main()
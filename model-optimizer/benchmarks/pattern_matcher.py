@@ -0,0 +1,92 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Compares find_pattern_matches with the generic networkx VF2 matcher on a synthetic middle phase graph built of
+repeated Conv -> Add -> ReLU blocks with a Mul -> Add pattern which is found in a part of blocks.
+
+$ python3 benchmarks/pattern_matcher.py --blocks 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.graph.graph import Graph
+from mo.middle.pattern_match import find_pattern_matches, build_matcher
+
+
+def build_blocks(num_blocks: int):
+    graph = Graph()
+    prev = 'input_d'
+    graph.add_node('input', kind='op', op='Parameter')
+    graph.add_node(prev, kind='data', value=None)
+    graph.add_edge('input', prev, out=0)
+    for i in range(num_blocks):
+        ops = ['Convolution', 'Add', 'ReLU'] if i % 10 else ['Mul', 'Add', 'ReLU']
+        for op in ops:
+            name = '{}_{}'.format(op, i)
+            graph.add_node(name, kind='op', op=op)
+            graph.add_node(name + '_w', kind='op', op='Const')
+            graph.add_node(name + '_wd', kind='data', value=0)
+            graph.add_node(name + '_d', kind='data', value=None)
+            graph.add_edge(name + '_w', name + '_wd', out=0)
+            graph.add_edge(prev, name, **{'in': 0})
+            graph.add_edge(name + '_wd', name, **{'in': 1})
+            graph.add_edge(name, name + '_d', out=0)
+            prev = name + '_d'
+    return graph
+
+
+PATTERN = dict(
+    nodes=[('mul', dict(kind='op', op='Mul')),
+           ('mul_d', dict(kind='data')),
+           ('add', dict(kind='op', op='Add')),
+           ('const_d', dict(kind='data'))],
+    edges=[('mul', 'mul_d'), ('mul_d', 'add', {'in': 0}), ('const_d', 'add', {'in': 1})])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=5000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    graph = build_blocks(args.blocks)
+    print('Graph with {} nodes'.format(graph.number_of_nodes()))
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        vf2 = list(build_matcher(graph, **PATTERN).subgraph_isomorphisms_iter())
+    vf2_time = (time.perf_counter() - start) / args.repeats
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        matches = list(find_pattern_matches(graph, **PATTERN))
+    matcher_time = (time.perf_counter() - start) / args.repeats
+
+    assert sorted(sorted(m.items()) for m in vf2) == sorted(sorted(m.items()) for m in matches)
+    print('Matches: {}'.format(len(matches)))
+    print('VF2:                  {:.4f} s per pattern'.format(vf2_time))
+    print('find_pattern_matches: {:.4f} s per pattern'.format(matcher_time))
+    print('Speedup:              {:.1f}x'.format(vf2_time / matcher_time))
+
+
+if __name__ == '__main__':
+    main()
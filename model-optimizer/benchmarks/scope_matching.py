@@ -0,0 +1,111 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Measures the matching of the sub-graphs by scope for the replacement configuration with many instances, similar to
+the Object Detection API configurations, on the synthetic graph with TensorFlow-like node names. The matching with
+the regular expression checked for all nodes of the graph is compared with the matching using the scope index.
+
+$ python3 benchmarks/scope_matching.py --blocks 2000 --instances 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mo.front.subgraph_matcher import SubgraphMatcher
+from mo.graph.graph import Graph, IndexedNodesDict
+from mo.utils.custom_replacement_config import CustomReplacementDescriptor
+
+MAP_NODES = ['Shape', 'TensorArrayUnstack/Shape', 'TensorArrayUnstack/TensorArrayScatter/TensorArrayScatterV3',
+             'while/Enter', 'while/Merge', 'while/Switch', 'while/Identity', 'while/body/op', 'while/Exit']
+
+
+def build_graph(num_blocks: int, num_instances: int):
+    graph = Graph()
+    graph.add_node('image_tensor')
+    for name in MAP_NODES:
+        graph.add_node('Preprocessor/map/' + name)
+    for i in range(num_blocks):
+        scope = 'FeatureExtractor/block_{}/'.format(i)
+        for name in ['conv/weights', 'conv/Conv2D', 'bn/FusedBatchNorm', 'Relu6', 'depthwise/weights', 'depthwise']:
+            graph.add_node(scope + name)
+    for i in range(num_instances):
+        for name in MAP_NODES:
+            graph.add_node('SecondStageBoxPredictor/map_{}/{}'.format(i, name))
+    return graph
+
+
+def descriptors(num_instances: int):
+    inputs = [[{'node': 'Shape$', 'port': 0}, {'node': 'TensorArrayUnstack/Shape$', 'port': 0}],
+              [{'node': 'TensorArrayUnstack/TensorArrayScatter/TensorArrayScatterV3$', 'port': 2}]]
+    outputs = [{'node': 'while/Exit$', 'port': 0}]
+    return [
+        CustomReplacementDescriptor.create_instance('scope', 'Preprocessor', {
+            'match_kind': 'scope', 'instances': ['.*Preprocessor/map/'], 'inputs': inputs, 'outputs': outputs}),
+        CustomReplacementDescriptor.create_instance('scope', 'BoxPredictor', {
+            'match_kind': 'scope',
+            'instances': ['SecondStageBoxPredictor/map_{}/'.format(i) for i in range(num_instances)],
+            'inputs': inputs, 'outputs': outputs}),
+    ]
+
+
+def match_all(graph: Graph, replacement_descriptors: list):
+    result = []
+    for desc in replacement_descriptors:
+        for match in SubgraphMatcher(desc).matched_sub_graph_instances(graph):
+            result.append((match.scope, sorted(match.matched_nodes_names()),
+                           [node.id for port in range(match.inputs_count()) for node, _ in match.input_nodes(port)],
+                           match.output_node(0)[0].id))
+    return result
+
+
+def measure(graph: Graph, replacement_descriptors: list, repeats: int):
+    best, result = None, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = match_all(graph, replacement_descriptors)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=2000)
+    parser.add_argument('--instances', type=int, default=50)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    graph = build_graph(args.blocks, args.instances)
+    replacement_descriptors = descriptors(args.instances)
+
+    with patch.object(IndexedNodesDict, 'name_candidates', lambda self, pattern: None):
+        scan_time, scan_result = measure(graph, replacement_descriptors, args.repeats)
+    index_time, index_result = measure(graph, replacement_descriptors, args.repeats)
+    assert scan_result == index_result, 'Matched sub-graphs differ'
+
+    print('{} nodes, {} matched sub-graphs'.format(graph.number_of_nodes(), len(index_result)))
+    print('{:<18}{:.3f} s'.format('regex scan:', scan_time))
+    print('{:<18}{:.3f} s, speedup {:.1f}x'.format('scope index:', index_time, scan_time / index_time))
+
+
+if __name__ == '__main__':
+    main()
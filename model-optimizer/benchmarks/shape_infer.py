@@ -0,0 +1,126 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+
+"""
+Measures partial_infer without and with the memoization of the infer function results on a synthetic graph built of
+repeated MatMul -> Add -> ReLU -> Softmax -> MaxPool blocks. The attributes of all nodes and edges after the inference
+are compared between the runs.
+
+$ python3 benchmarks/shape_infer.py --blocks 2000 --repeats 3
+"""
+
+import argparse
+import logging as log
+import os
+import sys
+import time
+from argparse import Namespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from extensions.front.create_tensor_nodes import CreateTensorNodes
+from extensions.ops.MatMul import MatMul
+from extensions.ops.activation_ops import ReLU
+from extensions.ops.elementwise import Add
+from extensions.ops.parameter import Parameter
+from mo.front.common.partial_infer.utils import int64_array
+from mo.front.onnx.register_custom_ops import get_front_classes
+from mo.graph.graph import Graph
+from mo.middle.passes.infer import partial_infer, hashable_attrs
+from mo.ops.pooling import Pooling
+from mo.ops.result import Result
+from mo.ops.softmax import Softmax
+from mo.utils import import_extensions
+
+
+def build_graph(num_blocks: int, memoize: bool):
+    graph = Graph()
+    graph.graph['cmd_params'] = Namespace(memoize_shape_infer=memoize)
+    graph.graph['layout'] = 'NCHW'
+    graph.graph['ir_version'] = 10
+    prev = Parameter(graph, {'name': 'input', 'shape': int64_array([1, 8, 32, 32])}).create_node()
+    for i in range(num_blocks):
+        name = 'block_{}'.format(i)
+        matmul = MatMul(graph, {'name': name + '/matmul'}).create_node([prev, prev])
+        add = Add(graph, {'name': name + '/add'}).create_node([matmul, prev])
+        relu = ReLU(graph, {'name': name + '/relu'}).create_node([add])
+        softmax = Softmax(graph, {'name': name + '/softmax', 'axis': -1}).create_node([relu])
+        prev = Pooling(graph, {'name': name + '/pool', 'window': int64_array([1, 1, 3, 3]),
+                               'stride': int64_array([1, 1, 1, 1]), 'pad': int64_array([[0, 0], [0, 0], [1, 1], [1, 1]]),
+                               'pad_spatial_shape': int64_array([[1, 1], [1, 1]]), 'pool_method': 'max',
+                               'exclude_pad': False, 'spatial_dims': int64_array([2, 3]), 'output_spatial_shape': None,
+                               'rounding_type': 'floor'}).create_node([softmax])
+    Result(graph, {'name': 'output'}).create_node([prev])
+    CreateTensorNodes().find_and_replace_pattern(graph)
+    return graph
+
+
+def measure(num_blocks: int, repeats: int, memoize: bool):
+    best, graph = None, None
+    for _ in range(repeats):
+        graph = build_graph(num_blocks, memoize)
+        start = time.perf_counter()
+        partial_infer(graph)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, graph
+
+
+def graph_summary(graph: Graph):
+    return {'nodes': {node: hashable_attrs(attrs) for node, attrs in graph.nodes(data=True)},
+            'edges': {(u, v, k): hashable_attrs(attrs) for u, v, k, attrs in graph.edges(keys=True, data=True)}}
+
+
+class HitRateHandler(log.Handler):
+    def __init__(self):
+        super().__init__(log.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        if record.getMessage().startswith('Infer cache'):
+            self.messages.append(record.getMessage())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--blocks', type=int, default=2000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    log.disable(log.WARNING)
+    # the operations are registered to check if their infer functions may be cached
+    import_extensions.load_dirs('onnx', [], get_front_classes)
+
+    # the hit rate is reported to the debug log which is not collected while the inference is measured
+    handler = HitRateHandler()
+    log.getLogger().handlers = [handler]
+    log.getLogger().setLevel(log.DEBUG)
+
+    no_cache_time, graph = measure(args.blocks, args.repeats, memoize=False)
+    cache_time, cached_graph = measure(args.blocks, args.repeats, memoize=True)
+    assert graph_summary(graph) == graph_summary(cached_graph), 'Inferred attributes differ'
+
+    log.disable(log.NOTSET)
+    partial_infer(build_graph(args.blocks, memoize=True))
+
+    print('{} nodes, {}'.format(graph.number_of_nodes(), handler.messages[-1]))
+    print('{:<22}{:.3f} s'.format('without memoization:', no_cache_time))
+    print('{:<22}{:.3f} s, speedup {:.2f}x'.format('with memoization:', cache_time, no_cache_time / cache_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Measures the start of the Model Optimizer: import of mo.main, loading of the extensions and ordering of the
+transformations. Every run is done in the new process without and with the extensions manifest. The transformations
+order and the extractors available for the loader are compared between the runs.
+
+$ python3 benchmarks/startup.py --framework onnx --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+MO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+RUN_SCRIPT = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+start = time.perf_counter()
+import mo.main
+from mo.utils import import_extensions
+from mo.utils.class_registration import ClassType, get_replacers_order
+from mo.front.{framework}.register_custom_ops import get_front_classes
+imported = time.perf_counter()
+import_extensions.load_dirs('{framework}', [], get_front_classes, {manifest_dir!r})
+loaded = time.perf_counter()
+order = get_replacers_order([ClassType.LOADER, ClassType.FRONT_REPLACER, ClassType.MIDDLE_REPLACER,
+                             ClassType.BACK_REPLACER])
+ordered = time.perf_counter()
+from mo.front.common.register_custom_ops import update_extractors_with_extensions
+extractors = {{}}
+update_extractors_with_extensions(extractors)
+json.dump({{'import': imported - start, 'load': loaded - imported, 'order': ordered - loaded,
+           'replacers': [str(c) for c in order if getattr(c, 'enabled', None) is not False],
+           'extractors': sorted(extractors), 'modules': len(sys.modules)}}, sys.stdout)
+"""
+
+
+def run(framework: str, manifest_dir: str = None):
+    output = subprocess.check_output([sys.executable, '-c', RUN_SCRIPT.format(framework=framework,
+                                                                              manifest_dir=manifest_dir)],
+                                     cwd=MO_ROOT)
+    return json.loads(output)
+
+
+def report(title: str, results: list):
+    best = min(results, key=lambda r: r['import'] + r['load'] + r['order'])
+    print('{:<20} import {:.3f} s, load {:.3f} s, order {:.3f} s, total {:.3f} s, {} modules'.format(
+        title, best['import'], best['load'], best['order'], best['import'] + best['load'] + best['order'],
+        best['modules']))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--framework', default='onnx', choices=['onnx', 'caffe', 'kaldi', 'mxnet', 'tf'])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as manifest_dir:
+        without_manifest = report('Without manifest:', [run(args.framework) for _ in range(args.runs)])
+        build = report('Building manifest:', [run(args.framework, manifest_dir)])
+        with_manifest = report('With manifest:', [run(args.framework, manifest_dir) for _ in range(args.runs)])
+
+    for result in [build, with_manifest]:
+        assert result['replacers'] == without_manifest['replacers'], 'Transformations order differs'
+        assert result['extractors'] == without_manifest['extractors'], 'Extractors differ'
+
+
+if __name__ == '__main__':
+    main()
@@ -100,7 +100,8 @@ class CreateConstNodesReplacement(BackReplacementPattern):
                 const_node.add_input_port(0)
                 graph.add_edges_from([(const_node_name, node.id, {'out': 0})])
 
-                node_copy = node.copy_node()
+                # the copy shares the blob with the original data node, so the blob is not copied before serialization
+                node_copy = node.copy_node({'value': node.value})
                 const_node.type_infer(const_node)
                 graph.add_edges_from([(node_copy.id, const_node_name, {'in': 0, 'bin': 'custom'})])
             elif not self._check_that_node_from_body(node):
@@ -13,21 +13,20 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
-from onnx import numpy_helper
-from onnx.numpy_helper import to_array
-
 from mo.front.extractor import FrontExtractorOp
 from mo.front.onnx.extractors.utils import onnx_attr
+from mo.front.onnx.loader import tensor_to_array
 from mo.ops.const import Const
 
 
 class ConstExtractor(FrontExtractorOp):
     op = 'Const'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, node):
-        value = to_array(node.pb_init)
+        value = tensor_to_array(node.pb_init, node.graph.graph.get('onnx_external_data'))
         attrs = {
             'data_type': value.dtype,
             'value': value
@@ -39,11 +38,12 @@ class ConstExtractor(FrontExtractorOp):
 class ConstantExtractor(FrontExtractorOp):
     op = 'Constant'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, node):
         pb_value = onnx_attr(node, 'value', 't')
-        value = numpy_helper.to_array(pb_value)
+        value = tensor_to_array(pb_value, node.graph.graph.get('onnx_external_data'))
 
         attrs = {
             'data_type': value.dtype,
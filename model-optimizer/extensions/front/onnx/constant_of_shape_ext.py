@@ -14,10 +14,10 @@
  limitations under the License.
 """
 import numpy as np
-from onnx import numpy_helper
 
 from mo.front.extractor import FrontExtractorOp
 from mo.front.onnx.extractors.utils import onnx_attr
+from mo.front.onnx.loader import tensor_to_array
 from mo.ops.constant_of_shape import ConstantOfShape
 
 
@@ -27,7 +27,8 @@ class ConstantOfShapeExtractor(FrontExtractorOp):
 
     @classmethod
     def extract(cls, node):
-        fill_value = onnx_attr(node, 'value', 't', default=np.array([0.0]), dst_type=lambda x: numpy_helper.to_array(x))
+        fill_value = onnx_attr(node, 'value', 't', default=np.array([0.0]),
+                               dst_type=lambda x: tensor_to_array(x, node.graph.graph.get('onnx_external_data')))
 
         ConstantOfShape.update_node_stat(node, {'fill_value': fill_value})
         return cls.enabled
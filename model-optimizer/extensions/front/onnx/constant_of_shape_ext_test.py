@@ -0,0 +1,44 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import onnx
+
+from extensions.front.onnx.constant_of_shape_ext import ConstantOfShapeExtractor
+from mo.front.onnx.loader import ExternalDataFiles
+from mo.front.onnx.loader_test import external_tensor
+from mo.graph.graph import Node
+from mo.utils.unittest.graph import build_graph
+
+
+class TestConstantOfShapeONNXExt(unittest.TestCase):
+    def test_external_fill_value(self):
+        fill_value = np.array([7], dtype=np.float32)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, 'values.bin'), 'wb') as f:
+                f.write(fill_value.tobytes())
+            pb = onnx.helper.make_node('ConstantOfShape', inputs=['shape'], outputs=['y'],
+                                       value=external_tensor('value', fill_value, 'values.bin', 0))
+            graph = build_graph({'node': {'kind': 'op', 'op': 'ConstantOfShape', 'pb': pb}}, [])
+            graph.graph['onnx_external_data'] = ExternalDataFiles(tmp_dir)
+
+            node = Node(graph, 'node')
+            ConstantOfShapeExtractor.extract(node)
+            self.assertTrue(np.array_equal(node.fill_value, fill_value))
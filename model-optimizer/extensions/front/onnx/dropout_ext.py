@@ -23,6 +23,7 @@ from mo.utils.error import Error
 class DropoutFrontExtractor(FrontExtractorOp):
     op = 'Dropout'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, node):
@@ -21,7 +21,7 @@ from extensions.ops.parameter import Parameter
 from mo.front.common.register_custom_ops import check_for_duplicates
 from mo.front.extractor import FrontExtractorOp
 from mo.front.extractor import extract_node_attrs
-from mo.front.onnx.extractor import onnx_op_extractor, onnx_op_extractors
+from mo.front.onnx.extractor import onnx_extraction_key, onnx_op_extractor, onnx_op_extractors
 from mo.front.onnx.extractors.utils import onnx_attr
 from mo.front.onnx.loader import node_id, add_initializers_and_inputs_to_graph
 from mo.graph.graph import Graph, Node, add_opoutput
@@ -31,6 +31,7 @@ from mo.utils.error import Error
 class LoopExtractor(FrontExtractorOp):
     op = 'Loop'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, loop_node):
@@ -181,5 +182,8 @@ class LoopExtractor(FrontExtractorOp):
             Loop.connect_body_output(loop_node, idx, body_results[idx + 1], axis=0)
 
         # run function to parse body nodes attributes similar to the main graph
-        extract_node_attrs(body_graph, lambda node: onnx_op_extractor(node, check_for_duplicates(onnx_op_extractors)))
+        # the extractors are checked for duplicates once instead of checking them for every node
+        extractors = check_for_duplicates(onnx_op_extractors)
+        extract_node_attrs(body_graph, lambda node: onnx_op_extractor(node, extractors),
+                           lambda node: onnx_extraction_key(node, extractors))
         return cls.enabled
@@ -28,6 +28,7 @@ from mo.utils.error import Error
 class UpsampleFrontExtractor(FrontExtractorOp):
     op = 'Upsample'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, node):
@@ -22,6 +22,7 @@ from mo.ops.const import Const
 class ConstExtractor(FrontExtractorOp):
     op = 'Const'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, node):
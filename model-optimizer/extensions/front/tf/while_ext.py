@@ -19,7 +19,7 @@ from extensions.ops.loop import Loop
 from extensions.ops.parameter import Parameter
 from mo.front.common.register_custom_ops import check_for_duplicates
 from mo.front.extractor import extract_node_attrs, FrontExtractorOp
-from mo.front.tf.extractor import tf_op_extractor, tf_op_extractors
+from mo.front.tf.extractor import tf_extraction_key, tf_op_extractor, tf_op_extractors
 from mo.front.tf.extractors.utils import tf_dtype_extractor
 from mo.graph.graph import add_opoutput, Graph, Node
 from mo.ops.op import PermuteAttrs
@@ -91,6 +91,7 @@ class WhileExtractor(FrontExtractorOp):
     """
     op = 'While'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, loop_node):
@@ -194,7 +195,10 @@ class WhileExtractor(FrontExtractorOp):
             Loop.connect_body_output(loop_node, idx, body_results[idx])
 
         # run function to parse body nodes attributes similar to the main graph
-        extract_node_attrs(body_graph, lambda node: tf_op_extractor(node, check_for_duplicates(tf_op_extractors)))
+        # the extractors are checked for duplicates once instead of checking them for every node
+        extractors = check_for_duplicates(tf_op_extractors)
+        extract_node_attrs(body_graph, lambda node: tf_op_extractor(node, extractors),
+                           lambda node: tf_extraction_key(node, extractors))
         return cls.enabled
 
 
@@ -205,6 +209,7 @@ class StatelessWhileExtractor(FrontExtractorOp):
     """
     op = 'StatelessWhile'
     enabled = True
+    cacheable = False
 
     @classmethod
     def extract(cls, loop_node):
@@ -19,12 +19,13 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import logging as log
+import os
 
 from extensions.load.loader import Loader
 from mo.front.common.register_custom_ops import update_extractors_with_extensions, check_for_duplicates
 from mo.front.extractor import extract_node_attrs
-from mo.front.onnx.extractor import onnx_op_extractor, onnx_op_extractors
-from mo.front.onnx.loader import load_onnx_model, protobuf2nx
+from mo.front.onnx.extractor import onnx_extraction_key, onnx_op_extractor, onnx_op_extractors
+from mo.front.onnx.loader import ExternalDataFiles, load_onnx_model, protobuf2nx
 from mo.graph.graph import Graph
 from mo.utils.error import Error
 from mo.utils.utils import refer_to_faq_msg
@@ -64,10 +65,14 @@ class ONNXLoader(Loader):
         graph.graph['layout'] = 'NCHW'
         graph.graph['fw'] = 'onnx'
         graph.graph['feature_dim'] = 1
+        graph.graph['onnx_external_data'] = ExternalDataFiles(os.path.dirname(os.path.abspath(argv.input_model)))
         if hasattr(model_proto, 'opset_import'):
             graph.graph['fw_opset_version'] = model_proto.opset_import[0].version   # pylint: disable=no-member
         else:
             graph.graph['fw_opset_version'] = None
 
         graph.check_empty_graph('protobuf2nx. It may happen due to problems with loaded model')
-        extract_node_attrs(graph, lambda node: onnx_op_extractor(node, check_for_duplicates(onnx_op_extractors)))
+        # the extractors are checked for duplicates once instead of checking them for every node
+        extractors = check_for_duplicates(onnx_op_extractors)
+        extract_node_attrs(graph, lambda node: onnx_op_extractor(node, extractors),
+                           lambda node: onnx_extraction_key(node, extractors))
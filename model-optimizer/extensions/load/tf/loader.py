@@ -32,7 +32,7 @@ from extensions.load.loader import Loader
 from mo.front.common.register_custom_ops import check_for_duplicates
 from mo.front.common.register_custom_ops import update_extractors_with_extensions
 from mo.front.extractor import restore_edges, extract_node_attrs, remove_control_dependency_inputs
-from mo.front.tf.extractor import get_tf_edges, tf_op_extractor, tf_op_extractors
+from mo.front.tf.extractor import get_tf_edges, tf_extraction_key, tf_op_extractor, tf_op_extractors
 from mo.front.tf.loader import load_tf_graph_def, protobuf2nx
 from mo.graph.graph import Graph
 from mo.utils import tensorboard_util
@@ -100,4 +100,7 @@ class TFLoader(Loader):
         remove_control_dependency_inputs(graph)
 
         graph.check_empty_graph('protobuf2nx. It may happen due to problems with loaded model')
-        extract_node_attrs(graph, lambda node: tf_op_extractor(node, check_for_duplicates(tf_op_extractors)))
+        # the extractors are checked for duplicates once instead of checking them for every node
+        extractors = check_for_duplicates(tf_op_extractors)
+        extract_node_attrs(graph, lambda node: tf_op_extractor(node, extractors),
+                           lambda node: tf_extraction_key(node, extractors))
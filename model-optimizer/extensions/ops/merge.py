@@ -23,6 +23,8 @@ from mo.ops.op import Op
 
 class Merge(Op):
     op = 'Merge'
+    # the output depends on the inference state of the inputs
+    cacheable_infer = False
 
     def __init__(self, graph: Graph, attrs: dict):
         mandatory_props = {
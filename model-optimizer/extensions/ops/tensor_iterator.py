@@ -28,6 +28,8 @@ class TensorIterator(Op):
     """
 
     op = 'TensorIterator'
+    # the body graph is inferred as well
+    cacheable_infer = False
 
     def __init__(self, graph: Graph, attrs: dict):
         mandatory_props = {
@@ -15,10 +15,12 @@
 """
 
 import hashlib
-from xml.etree.ElementTree import Element, SubElement, tostring
-
-from defusedxml.minidom import parseString
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import Element, SubElement
 
+from mo.back.ie_ir_ver_2.xml_writer import PrettyXMLWriter
 from mo.graph.graph import *
 from mo.middle.passes.convert_data_type import np_data_type_to_precision
 from mo.utils.unsupported_ops import UnsupportedOps
@@ -38,10 +40,117 @@ def serialize_constants(graph: Graph, bin_file_name: str, data_type=np.float32):
         @bin_file_name: path to file to write blobs to
         @data_type: numpy data type to convert all blob elements to
 
+    Blobs with equal content are written once. Only blobs with the same size and shape are hashed to find duplicates
+    and the hashes are calculated in a thread pool. Offsets of all blobs are calculated in advance and the blobs are
+    copied to the memory-mapped file of the final size, so no blob data is kept besides the graph itself.
+    """
+    blobs = []
+    collect_constants_recursively(graph, blobs)
+
+    with ThreadPoolExecutor() as executor:
+        digests = blobs_digests(blobs, executor)
+
+        # key -> index of the first blob with this key in the blobs list
+        first_blob = {}
+        # index of the blob -> (offset, size) of the blob in the bin file
+        placement = {}
+        duplicates = []
+        file_size = 0
+        for idx, (_, _, blob) in enumerate(blobs):
+            key = (blob.nbytes, blob.shape, digests[idx])
+            if key in first_blob:
+                duplicates.append((idx, first_blob[key]))
+                continue
+            first_blob[key] = idx
+            placement[idx] = (file_size, blob.nbytes)
+            file_size += blob.nbytes
+
+        with open(bin_file_name, 'wb+') as bin_file:
+            bin_file.truncate(file_size)
+            if file_size != 0:
+                with mmap.mmap(bin_file.fileno(), file_size) as bin_map:
+                    list(executor.map(lambda idx: write_blob(bin_map, placement[idx][0], blobs[idx][2]), placement))
+                    mismatched = []
+                    for idx, first_idx in duplicates:
+                        first = blobs[first_idx][2]
+                        offset = placement[first_idx][0]
+                        # equal hashes are checked the same way as the blobs were compared before
+                        if np.array_equal(blobs[idx][2], np.ndarray(first.shape, first.dtype, bin_map, offset)):
+                            placement[idx] = placement[first_idx]
+                        else:
+                            mismatched.append(idx)
+                    bin_map.flush()
+                # blobs with the hash collision are appended to the end of the file
+                bin_file.seek(file_size)
+                for idx in mismatched:
+                    blob = blobs[idx][2]
+                    placement[idx] = (bin_file.tell(), blob.nbytes)
+                    blob.tofile(bin_file)
+            else:
+                for idx, first_idx in duplicates:
+                    placement[idx] = placement[first_idx]
+
+    for idx, (sub_graph, node_id, blob) in enumerate(blobs):
+        node = Node(sub_graph, node_id)
+        offset, size = placement[idx]
+        sub_graph.node[node_id]['offset'] = offset
+        sub_graph.node[node_id]['size'] = size
+        sub_graph.node[node_id]['blob_precision'] = np_data_type_to_precision(blob.dtype)
+        update_offset_size_in_const_node(node)
+
+        assert (blob.dtype.itemsize * np.prod(node.shape) == size) or node.has_valid('force_shape'), node.attrs()
+
+        log.debug(
+            "Detected binary for graph: '{}', node: '{}', id: {}, shape: '{}', offset: '{}', size: '{}'".format(
+                sub_graph, node.soft_get('name'), node.id, node.shape, node.offset, node.size))
+
+
+def collect_constants_recursively(graph: Graph, blobs: list):
+    """
+    Appends (graph, data node id, blob) for all data constants with output edges with 'bin' attribute to the blobs
+    list in the order the blobs are written to the bin file.
+    """
+    nodes = sorted(graph.nodes())
+    for node in nodes:
+        node = Node(graph, node)
+        if node.kind == 'data' and node.value is not None and \
+                any('bin' in d for u, v, d in graph.out_edges(node.node, data=True)):
+            blob = node.value if node.value.ndim > 0 else node.value.reshape((1))
+            blobs.append((graph, node.id, blob))
+
+    # separate loop for sub-graph to dump them after all blobs for more natural blob offset ordering
+    for node in nodes:
+        node = Node(graph, node)
+        if node.has_valid('sub_graphs'):
+            for sub_graph_attr_name in node.sub_graphs:
+                collect_constants_recursively(node[sub_graph_attr_name], blobs)
+
+
+def blob_digest(blob: np.ndarray):
+    # hashlib releases GIL for large buffers so the digests are calculated in parallel
+    return hashlib.blake2b(np.ascontiguousarray(blob).view(np.uint8), digest_size=32).digest()
+
+
+def blobs_digests(blobs: list, executor: ThreadPoolExecutor):
+    """
+    Returns the list of blob digests which are calculated only for blobs having the same size and shape as some other
+    blob. The digest of the blob with the unique size and shape is None.
     """
-    bin_hashes = {}
-    with open(bin_file_name, 'wb') as bin_file:
-        serialize_constants_recursively(graph, bin_file, data_type, bin_hashes)
+    groups = {}
+    for idx, (_, _, blob) in enumerate(blobs):
+        groups.setdefault((blob.nbytes, blob.shape), []).append(idx)
+    to_hash = [idx for group in groups.values() if len(group) > 1 for idx in group]
+
+    digests = [None] * len(blobs)
+    for idx, digest in zip(to_hash, executor.map(lambda idx: blob_digest(blobs[idx][2]), to_hash)):
+        digests[idx] = digest
+    return digests
+
+
+def write_blob(bin_map: mmap.mmap, offset: int, blob: np.ndarray):
+    if blob.nbytes != 0:
+        # copying to the numpy array created over the mapped file does not make a contiguous copy of the blob
+        np.copyto(np.ndarray(blob.shape, blob.dtype, bin_map, offset), blob, casting='no')
 
 
 def update_offset_size_in_const_node(node: Node):
@@ -240,7 +349,7 @@ def serialize_element(
         if value is not None:
             element.set(key, str(value))
     serialize_node_attributes(graph, node, subelements, element, edges, unsupported)
-    if len(element.attrib) == 0 and len(element.getchildren()) == 0:
+    if len(element.attrib) == 0 and len(element) == 0:
         parent_element.remove(element)
 
 
@@ -374,23 +483,50 @@ def add_meta_data(net: Element, meta_info: dict):
     SubElement(parameters, 'unset').set('unset_cli_parameters', ', '.join(sorted(meta_info['unset'])))
 
 
+def serialize_layer(graph: Graph, node: Node, layers: Element, edges: Element, unsupported):
+    if node.kind == 'op' and (not node.has('type') or node.type is None):
+        unsupported.add(node)
+        return
+    if not node.has('IE'):
+        return
+    try:
+        serialize_node_attributes(graph, node, node.IE, layers, edges, unsupported)
+    except Error as e:
+        raise Error(str(e).replace('<SUB-ELEMENT>', '{} (id = {})'.format(node.soft_get('name'), node.id))) from e
+
+
 def serialize_network(graph, net_element, unsupported):
     layers = SubElement(net_element, 'layers')
     edges = SubElement(net_element, 'edges')
     if graph is None:
         return
-    nodes = sorted(graph.nodes())
-    for node in nodes:
-        node = Node(graph, node)
-        if node.kind == 'op' and (not node.has('type') or node.type is None):
-            unsupported.add(node)
-            continue
-        if not node.has('IE'):
+    for node in sorted(graph.nodes()):
+        serialize_layer(graph, Node(graph, node), layers, edges, unsupported)
+
+
+def stream_network(graph: Graph, writer: PrettyXMLWriter, unsupported):
+    """
+    Writes the 'layers' and the 'edges' sections of the network to the writer. Every layer is written as soon as it is
+    serialized, so only the layer being serialized and the edges section are kept in memory.
+    """
+    layers = Element('layers')
+    edges = Element('edges')
+    layers_opened = False
+    for node in sorted(graph.nodes()):
+        serialize_layer(graph, Node(graph, node), layers, edges, unsupported)
+        if len(layers) == 0:
             continue
-        try:
-            serialize_node_attributes(graph, node, node.IE, layers, edges, unsupported)
-        except Error as e:
-            raise Error(str(e).replace('<SUB-ELEMENT>', '{} (id = {})'.format(node.soft_get('name'), node.id))) from e
+        if not layers_opened:
+            writer.open_element('layers')
+            layers_opened = True
+        for layer in layers:
+            writer.write_element(layer)
+        layers.clear()
+    if layers_opened:
+        writer.close_element('layers')
+    else:
+        writer.write_element(layers)
+    writer.write_element(edges)
 
 
 def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_offset: tuple = (),
@@ -424,20 +560,35 @@ def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_o
 
     unsupported = UnsupportedOps(graph)
 
-    serialize_network(graph, net, unsupported)
-    add_quantization_statistics(graph, net)
-    add_meta_data(net, meta_info)
-    add_quantization_info_section(net, meta_info)
-    xml_string = tostring(net)
-    xml_doc = parseString(xml_string)
-    pretty_xml_as_string = xml_doc.toprettyxml()
-    if len(unsupported.unsupported):
-        log.debug('Partially correct IR XML:\n{}'.format(pretty_xml_as_string))
-        unsupported.report(log.error, "List of operations that cannot be converted to Inference Engine IR:")
-        raise Error('Part of the nodes was not converted to IR. Stopped. ' +
-                    refer_to_faq_msg(24))
-    with open(file_name, 'wb') as file:
-        file.write(bytes(pretty_xml_as_string, "UTF-8"))
+    # the XML is written to the temporary file which replaces the resulting one only if the whole network is emitted
+    tmp_file_name = file_name + '.tmp'
+    try:
+        with open(tmp_file_name, 'w', encoding='UTF-8', newline='') as file:
+            writer = PrettyXMLWriter(file)
+            writer.open_element(net.tag, net.attrib)
+            for element in net:
+                writer.write_element(element)
+            stream_network(graph, writer, unsupported)
+
+            footer = Element('net')
+            add_quantization_statistics(graph, footer)
+            add_meta_data(footer, meta_info)
+            add_quantization_info_section(footer, meta_info)
+            for element in footer:
+                writer.write_element(element)
+            writer.close_element(net.tag)
+
+        if len(unsupported.unsupported):
+            if log.getLogger().isEnabledFor(log.DEBUG):
+                with open(tmp_file_name, 'r', encoding='UTF-8', newline='') as file:
+                    log.debug('Partially correct IR XML:\n{}'.format(file.read()))
+            unsupported.report(log.error, "List of operations that cannot be converted to Inference Engine IR:")
+            raise Error('Part of the nodes was not converted to IR. Stopped. ' +
+                        refer_to_faq_msg(24))
+        os.replace(tmp_file_name, file_name)
+    finally:
+        if os.path.exists(tmp_file_name):
+            os.remove(tmp_file_name)
 
 
 def port_renumber(graph: Graph):
@@ -14,14 +14,20 @@
  limitations under the License.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 from xml.etree.ElementTree import Element, tostring
 
 import numpy as np
+from defusedxml.minidom import parseString
 
-from mo.back.ie_ir_ver_2.emitter import soft_get, xml_shape
+from mo.back.ie_ir_ver_2.emitter import soft_get, xml_shape, generate_ie_ir, serialize_network, \
+    add_quantization_statistics, add_meta_data, create_pre_process_block, serialize_constants, \
+    serialize_constants_recursively
 from mo.utils.error import Error
+from mo.utils.unittest.graph import build_graph
 
 expected_result = b'<net><dim>2</dim><dim>10</dim><dim>50</dim><dim>50</dim></net>'
 
@@ -67,3 +73,99 @@ class TestSoftGet(unittest.TestCase):
     def test_not_node_2(self):
         node = 'something-else'
         self.assertEqual(soft_get(node, 'string'), '<SUB-ELEMENT>')
+
+
+layer_schema = [('layer', [('id', lambda node: node.node), 'name', 'type'], [('data', ['axis', 'comment'], [])])]
+
+
+class TestGenerateIEIR(unittest.TestCase):
+    nodes = {
+        'input': {'kind': 'op', 'type': 'Parameter', 'name': 'in<put>', 'IE': layer_schema},
+        'input_data': {'kind': 'data', 'value': None, 'shape': None},
+        'op': {'kind': 'op', 'type': 'Op', 'name': 'op "1" & \u0436', 'axis': 1, 'comment': 'a\nb\tc',
+               'IE': layer_schema},
+        'op_data': {'kind': 'data', 'value': None, 'shape': None},
+        'empty': {'kind': 'op', 'type': 'Result', 'IE': [('layer', ['axis'], [])]},
+    }
+    edges = [('input', 'input_data'), ('input_data', 'op'), ('op', 'op_data'), ('op_data', 'empty')]
+    meta_info = {'input_model': 'model.pb', 'unset': ['mean_values']}
+
+    def setUp(self):
+        self.graph = build_graph(self.nodes, self.edges)
+        self.graph.name = 'model'
+        self.graph.graph['ir_version'] = 10
+        self.graph.graph['mean_values'] = {'input': [1.0, 2.0]}
+        self.graph.graph['statistics'] = {'op_data': {'min': '-1', 'max': '1'}}
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmp_dir.name, 'model.xml')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def reference_ir(self):
+        net = Element('net')
+        net.set('name', self.graph.name)
+        net.set('version', str((self.graph.graph['ir_version'])))
+        for input_name, values in self.graph.graph['mean_values'].items():
+            create_pre_process_block(net, input_name, values)
+        serialize_network(self.graph, net, set())
+        add_quantization_statistics(self.graph, net)
+        add_meta_data(net, self.meta_info)
+        return bytes(parseString(tostring(net)).toprettyxml(), 'UTF-8')
+
+    def test_same_as_minidom(self):
+        generate_ie_ir(self.graph, self.file_name, meta_info=self.meta_info)
+        with open(self.file_name, 'rb') as f:
+            self.assertEqual(f.read(), self.reference_ir())
+        self.assertListEqual(os.listdir(self.tmp_dir.name), ['model.xml'])
+
+    def test_unsupported(self):
+        del self.graph.node['op']['type']
+        with self.assertRaises(Error):
+            generate_ie_ir(self.graph, self.file_name, meta_info=self.meta_info)
+        self.assertListEqual(os.listdir(self.tmp_dir.name), [])
+
+
+class TestSerializeConstants(unittest.TestCase):
+    values = {
+        'w_1': np.arange(12, dtype=np.float32).reshape([3, 4]),
+        'w_2': np.arange(12, dtype=np.float32).reshape([3, 4]),
+        'w_3': np.arange(12, dtype=np.float32).reshape([4, 3]),
+        'w_4': np.arange(12, dtype=np.float32).reshape([3, 4])[:, ::-1],
+        'w_5': np.array(5, dtype=np.int64),
+        'w_6': np.zeros([3, 4], dtype=np.int32),
+        'w_7': np.zeros([3, 4], dtype=np.float32),
+        'w_8': np.array([np.nan, 1.0], dtype=np.float32),
+        'w_9': np.array([np.nan, 1.0], dtype=np.float32),
+        'w_10': np.array([], dtype=np.float32),
+    }
+
+    def build_graph(self):
+        nodes = {'op': {'kind': 'op', 'type': 'Op'}}
+        edges = []
+        for name, value in self.values.items():
+            nodes[name] = {'kind': 'data', 'value': value, 'shape': np.array(value.shape, dtype=np.int64)}
+            edges.append((name, 'op', {'bin': 'weights'}))
+        return build_graph(nodes, edges, nodes_with_edges_only=True)
+
+    def test_same_as_sequential(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reference_graph = self.build_graph()
+            with open(os.path.join(tmp_dir, 'reference.bin'), 'wb') as bin_file:
+                serialize_constants_recursively(reference_graph, bin_file, np.float32, {})
+            graph = self.build_graph()
+            serialize_constants(graph, os.path.join(tmp_dir, 'model.bin'))
+
+            with open(os.path.join(tmp_dir, 'reference.bin'), 'rb') as reference, \
+                    open(os.path.join(tmp_dir, 'model.bin'), 'rb') as result:
+                self.assertEqual(result.read(), reference.read())
+        for name in self.values:
+            for attr in ['offset', 'size', 'blob_precision']:
+                self.assertEqual(graph.node[name][attr], reference_graph.node[name][attr], (name, attr))
+        self.assertEqual(graph.node['w_2']['offset'], graph.node['w_1']['offset'])
+        self.assertNotEqual(graph.node['w_9']['offset'], graph.node['w_8']['offset'])
+
+    def test_no_blobs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            serialize_constants(build_graph({'op': {'kind': 'op'}}, []), os.path.join(tmp_dir, 'model.bin'))
+            self.assertEqual(os.path.getsize(os.path.join(tmp_dir, 'model.bin')), 0)
@@ -0,0 +1,81 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+from xml.etree.ElementTree import Element
+
+
+def escape_xml(data: str):
+    return data.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+
+
+def escape_xml_text(data: str):
+    # XML parser normalizes line endings of the text content
+    return escape_xml(data.replace('\r\n', '\n').replace('\r', '\n'))
+
+
+class PrettyXMLWriter:
+    """
+    Writes XML incrementally to the text stream. The output is the same as produced by the
+    minidom.parseString(ElementTree.tostring(root)).toprettyxml() for the same tree, but the tree does not need to be
+    built as a whole: the open_element/close_element methods write the start and the end tags of an element and the
+    write_element method writes the complete ElementTree sub-tree.
+
+    The elements opened with open_element are written with the start tag in the full form even if they are empty, so
+    the caller must use write_element for elements which may have no children.
+    """
+
+    def __init__(self, stream, indent: str = '\t', newl: str = '\n'):
+        self.stream = stream
+        self.indent = indent
+        self.newl = newl
+        self.depth = 0
+        self.stream.write('<?xml version="1.0" ?>' + newl)
+
+    def _start_tag(self, tag: str, attrib: dict):
+        return '<' + tag + ''.join(' {}="{}"'.format(k, escape_xml(v)) for k, v in attrib.items())
+
+    def open_element(self, tag: str, attrib: dict = None):
+        self.stream.write(self.indent * self.depth + self._start_tag(tag, attrib or {}) + '>' + self.newl)
+        self.depth += 1
+
+    def close_element(self, tag: str):
+        self.depth -= 1
+        self.stream.write(self.indent * self.depth + '</' + tag + '>' + self.newl)
+
+    def write_element(self, element: Element):
+        self._write(element, self.indent * self.depth)
+
+    def _write(self, element: Element, indent: str):
+        write = self.stream.write
+        children = list(element)
+        text = element.text
+        start_tag = indent + self._start_tag(element.tag, element.attrib)
+        if not children:
+            if text:
+                write(start_tag + '>' + escape_xml_text(text) + '</' + element.tag + '>' + self.newl)
+            else:
+                write(start_tag + '/>' + self.newl)
+            return
+
+        write(start_tag + '>' + self.newl)
+        child_indent = indent + self.indent
+        if text:
+            write(escape_xml_text(child_indent + text + self.newl))
+        for child in children:
+            self._write(child, child_indent)
+            if child.tail:
+                write(escape_xml_text(child_indent + child.tail + self.newl))
+        write(indent + '</' + element.tag + '>' + self.newl)
@@ -0,0 +1,57 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import io
+import unittest
+from xml.etree.ElementTree import Element, SubElement, tostring
+
+from defusedxml.minidom import parseString
+
+from mo.back.ie_ir_ver_2.xml_writer import PrettyXMLWriter
+
+
+class TestPrettyXMLWriter(unittest.TestCase):
+    @staticmethod
+    def build_tree():
+        root = Element('net', {'name': 'a "quoted" <name> & more', 'version': '10'})
+        layers = SubElement(root, 'layers')
+        layer = SubElement(layers, 'layer', {'id': '0', 'multiline': 'a\nb\r\nc\td'})
+        SubElement(layer, 'data')
+        port = SubElement(SubElement(layer, 'output'), 'port', {'id': '0'})
+        for d in ['1', '3']:
+            SubElement(port, 'dim').text = d
+        SubElement(layers, 'empty').text = ''
+        mixed = SubElement(root, 'mixed')
+        mixed.text = 'text & <text>'
+        SubElement(mixed, 'child').tail = ' tail\r\n'
+        SubElement(root, 'unicode', {'value': 'жж'}).text = 'ж "x"'
+        return root
+
+    def test_write_element(self):
+        root = self.build_tree()
+        stream = io.StringIO()
+        PrettyXMLWriter(stream).write_element(root)
+        self.assertEqual(stream.getvalue(), parseString(tostring(root)).toprettyxml())
+
+    def test_open_close_element(self):
+        root = self.build_tree()
+        stream = io.StringIO()
+        writer = PrettyXMLWriter(stream)
+        writer.open_element(root.tag, root.attrib)
+        for child in root:
+            writer.write_element(child)
+        writer.close_element(root.tag)
+        self.assertEqual(stream.getvalue(), parseString(tostring(root)).toprettyxml())
@@ -17,12 +17,21 @@
 """
 
 
+def apply_offline_transformations():
+    """
+    Applies the offline transformations of the Inference Engine. The function may be called in the Model Optimizer
+    process if the Inference Engine Python API is importable from it.
+    Raises ImportError if the Inference Engine Python API is not available.
+    """
+    from openvino.inference_engine import IECore  # pylint: disable=import-error
+    from openvino.offline_transformations import ApplyMOCTransformations, CheckAPI  # pylint: disable=import-error
+
+    CheckAPI()
+
+
 if __name__ == "__main__":
     try:
-        from openvino.inference_engine import IECore # pylint: disable=import-error
-        from openvino.offline_transformations import ApplyMOCTransformations, CheckAPI # pylint: disable=import-error
+        apply_offline_transformations()
     except Exception as e:
         print("[ WARNING ] {}".format(e))
         exit(1)
-
-    CheckAPI()
\ No newline at end of file
@@ -24,6 +24,7 @@ import numpy as np
 from google.protobuf import text_format
 from google.protobuf.internal import api_implementation
 
+from mo.front.caffe.text_proto_parser import parse_text_proto
 from mo.graph.graph import Graph
 from mo.utils.error import Error, FrameworkError
 from mo.utils.utils import refer_to_faq_msg
@@ -114,9 +115,15 @@ def load_caffe_proto_model(caffe_pb2, proto_path: str, model_path: [str, None] =
 
     # Read proto layers
     try:
-        proto = caffe_pb2.NetParameter()
         with open(proto_path, "r") as file:
-            text_format.Merge(str(file.read()), proto)
+            proto_text = str(file.read())
+        try:
+            proto = parse_text_proto(proto_text, caffe_pb2.NetParameter())
+        except Error as e:
+            # the text_format supports all features of the text format and reports the error in the standard way
+            log.debug('Falling back to the text_format parser for {}: {}'.format(proto_path, e))
+            proto = caffe_pb2.NetParameter()
+            text_format.Merge(proto_text, proto)
     except Exception as e:
         log.error('Exception message: {}\n\n'.format(e) +
                   '    Possible reasons:\n' +
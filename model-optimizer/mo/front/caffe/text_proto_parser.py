@@ -0,0 +1,212 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import re
+
+from google.protobuf import text_encoding, text_format
+from google.protobuf.descriptor import FieldDescriptor
+
+from mo.utils.error import Error
+
+# the strings, the comments, the delimiters and the values. The stray quote is the separate token to report an error
+TOKENS_PATTERN = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|'  # strings
+                            r'#[^\n]*|'  # comments
+                            r'[{}\[\]<>:,;]|[^\s{}\[\]<>:,;"\'#]+|["\']')
+
+# the string followed by another string or the empty string which is checked for the adjacent strings
+ADJACENT_STRINGS_PATTERN = re.compile(r'["\']\s*["\']')
+
+MESSAGE_END = {'{': '}', '<': '>'}
+
+INTEGER_TYPES = {
+    FieldDescriptor.TYPE_INT32: (True, False),
+    FieldDescriptor.TYPE_SINT32: (True, False),
+    FieldDescriptor.TYPE_SFIXED32: (True, False),
+    FieldDescriptor.TYPE_INT64: (True, True),
+    FieldDescriptor.TYPE_SINT64: (True, True),
+    FieldDescriptor.TYPE_SFIXED64: (True, True),
+    FieldDescriptor.TYPE_UINT32: (False, False),
+    FieldDescriptor.TYPE_FIXED32: (False, False),
+    FieldDescriptor.TYPE_UINT64: (False, True),
+    FieldDescriptor.TYPE_FIXED64: (False, True),
+}
+
+
+def parse_integer(token: str, field: FieldDescriptor):
+    if token.isdigit() and (token[0] != '0' or token == '0'):
+        return int(token)
+    is_signed, is_long = INTEGER_TYPES[field.type]
+    return text_format.ParseInteger(token, is_signed=is_signed, is_long=is_long)
+
+
+def parse_float(token: str, field: FieldDescriptor):
+    try:
+        return float(token)
+    except ValueError:
+        return text_format.ParseFloat(token)
+
+
+def parse_bool(token: str, field: FieldDescriptor):
+    return text_format.ParseBool(token)
+
+
+def parse_enum(token: str, field: FieldDescriptor):
+    value = field.enum_type.values_by_name.get(token)
+    if value is not None:
+        return value.number
+    number = int(token)
+    if field.enum_type.values_by_number.get(number) is None:
+        raise ValueError('Enum type "{}" has no value with number {}'.format(field.enum_type.full_name, number))
+    return number
+
+
+def unquote(token: str):
+    if len(token) < 2 or token[0] not in '"\'' or token[-1] != token[0]:
+        raise ValueError('Expected string but found {}'.format(token))
+    return token[1:-1]
+
+
+def parse_string(token: str, field: FieldDescriptor):
+    value = unquote(token)
+    return text_encoding.CUnescape(value).decode('utf-8') if '\\' in value else value
+
+
+def parse_bytes(token: str, field: FieldDescriptor):
+    value = unquote(token)
+    return text_encoding.CUnescape(value) if '\\' in value else value.encode('utf-8')
+
+
+SCALAR_PARSERS = {
+    **{field_type: parse_integer for field_type in INTEGER_TYPES},
+    FieldDescriptor.TYPE_FLOAT: parse_float,
+    FieldDescriptor.TYPE_DOUBLE: parse_float,
+    FieldDescriptor.TYPE_BOOL: parse_bool,
+    FieldDescriptor.TYPE_ENUM: parse_enum,
+    FieldDescriptor.TYPE_STRING: parse_string,
+    FieldDescriptor.TYPE_BYTES: parse_bytes,
+}
+
+
+def join_adjacent_strings(tokens: list):
+    """
+    The adjacent string tokens are concatenated like in the text_format
+    """
+    result = []
+    for token in tokens:
+        if len(token) > 1 and token[0] in '"\'' and result and len(result[-1]) > 1 and result[-1][0] in '"\'':
+            result[-1] = result[-1][:-1] + token[1:-1] + result[-1][-1]
+        else:
+            result.append(token)
+    return result
+
+
+class TextProtoParser:
+    """
+    The parser of the protobuf messages in the text format which is much faster than the google.protobuf.text_format
+    with the Python implementation of the protobuf library. The whole text is split to tokens with the single regular
+    expression and the fields of the message are filled according to the message descriptor. The extensions, the Any
+    messages and the groups are not supported, so the Error is raised for them as well as for the invalid text.
+    """
+
+    def __init__(self, text: str):
+        tokens = [token for token in TOKENS_PATTERN.findall(text) if token[0] != '#']
+        if ADJACENT_STRINGS_PATTERN.search(text):
+            tokens = join_adjacent_strings(tokens)
+        self.tokens = iter(tokens)
+        self.descriptors_fields = {}
+
+    def fields(self, descriptor):
+        """
+        Returns the field descriptor, the message and the repeated flags and the value parser for the message fields
+        """
+        fields = self.descriptors_fields.get(descriptor)
+        if fields is None:
+            fields = self.descriptors_fields[descriptor] = {
+                name: (field, field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE,
+                       field.label == FieldDescriptor.LABEL_REPEATED, SCALAR_PARSERS.get(field.type))
+                for name, field in descriptor.fields_by_name.items() if field.type != FieldDescriptor.TYPE_GROUP}
+        return fields
+
+    def merge(self, message):
+        try:
+            self.merge_fields(message, None)
+        except StopIteration as e:
+            raise Error('Unexpected end of the text') from e
+        return message
+
+    def merge_fields(self, message, end: [str, None]):
+        fields = self.fields(message.DESCRIPTOR)
+        tokens = self.tokens
+        for token in tokens:
+            if token == end:
+                return
+            if token == ',' or token == ';':
+                continue
+            if token not in fields:
+                raise Error('Message type "{}" has no field named "{}"', message.DESCRIPTOR.full_name, token)
+            field, is_message, repeated, parse = fields[token]
+            token = next(tokens)
+            if is_message:
+                if token == ':':
+                    token = next(tokens)
+                if token == '[' and repeated:
+                    values = getattr(message, field.name)
+                    for token in tokens:
+                        if token == ']':
+                            break
+                        if token != ',':
+                            self.merge_message(values.add(), token)
+                else:
+                    self.merge_message(getattr(message, field.name).add() if repeated else
+                                       getattr(message, field.name), token)
+                continue
+
+            if token != ':':
+                raise Error('Expected ":" after the field "{}" but found "{}"', field.full_name, token)
+            token = next(tokens)
+            try:
+                if not repeated:
+                    setattr(message, field.name, parse(token, field))
+                elif token != '[':
+                    getattr(message, field.name).append(parse(token, field))
+                else:
+                    values = getattr(message, field.name)
+                    for token in tokens:
+                        if token == ']':
+                            break
+                        if token != ',':
+                            values.append(parse(token, field))
+            except (ValueError, TypeError, text_format.ParseError) as e:
+                raise Error('Invalid value "{}" of the field "{}": {}', token, field.full_name, e) from e
+        if end is not None:
+            raise Error('Expected "{}" at the end of the message "{}"', end, message.DESCRIPTOR.full_name)
+
+    def merge_message(self, message, token: str):
+        if token not in MESSAGE_END:
+            raise Error('Expected "{{" but found "{}"', token)
+        # the empty message is set as well
+        message.SetInParent()
+        self.merge_fields(message, MESSAGE_END[token])
+
+
+def parse_text_proto(text: str, message):
+    """
+    Merges the protobuf message in the text format to the message
+    :param text: the message in the text format
+    :param message: the protobuf message to merge the text to
+    :return: the message
+    """
+    return TextProtoParser(text).merge(message)
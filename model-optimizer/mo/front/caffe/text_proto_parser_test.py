@@ -0,0 +1,73 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import unittest
+
+from google.protobuf import text_format
+
+from mo.front.caffe.loader_test import proto_str_one_input, proto_str_old_styled_multi_input, proto_str_multi_input, \
+    layer_proto_str, proto_same_name_layers
+from mo.front.caffe.proto import caffe_pb2
+from mo.front.caffe.text_proto_parser import parse_text_proto
+from mo.utils.error import Error
+
+proto_str_features = '''
+# comment with the "quote" and {brace}
+name: 'net' "work"
+layer {
+  name: "conv\\t1#"  # the comment after the value
+  type: "Convolution"
+  bottom: "data" top: "conv1";
+  phase: TEST
+  include { phase: 1 }
+  param: [{lr_mult: 1}, {lr_mult: 2.0f decay_mult: 0}]
+  convolution_param <
+    num_output: 0x40
+    kernel_size: [3, 3]
+    bias_term: false
+    weight_filler { type: "xavier" std: 1e-3 }
+    bias_filler {}
+  >
+}
+layer { name: "inf" type: "Power" power_param { power: -inf scale: nan shift: -1 } }
+'''
+
+
+class TestTextProtoParser(unittest.TestCase):
+    def check(self, text: str):
+        expected = caffe_pb2.NetParameter()
+        text_format.Merge(text, expected)
+        parsed = parse_text_proto(text, caffe_pb2.NetParameter())
+        self.assertEqual(parsed.SerializeToString(), expected.SerializeToString())
+
+    def test_loader_models(self):
+        for text in [proto_str_one_input, proto_str_old_styled_multi_input, proto_str_multi_input + layer_proto_str,
+                     proto_str_multi_input + proto_same_name_layers]:
+            self.check(text)
+
+    def test_features(self):
+        self.check(proto_str_features)
+        parsed = parse_text_proto(proto_str_features, caffe_pb2.NetParameter())
+        self.assertEqual(parsed.name, 'network')
+        self.assertEqual(parsed.layer[0].name, 'conv\t1#')
+        self.assertTrue(parsed.layer[0].convolution_param.HasField('bias_filler'))
+
+    def test_errors(self):
+        for text in ['name: "network" unknown_field: 1', 'layer { name: "conv1" ', 'layer { phase: UNKNOWN }',
+                     'name: network', 'name: "network', 'layer { convolution_param { num_output: -1 } }',
+                     '[caffe.extension]: 1']:
+            with self.assertRaises(Error):
+                parse_text_proto(text, caffe_pb2.NetParameter())
@@ -36,6 +36,14 @@ def extension_op_extractor(node, op_cls):
     return node.graph.node[node.id]
 
 
+def cacheable_extractor(extractor: callable, cacheable: bool):
+    """
+    Marks the extractor function if the attributes extracted by it may be cached for the nodes with the same definition
+    """
+    extractor.cacheable = cacheable
+    return extractor
+
+
 def find_case_insensitive_duplicates(extractors_collection: dict):
     """
     Searches for case-insensitive duplicates among extractors_collection keys.
@@ -88,19 +96,30 @@ def update_extractors_with_extensions(extractors_collection: dict = None,
     """
     keys = check_for_duplicates(extractors_collection)
     for op, ex_cls in FrontExtractorOp.registered_ops.items():
+        extractor = lambda node, cls=ex_cls: extension_extractor(
+            node, cls, disable_omitting_optional, enable_flattening_optional_params)
         add_or_override_extractor(
             extractors_collection,
             keys,
             op,
-            lambda node, cls=ex_cls: extension_extractor(
-                node, cls, disable_omitting_optional, enable_flattening_optional_params),
+            cacheable_extractor(extractor, getattr(ex_cls, 'cacheable', False)),
             'custom extractor class {}'.format(ex_cls)
         )
 
     for op, op_cls in Op.registered_ops.items():
         op_lower = op.lower()
         if op_lower not in keys:
-            extractors_collection[op] = (lambda c: lambda node: extension_op_extractor(node, c))(op_cls)
+            extractors_collection[op] = cacheable_extractor(
+                (lambda c: lambda node: extension_op_extractor(node, c))(op_cls), True)
             log.debug('Added a new entry {} to extractors with custom op class {}.'.format(op, op_cls))
             keys[op_lower] = op
+
+    for op, (module_name, class_name) in Op.lazy_registered_ops.items():
+        op_lower = op.lower()
+        if op_lower not in keys:
+            extractors_collection[op] = cacheable_extractor(
+                lambda node, op=op: extension_op_extractor(node, Op.get_op_class_by_name(op)), True)
+            log.debug('Added a new entry {} to extractors with lazily imported custom op class {}.{}.'.format(
+                op, module_name, class_name))
+            keys[op_lower] = op
     check_for_duplicates(extractors_collection)
@@ -17,7 +17,7 @@ import ast
 import logging as log
 import re
 from collections import defaultdict
-from copy import copy
+from copy import copy, deepcopy
 
 import numpy as np
 
@@ -422,18 +422,44 @@ def get_specific_edge_attrs(attrs: dict, attrs_type: str, additional_attrs=None)
     return new_attrs
 
 
-def extract_node_attrs(graph: Graph, extractor: callable):
+# the node attributes which are specific for the node and are never taken from the extraction cache
+EXTRACTION_CACHE_NODE_ATTRS = ['name', 'pb', 'pb_init', 'pb_attrs']
+# the read-only attributes which are shared between the nodes with the same cached attributes instead of copying
+EXTRACTION_CACHE_SHARED_ATTRS = ['IE']
+
+
+def copy_cached_attrs(attrs: dict):
+    return {key: value if key in EXTRACTION_CACHE_SHARED_ATTRS else deepcopy(value) for key, value in attrs.items()}
+
+
+def extract_node_attrs(graph: Graph, extractor: callable, cache_key: callable = None):
     """
     For each node produce new entries in a node attributes dictionary by existing attributes.
     Old attributes are not removed but merged with new ones.
+
+    The cache_key is the function which returns the hashable key of the node definition without the node name and the
+    inputs names or None if the attributes of the node cannot be cached. The extracted attributes are cached by the key
+    for the time of the function call, so the nodes with the same definition get the copy of the cached attributes
+    instead of running the extractor.
     """
     unsupported = UnsupportedOps(graph)
+    cache = {}
+    hits = misses = 0
     for node, attrs in list(graph.nodes(data=True)):
+        key = None
         # the 'Result' operation is a virtual operation that is added after the output nodes
         if 'op' in attrs and attrs['op'] == 'Result':
             supported, new_attrs = True, {'in_attrs': list(), 'out_attrs': list()}
         else:
             try:
+                key = cache_key(Node(graph, node)) if cache_key is not None else None
+                if key in cache:
+                    hits += 1
+                    supported, cached_attrs = cache[key]
+                    graph.node[node].update(copy_cached_attrs(cached_attrs))
+                    if not supported:
+                        unsupported.add(Node(graph, node))
+                    continue
                 supported, new_attrs = extractor(Node(graph, node))
             except Exception as e:
                 log.warning('Node attributes: {}'.format(graph.node[node]))
@@ -447,11 +473,18 @@ def extract_node_attrs(graph: Graph, extractor: callable):
             if 'IE' not in new_attrs:
                 update_ie_fields(new_attrs)
             add_attrs_props(new_attrs)
-        for key, val in new_attrs.items():
-            graph.node[node][key] = val
+        for key_name, val in new_attrs.items():
+            graph.node[node][key_name] = val
         if not supported:
             unsupported.add(Node(graph, node))
-
+        if key is not None:
+            misses += 1
+            cache[key] = supported, copy_cached_attrs({k: v for k, v in graph.node[node].items()
+                                                       if k not in EXTRACTION_CACHE_NODE_ATTRS})
+
+    if hits + misses:
+        log.debug('Extraction cache: {} hits, {} misses, hit rate {:.1%}'.format(hits, misses,
+                                                                               hits / (hits + misses)))
     unsupported.report(log.warning, 'Instructions/layers that do not have attribute extractors:')
 
     return graph
@@ -1038,6 +1071,10 @@ class FrontExtractorOp(object):
     registered_ops = {}
     registered_cls = []
 
+    # the extracted attributes depend on the node definition only, so they may be cached for the nodes with the same
+    # definition. The extractors which use the node neighbours or the node name should set it to False
+    cacheable = True
+
     @classmethod
     def class_type(cls):
         return class_registration.ClassType.EXTRACTOR
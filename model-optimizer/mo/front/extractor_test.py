@@ -22,7 +22,7 @@ from generator import generator, generate
 from mo.front.extractor import input_user_data_repack, output_user_data_repack, update_ie_fields, add_input_op, \
     get_node_id_with_ports
 from mo.front.extractor import spatial_attr_getter, add_input_ops, attr_getter, CaffePythonFrontExtractorOp, \
-    add_output_ops, bool_to_str
+    add_output_ops, bool_to_str, extract_node_attrs
 from mo.graph.graph import Node
 from mo.utils.error import Error
 from mo.utils.ir_engine.compare_graphs import compare_graphs
@@ -687,3 +687,40 @@ class TestBoolToSrtFunction(unittest.TestCase):
         for attr in attrs:
             pool_1_node.bool_attr = attr[0]
             self.assertEqual(attr[1], bool_to_str(pool_1_node, 'bool_attr'))
+
+
+class TestExtractNodeAttrs(unittest.TestCase):
+    def test_extraction_cache(self):
+        graph = build_graph({'conv_1': {'kind': 'op', 'pb': {'kernel': 3}},
+                             'conv_2': {'kind': 'op', 'pb': {'kernel': 3}},
+                             'conv_3': {'kind': 'op', 'pb': {'kernel': 5}}},
+                            [('conv_1', 'conv_2'), ('conv_2', 'conv_3')])
+        extracted = []
+
+        def extractor(node):
+            extracted.append(node.id)
+            return True, {'name': node.id, 'op': 'Conv', 'kernel': np.array([node.pb['kernel']] * 2)}
+
+        extract_node_attrs(graph, extractor, lambda node: node.pb['kernel'])
+        self.assertListEqual(extracted, ['conv_1', 'conv_3'])
+
+        conv_1, conv_2 = Node(graph, 'conv_1'), Node(graph, 'conv_2')
+        self.assertEqual(conv_2.name, 'conv_2')
+        self.assertEqual(conv_2.op, 'Conv')
+        self.assertListEqual(list(conv_2.kernel), [3, 3])
+        # the cached attributes are copied, so the node attributes may be changed independently
+        self.assertIsNot(conv_2.kernel, conv_1.kernel)
+        self.assertListEqual(list(Node(graph, 'conv_3').kernel), [5, 5])
+
+    def test_not_cached_node(self):
+        graph = build_graph({'conv_1': {'kind': 'op', 'pb': {'kernel': 3}},
+                             'conv_2': {'kind': 'op', 'pb': {'kernel': 3}}},
+                            [('conv_1', 'conv_2')])
+        extracted = []
+
+        def extractor(node):
+            extracted.append(node.id)
+            return True, {'op': 'Conv'}
+
+        extract_node_attrs(graph, extractor, lambda node: None)
+        self.assertListEqual(extracted, ['conv_1', 'conv_2'])
@@ -25,7 +25,7 @@ from extensions.ops.split import AttributedVariadicSplit
 from mo.front.common.partial_infer.utils import float_array
 from mo.front.kaldi.loader.utils import find_next_tag, read_placeholder, find_next_component, get_name_from_path, \
     find_end_of_component, end_of_nnet_tag, read_binary_integer32_token, get_parameters, read_token_value, \
-    collect_until_token, collect_until_token_and_read, create_edge_attrs, get_args_for_specifier
+    collect_until_token, collect_until_token_and_read, create_edge_attrs, get_args_for_specifier, open_kaldi_model
 from mo.graph.graph import Node, Graph
 from mo.ops.const import Const
 from mo.utils.error import Error
@@ -105,7 +105,7 @@ def load_kaldi_model(graph, nnet_path):
     """
     nnet_name = None
     if isinstance(nnet_path, str):
-        file_desc = open(nnet_path, "rb")
+        file_desc = open_kaldi_model(nnet_path)
         nnet_name = get_name_from_path(nnet_path)
     elif isinstance(nnet_path, IOBase):
         file_desc = nnet_path
@@ -15,6 +15,7 @@
 """
 
 import io
+import mmap
 import os
 import struct
 
@@ -68,6 +69,78 @@ supported_components = [
 ]
 
 
+class MappedReader(io.IOBase):
+    """
+    Read-only file-like object over the region of the buffer with the Kaldi model, usually the memory-mapped file.
+    Tags and tokens are searched with the find method of the buffer and blobs are read as numpy arrays referencing the
+    buffer, so the content of the model is not copied. The positions are relative to the start of the region.
+    """
+
+    def __init__(self, buffer, start: int = 0, end: int = None):
+        super().__init__()
+        self.buffer = buffer
+        self.start = start
+        self.end = len(buffer) if end is None else end
+        self.pos = start
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def __len__(self):
+        return self.end - self.start
+
+    def read(self, size=-1) -> bytes:
+        end = self.end if size is None or size < 0 else min(self.pos + size, self.end)
+        data = self.buffer[self.pos:end]
+        self.pos = max(self.pos, end)
+        return data
+
+    def readline(self, size=-1) -> bytes:
+        end = self.buffer.find(b'\n', self.pos, self.end)
+        end = self.end if end == -1 else end + 1
+        if size is not None and size >= 0:
+            end = min(end, self.pos + size)
+        return self.read(end - self.pos)
+
+    def tell(self) -> int:
+        return self.pos - self.start
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: self.start, io.SEEK_CUR: self.pos, io.SEEK_END: self.end}[whence]
+        if base + offset < self.start:
+            raise ValueError('negative seek value {}'.format(base + offset - self.start))
+        self.pos = base + offset
+        return self.tell()
+
+    def sub_reader(self, start_index: int, end_index: int):
+        return MappedReader(self.buffer, self.start + start_index, self.start + end_index)
+
+    def __deepcopy__(self, memo):
+        # the buffer is never modified through the reader so copies share it
+        copy = MappedReader(self.buffer, self.start, self.end)
+        copy.pos = self.pos
+        return copy
+
+    def __reduce__(self):
+        return io.BytesIO, (bytes(self.buffer[self.start:self.end]),)
+
+
+def open_kaldi_model(path: str) -> MappedReader:
+    """
+    Maps the Kaldi model file to the memory. The mapping is copy-on-write, so arrays read from the model are writable
+    and changing them does not change the file.
+    :param path: path to the model file
+    :return: reader over the mapped file
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return MappedReader(b'')
+        return MappedReader(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+
+
 def get_bool(s: bytes) -> bool:
     """
     Get bool value from bytes
@@ -163,6 +236,8 @@ def find_next_tag(file_desc: io.BufferedReader) -> str:
     :param file_desc:file descriptor
     :return: string like '<sometag>'
     """
+    if isinstance(file_desc, MappedReader):
+        return find_next_tag_in_buffer(file_desc)
     tag = b''
     while True:
         symbol = file_desc.read(1)
@@ -182,6 +257,24 @@ def find_next_tag(file_desc: io.BufferedReader) -> str:
             tag = b''
 
 
+def find_next_tag_in_buffer(reader: MappedReader) -> str:
+    buffer = reader.buffer
+    while True:
+        start = buffer.find(b'<', reader.pos, reader.end)
+        end = buffer.find(b'>', start + 1, reader.end) if start != -1 else -1
+        if end == -1:
+            reader.pos = reader.end
+            raise Error('Unexpected end of Kaldi model')
+        # the tag starts from the last '<' before the '>'
+        start = buffer.rfind(b'<', start, end)
+        reader.pos = end + 1
+        try:
+            return buffer[start:end + 1].decode('ascii')
+        except UnicodeDecodeError:
+            # Tag in Kaldi model always in ascii encoding
+            continue
+
+
 def read_placeholder(file_desc: io.BufferedReader, size=3) -> bytes:
     """
     Read size bytes from file
@@ -251,6 +344,9 @@ def get_parameters(file_desc: io.BufferedReader, start_index: int, end_index: in
     :param end_index:  Index of the end reading
     :return: part of the file
     """
+    if isinstance(file_desc, MappedReader):
+        file_desc.seek(end_index)
+        return file_desc.sub_reader(start_index, end_index)
     file_desc.seek(start_index)
     buffer = file_desc.read(end_index - start_index)
     return io.BytesIO(buffer)
@@ -283,6 +379,13 @@ def collect_until_whitespace(file_desc: io.BufferedReader):
     :param file_desc: file descriptor
     :return:
     """
+    if isinstance(file_desc, MappedReader):
+        end = file_desc.buffer.find(b' ', file_desc.pos, file_desc.end)
+        if end == -1:
+            return file_desc.read()
+        res = file_desc.read(end - file_desc.pos)
+        file_desc.pos += 1
+        return res
     res = b''
     while True:
         new_sym = file_desc.read(1)
@@ -305,7 +408,9 @@ def collect_until_token(file_desc: io.BufferedReader, token, size_search_zone=0)
         if res == token or res[-len(token):] == token:
             return
         size = size_search_zone
-        if size == 0 and isinstance(file_desc, io.BytesIO):
+        if size == 0 and isinstance(file_desc, MappedReader):
+            size = len(file_desc)
+        elif size == 0 and isinstance(file_desc, io.BytesIO):
             size = len(file_desc.getbuffer())
         elif size == 0 and isinstance(file_desc, io.BufferedReader):
             size = os.fstat(file_desc.fileno()).st_size
@@ -364,6 +469,10 @@ def read_blob(file_desc: io.BufferedReader, size: int, dtype=np.float32):
         np.float32: 4,
         np.int32: 4
     }
+    if isinstance(file_desc, MappedReader) and file_desc.pos + size * dsizes[dtype] <= file_desc.end:
+        blob = np.frombuffer(file_desc.buffer, dtype=dtype, count=size, offset=file_desc.pos)
+        file_desc.pos += size * dsizes[dtype]
+        return blob
     data = file_desc.read(size * dsizes[dtype])
     return np.frombuffer(data, dtype=dtype)
 
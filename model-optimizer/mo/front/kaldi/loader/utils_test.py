@@ -15,13 +15,19 @@
 """
 
 import io
+import os
 import struct
+import tempfile
 import unittest
+from copy import deepcopy
+
+import numpy as np
 
 from mo.front.kaldi.loader.utils import end_of_nnet_tag, end_of_component_tag, get_bool, get_uint16, get_uint32, \
     get_uint64, read_binary_bool_token, read_binary_integer32_token, read_binary_integer64_token, read_string, \
     read_binary_float_token, find_next_tag, find_next_component, find_end_of_component, get_parameters, \
-    collect_until_token_and_read, get_args_for_specifier
+    collect_until_token_and_read, get_args_for_specifier, MappedReader, open_kaldi_model, collect_until_whitespace, \
+    read_blob
 from mo.utils.error import Error
 
 
@@ -135,3 +141,48 @@ class TestKaldiUtilsLoading(unittest.TestCase):
         args = get_args_for_specifier(string)
         ref = [b"Offset(input, 1)", b"Offset(input, 2)"]
         self.assertEqual(args, ref)
+
+
+class TestKaldiUtilsLoadingMapped(TestKaldiUtilsLoading):
+    @staticmethod
+    def bytesio_from(buffer):
+        return MappedReader(buffer)
+
+    def test_find_next_tag_non_ascii(self):
+        test_file = b'\xff<a\xfftag>in<fo<tag>'
+        self.assertEqual(find_next_tag(self.bytesio_from(test_file)), '<tag>')
+
+    def test_collect_until_whitespace(self):
+        reader = self.bytesio_from(b'<Dim> 10')
+        self.assertEqual(collect_until_whitespace(reader), b'<Dim>')
+        self.assertEqual(collect_until_whitespace(reader), b'10')
+        self.assertEqual(collect_until_whitespace(reader), b'')
+
+    def test_get_parameters(self):
+        reader = self.bytesio_from(b'<A> <B> <C>')
+        pb = get_parameters(reader, 4, 7)
+        self.assertEqual(reader.tell(), 7)
+        self.assertEqual(pb.read(), b'<B>')
+        pb.seek(1)
+        self.assertEqual(find_next_tag(reader), '<C>')
+        with self.assertRaisesRegex(Error, 'Unexpected end of Kaldi model'):
+            find_next_tag(pb)
+        self.assertEqual(deepcopy(pb).tell(), 3)
+
+    def test_mapped_file(self):
+        blob = np.arange(6, dtype=np.float32)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'model.nnet')
+            with open(path, 'wb') as f:
+                f.write(b'<Nnet> ' + blob.tobytes() + b'</Nnet>\n')
+            reader = open_kaldi_model(path)
+            self.assertEqual(find_next_tag(reader), '<Nnet>')
+            reader.read(1)
+            value = read_blob(reader, 6)
+            np.testing.assert_array_equal(value, blob)
+            # the mapping is copy-on-write
+            value[0] = 10
+            self.assertEqual(reader.readline(), b'</Nnet>\n')
+            del reader, value
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read()[7:11], blob[:1].tobytes())
@@ -49,3 +49,20 @@ def onnx_op_extractor(node: Node, lowered_keys_map: dict):
             result.update(attrs)
             supported = True
     return supported, result
+
+
+def onnx_extraction_key(node: Node, lowered_keys_map: dict):
+    """
+    Returns the key of the node definition for the extraction cache: the operation type, the attributes and the number
+    of inputs and outputs without the node name and the inputs names. None is returned for the nodes which attributes
+    cannot be cached. The common fields of the cached node are set here because the extractor is not called for it.
+    """
+    if node.has_valid('op') or not node.has_valid('pb'):
+        return None
+    pb = node.pb
+    op = lowered_keys_map.get(pb.op_type.lower())
+    if op is None or not getattr(onnx_op_extractors[op], 'cacheable', False):
+        return None
+    node.graph.node[node.id].update(common_onnx_fields(node))
+    return (pb.op_type, pb.domain, tuple(bool(name) for name in pb.input), len(pb.output),
+            tuple(sorted(attr.SerializeToString() for attr in pb.attribute)))
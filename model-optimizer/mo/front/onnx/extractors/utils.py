@@ -20,9 +20,27 @@ from mo.graph.graph import Node
 from mo.utils.error import Error
 
 
+def onnx_attrs_index(node: Node):
+    """ Returns the dictionary mapping the attribute names of the ONNX protobuf `node.pb` to the lists of attributes.
+        The dictionary is built on the first access and stored in the node, so the attributes are not searched in the
+        protobuf message on every call.
+    """
+    pb = node.pb
+    try:
+        indexed_pb, index = node['pb_attrs']
+        if indexed_pb is pb:
+            return index
+    except KeyError:
+        pass
+    index = {}
+    for a in pb.attribute:
+        index.setdefault(a.name, []).append(a)
+    node['pb_attrs'] = (pb, index)
+    return index
+
+
 def onnx_node_has_attr(node: Node, name: str):
-    attrs = [a for a in node.pb.attribute if a.name == name]
-    return len(attrs) != 0
+    return name in onnx_attrs_index(node)
 
 
 def onnx_attr(node: Node, name: str, field: str, default=None, dst_type=None):
@@ -30,8 +48,8 @@ def onnx_attr(node: Node, name: str, field: str, default=None, dst_type=None):
         The final value is casted to dst_type if attribute really exists.
         The function returns `default` otherwise.
     """
-    attrs = [a for a in node.pb.attribute if a.name == name]
-    if len(attrs) == 0:
+    attrs = onnx_attrs_index(node).get(name)
+    if attrs is None:
         # there is no requested attribute in the protobuf message
         return default
     elif len(attrs) > 1:
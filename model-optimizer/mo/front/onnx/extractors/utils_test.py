@@ -0,0 +1,48 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import unittest
+
+import onnx
+
+from mo.front.onnx.extractors.utils import onnx_attr, onnx_node_has_attr
+from mo.graph.graph import Node
+from mo.utils.error import Error
+from mo.utils.unittest.graph import build_graph
+
+
+class OnnxAttrTest(unittest.TestCase):
+    def setUp(self):
+        pb = onnx.helper.make_node('Conv', inputs=['x', 'w'], outputs=['y'], kernel_shape=[3, 3], group=2)
+        self.graph = build_graph({'conv': {'kind': 'op', 'pb': pb}}, [])
+        self.node = Node(self.graph, 'conv')
+
+    def test_attrs(self):
+        self.assertListEqual(onnx_attr(self.node, 'kernel_shape', 'ints', dst_type=list), [3, 3])
+        self.assertEqual(onnx_attr(self.node, 'group', 'i', dst_type=lambda x: x * 2), 4)
+        self.assertEqual(onnx_attr(self.node, 'strides', 'ints', default=[1, 1]), [1, 1])
+        self.assertTrue(onnx_node_has_attr(self.node, 'group'))
+        self.assertFalse(onnx_node_has_attr(self.node, 'pads'))
+
+    def test_index_follows_pb(self):
+        self.assertEqual(onnx_attr(self.node, 'group', 'i'), 2)
+        self.node['pb'] = onnx.helper.make_node('Conv', inputs=['x', 'w'], outputs=['y'], group=4)
+        self.assertEqual(onnx_attr(self.node, 'group', 'i'), 4)
+        self.assertIsNone(onnx_attr(self.node, 'kernel_shape', 'ints'))
+
+    def test_duplicated_attr(self):
+        self.node.pb.attribute.extend([onnx.helper.make_attribute('group', 3)])
+        self.assertRaises(Error, onnx_attr, self.node, 'group', 'i')
@@ -19,16 +19,114 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import logging as log
+import mmap
+import os
+import sys
 
+import numpy as np
 import onnx
+from onnx import TensorProto
+from onnx.numpy_helper import to_array
 
 from mo.graph.graph import fill_graph_with_nodes, Graph, Node
 from mo.utils.error import Error, FrameworkError
 
+# the data types of the tensors which values are stored in the external data files as is, in little-endian order
+EXTERNAL_DATA_TYPES = {
+    TensorProto.FLOAT: np.float32,
+    TensorProto.DOUBLE: np.float64,
+    TensorProto.FLOAT16: np.float16,
+    TensorProto.INT8: np.int8,
+    TensorProto.INT16: np.int16,
+    TensorProto.INT32: np.int32,
+    TensorProto.INT64: np.int64,
+    TensorProto.UINT8: np.uint8,
+    TensorProto.UINT16: np.uint16,
+    TensorProto.UINT32: np.uint32,
+    TensorProto.UINT64: np.uint64,
+    TensorProto.BOOL: np.bool_,
+}
+
+
+class ExternalDataFiles:
+    """
+    Memory maps of the files with the external data of the ONNX model tensors. Every file is mapped once and the
+    tensor values are numpy views of the maps, so the tensors data is not read to the memory until it is used. The
+    files are mapped copy-on-write: the transformations may modify the values in place, the modified pages are copied
+    to the memory and the files are not changed.
+    """
+
+    def __init__(self, base_dir: str):
+        self.base_dir = base_dir
+        self.maps = {}
+
+    def __deepcopy__(self, memo):
+        # the graph attributes are copied to the sub-graphs which share the maps with the main graph
+        return self
+
+    def __reduce__(self):
+        # the maps are not pickled, the files are mapped again when the values are requested after the unpickling
+        return ExternalDataFiles, (self.base_dir,)
+
+    def get_map(self, location: str):
+        path = os.path.join(self.base_dir, location)
+        if path not in self.maps:
+            with open(path, 'rb') as f:
+                self.maps[path] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        return self.maps[path]
+
+
+def external_data_info(tensor):
+    info = {entry.key: entry.value for entry in tensor.external_data}
+    return info['location'], int(info.get('offset') or 0), int(info['length']) if info.get('length') else None
+
+
+def tensor_to_array(tensor, external_data: ExternalDataFiles = None):
+    """
+    Converts the ONNX tensor to the numpy array. The values stored in the raw_data and in the external data files are
+    not copied: the array is the read-only view of the raw_data bytes or the copy-on-write view of the memory map of
+    the external data file.
+
+    :param tensor: the TensorProto message
+    :param external_data: the external data files of the model
+    :return: the numpy array
+    """
+    if tensor.data_location != TensorProto.EXTERNAL:
+        return to_array(tensor)
+
+    if external_data is None:
+        raise Error('The values of the tensor "{}" are stored in the external data file which is not available',
+                    tensor.name)
+    location, offset, length = external_data_info(tensor)
+    if tensor.data_type not in EXTERNAL_DATA_TYPES:
+        # the special data types are converted by ONNX which reads the external data to the memory
+        return to_array(tensor, external_data.base_dir)
+
+    dtype = np.dtype(EXTERNAL_DATA_TYPES[tensor.data_type]).newbyteorder('<')
+    shape = tuple(tensor.dims)
+    count = int(np.prod(shape, dtype=np.int64))
+    if length is not None and length != count * dtype.itemsize:
+        raise Error('The external data length {} of the tensor "{}" does not match its shape {} and type {}', length,
+                    tensor.name, shape, dtype)
+    if count == 0:
+        return np.zeros(shape, dtype=dtype.newbyteorder('='))
+    try:
+        value = np.frombuffer(external_data.get_map(location), dtype=dtype, count=count, offset=offset)
+    except (OSError, ValueError) as e:
+        raise Error('Cannot read the values of the tensor "{}" from the external data file "{}". Details: {}',
+                    tensor.name, location, str(e)) from e
+    if sys.byteorder == 'big':
+        value = value.astype(dtype.newbyteorder('='))
+    return value.reshape(shape)
+
 
 def load_onnx_model(file_name: str):
+    """
+    Reads the ONNX model without the external data. The external data is memory mapped later when the tensor values
+    are extracted, so the models exceeding the 2GB limit of the protobuf message are supported.
+    """
     try:
-        onnx_model = onnx.load(file_name)
+        onnx_model = onnx.load(file_name, load_external_data=False)
     except Exception as e:
         raise FrameworkError(
             'Cannot read the model file: "{}" is incorrect ONNX model file. Details: {}',
@@ -0,0 +1,99 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+
+import numpy as np
+from onnx import TensorProto
+from onnx.numpy_helper import from_array
+
+from extensions.front.pass_separator import FrontFinish
+from mo.front.onnx.loader import ExternalDataFiles, tensor_to_array
+from mo.graph.graph import Node
+from mo.utils.checkpoint import load_checkpoint, save_checkpoint
+from mo.utils.error import Error
+from mo.utils.unittest.graph import build_graph
+
+
+def external_tensor(name: str, value: np.ndarray, location: str, offset: int):
+    tensor = from_array(value, name)
+    tensor.ClearField('raw_data')
+    tensor.data_location = TensorProto.EXTERNAL
+    for key, entry_value in [('location', location), ('offset', str(offset)), ('length', str(value.nbytes))]:
+        entry = tensor.external_data.add()
+        entry.key = key
+        entry.value = entry_value
+    return tensor
+
+
+class TensorToArrayTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.weights = np.arange(12, dtype=np.float32).reshape([3, 4])
+        self.bias = np.array([1, -1], dtype=np.int64)
+        with open(os.path.join(self.tmp_dir.name, 'weights.bin'), 'wb') as f:
+            f.write(self.weights.astype('<f4').tobytes())
+            f.write(self.bias.astype('<i8').tobytes())
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_raw_data(self):
+        value = tensor_to_array(from_array(self.weights, 'weights'))
+        self.assertTrue(np.array_equal(value, self.weights))
+
+    def test_external_data(self):
+        external_data = ExternalDataFiles(self.tmp_dir.name)
+        weights = tensor_to_array(external_tensor('weights', self.weights, 'weights.bin', 0), external_data)
+        bias = tensor_to_array(external_tensor('bias', self.bias, 'weights.bin', self.weights.nbytes), external_data)
+        self.assertTrue(np.array_equal(weights, self.weights))
+        self.assertTrue(np.array_equal(bias, self.bias))
+        self.assertEqual(bias.dtype, np.int64)
+        # the values are the views of the single memory map of the file
+        self.assertEqual(len(external_data.maps), 1)
+
+        # the values are modified in place without changes of the file
+        weights[0, 0] = 100
+        with open(os.path.join(self.tmp_dir.name, 'weights.bin'), 'rb') as f:
+            self.assertEqual(np.frombuffer(f.read(4), dtype='<f4')[0], 0)
+        self.assertEqual(tensor_to_array(external_tensor('weights', self.weights, 'weights.bin', 0),
+                                         ExternalDataFiles(self.tmp_dir.name))[0, 0], 0)
+
+    def test_external_data_length_mismatch(self):
+        tensor = external_tensor('weights', self.weights, 'weights.bin', 0)
+        tensor.dims[0] = 4
+        self.assertRaises(Error, tensor_to_array, tensor, ExternalDataFiles(self.tmp_dir.name))
+
+    def test_checkpoint(self):
+        external_data = ExternalDataFiles(self.tmp_dir.name)
+        weights = tensor_to_array(external_tensor('weights', self.weights, 'weights.bin', 0), external_data)
+        graph = build_graph({'weights': {'kind': 'op', 'op': 'Const', 'value': weights}}, [])
+        graph.graph['onnx_external_data'] = external_data
+        checkpoint_dir = os.path.join(self.tmp_dir.name, 'model_front.checkpoint')
+        save_checkpoint(graph, checkpoint_dir, 'front')
+
+        loaded, _ = load_checkpoint(checkpoint_dir, Namespace(), [FrontFinish])
+        self.assertTrue(np.array_equal(Node(loaded, 'weights').value, self.weights))
+        # the files are mapped again by the resumed conversion
+        loaded_external_data = loaded.graph['onnx_external_data']
+        self.assertEqual(loaded_external_data.base_dir, self.tmp_dir.name)
+        self.assertDictEqual(loaded_external_data.maps, {})
+        bias = tensor_to_array(external_tensor('bias', self.bias, 'weights.bin', self.weights.nbytes),
+                               loaded_external_data)
+        self.assertTrue(np.array_equal(bias, self.bias))
@@ -173,7 +173,7 @@ class SubgraphMatcher(object):
 
         for list_nodes in inputs_order:
             for node_name_pattern, port in list_nodes:
-                if len(find_object_by_pattern(graph.nodes(), '.*' + node_name_pattern)) == 0:
+                if len(nodes_matching_name_pattern(graph, '.*' + node_name_pattern)) == 0:
                     log.info('Node "{} does not exist in the graph". Failed to match sub-graph by scope "{}".'.format(
                         node_name_pattern, self.replacement_desc.id))
                     return None
@@ -96,3 +96,21 @@ def tf_op_extractor(node: Node, lowered_keys_map: dict):
     new_attrs.update(result)
     result = new_attrs
     return supported, result
+
+
+def tf_extraction_key(node: Node, lowered_keys_map: dict):
+    """
+    Returns the key of the node definition for the extraction cache: the operation type, the attributes and the number
+    of data and control flow inputs without the node name and the inputs names. None is returned for the nodes which
+    attributes cannot be cached. The common fields of the cached node are set here because the extractor is not called
+    for it.
+    """
+    if (node.has('op') and node.op == 'TFCustomSubgraphCall') or not node.has_valid('pb'):
+        return None
+    pb = node.pb
+    op = lowered_keys_map.get(pb.op.lower())
+    if op is None or not getattr(tf_op_extractors[op], 'cacheable', False):
+        return None
+    node.graph.node[node.id].update(common_tf_fields(node))
+    return (pb.op, tuple(name.startswith('^') for name in pb.input),
+            tuple(sorted((name, value.SerializeToString()) for name, value in pb.attr.items())))
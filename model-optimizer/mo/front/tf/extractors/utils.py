@@ -69,6 +69,7 @@ def tf_tensor_content(tf_dtype, shape, pb_tensor):
                     refer_to_faq_msg(50), tf_dtype)
 
     if pb_tensor.tensor_content:
+        # the view of the tensor content is read-only, the value is copied because the transformations modify it
         value = np.array(np.frombuffer(pb_tensor.tensor_content, type_helper[0]))
     else:
         # load typed value
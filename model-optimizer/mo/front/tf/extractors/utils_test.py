@@ -60,6 +60,12 @@ class TensorContentParsing(unittest.TestCase):
         res = tf_tensor_content(tf_dtype, shape, pb_tensor)
         self.assertTrue(np.all(res == ref))
 
+    def test_tensor_content_is_writable(self):
+        pb_tensor = PB(dict(dtype=3, tensor_content=b'\x01\x00\x00\x00\xff\xff\xff\xff'))
+        res = tf_tensor_content(pb_tensor.dtype, np.array([2]), pb_tensor)
+        res[res == -1] = 2
+        self.assertListEqual(list(res), [1, 2])
+
     def test_list_type_no_shape(self):
         pb_tensor = PB({
             'dtype': 3,
@@ -16,6 +16,8 @@
 
 import unittest
 
+import numpy as np
+
 from mo.graph.graph import Node, Graph
 from mo.utils.ir_engine.compare_graphs import compare_graphs
 from mo.utils.unittest.graph import build_graph, regular_op
@@ -632,3 +634,14 @@ class TestsMiddle(unittest.TestCase):
         (flag, resp) = compare_graphs(graph, graph_ref, 'Op2', check_op_attrs=True)
         self.assertTrue(flag, resp)
         self.check_graph_attrs_middle(graph, graph_ref)
+
+    def test_set_source_copies_value(self):
+        graph = build_graph(nodes, [('input', 'input_data'), ('input_data', 'Op1'), ('NewOp', 'NewOp_data')],
+                            {'input_data': {'value': np.array([1, -1])}})
+
+        Node(graph, 'Op1').in_port(0).get_connection().set_source(Node(graph, 'NewOp').out_port(0))
+
+        # the value of the new source data node is modified independently
+        new_value = Node(graph, 'Op1').in_node(0).value
+        new_value[new_value == -1] = 2
+        self.assertListEqual(list(Node(graph, 'input_data').value), [1, -1])
@@ -15,6 +15,7 @@
 """
 import collections
 import logging as log
+import re
 from copy import deepcopy
 from typing import List
 
@@ -22,17 +23,37 @@ import networkx as nx
 import numpy as np
 
 from mo.graph.port import Port
+from mo.graph.scope_index import ScopeIndex
+from mo.graph.traversal import dfs_postorder, successors
 from mo.middle.passes.eliminate import mark_output_reachable_nodes, shape_inference, mark_undead_nodes, \
-    mark_const_producer_nodes, eliminate_dead_nodes, add_constant_operations
+    mark_const_producer_nodes, eliminate_dead_nodes, add_constant_operations, incremental_clean_up
 from mo.utils.error import Error
 from mo.utils.utils import refer_to_faq_msg, deprecated_api, shrink_str_value
 
 
 def dict_to_ordered_dict(d: dict, func=lambda t: t):
+    if len(d) < 2:
+        return collections.OrderedDict(d)
     return collections.OrderedDict(sorted(d.items(), key=lambda t: func(t[0])))
 
 
+def track_need_shape_inference(graph, node_id, value):
+    """
+    Keeps the set of nodes marked with the 'need_shape_inference' attribute up to date so the shape_inference function
+    visits them without scanning the whole graph.
+    """
+    candidates = getattr(graph, 'shape_inference_candidates', None)
+    if candidates is None:
+        return
+    if value:
+        candidates[node_id] = None
+    else:
+        candidates.pop(node_id, None)
+
+
 class Node:
+    __slots__ = ('graph', 'node', 'id')
+
     def __init__(self, graph, node: str):
         assert node in graph, "Attempt to access node {} that not in graph".format(node)
 
@@ -55,17 +76,21 @@ class Node:
             raise AttributeError("Attribute 'version' cannot be updated in {} node".format(self.name))
 
         attrs[k] = v
+        if k == 'need_shape_inference':
+            track_need_shape_inference(self.graph, self.node, v)
 
     def __getattr__(self, k):
-        return self.graph.node[self.node][k]
+        return self.graph._node[self.id][k]
 
     def __getitem__(self, k):
-        return self.graph.node[self.node][k]
+        return self.graph._node[self.id][k]
 
     def __setitem__(self, k, v):
         if k == 'version' and self.graph.node[self.node].get(k, v) != v:
             raise AttributeError("Attribute 'version' cannot be updated in {} node".format(self.name))
         self.graph.node[self.node][k] = v
+        if k == 'need_shape_inference':
+            track_need_shape_inference(self.graph, self.node, v)
 
     def __contains__(self, k):
         return self.has(k)
@@ -82,6 +107,8 @@ class Node:
 
     def __delitem__(self, k):
         del self.graph.node[self.node][k]
+        if k == 'need_shape_inference':
+            track_need_shape_inference(self.graph, self.node, False)
 
     def add_input_port(self, idx, skip_if_exist=False, **kwargs):
         if not self.has_valid('_in_ports'):
@@ -197,10 +224,11 @@ class Node:
         return self.graph.node[self.node]
 
     def has(self, k):
-        return k in self.graph.node[self.node]
+        return k in self.graph._node[self.id]
 
     def has_valid(self, k):
-        return self.has(k) and not self.graph.node[self.node][k] is None
+        attrs = self.graph._node[self.id]
+        return k in attrs and attrs[k] is not None
 
     def has_and_set(self, k):
         return self.has_valid(k) and self[k]
@@ -210,12 +238,12 @@ class Node:
                                      self.get_inputs(control_flow=control_flow)})
 
     def in_nodes(self, control_flow: bool = False):
-        assert self.has('kind')  # TODO: remove as it always exists
-        assert self.kind in ['op', 'data']  # TODO: remove as it always exists
-        if self.kind == 'op':
-            return dict_to_ordered_dict({x[1]['in']: Node(self.graph, x[0]) for x in
+        kind = self.graph._node[self.id].get('kind')
+        assert kind in ['op', 'data']
+        if kind == 'op':
+            return dict_to_ordered_dict({d['in']: Node(self.graph, n) for n, d in
                                          self.get_inputs(control_flow=control_flow)})
-        elif self.kind == 'data':
+        else:
             return [Node(self.graph, n) for n, d in self.get_inputs(control_flow=control_flow)]
 
     def in_node(self, key=0, control_flow: bool = False):
@@ -234,12 +262,12 @@ class Node:
                                      self.get_outputs(control_flow=control_flow)})
 
     def out_nodes(self, control_flow: bool = False):
-        assert self.has('kind')
-        assert self.kind in ['op', 'data']
-        if self.kind == 'op':
-            return dict_to_ordered_dict({x[1]['out']: Node(self.graph, x[0]) for x in
+        kind = self.graph._node[self.id].get('kind')
+        assert kind in ['op', 'data']
+        if kind == 'op':
+            return dict_to_ordered_dict({d['out']: Node(self.graph, n) for n, d in
                                          self.get_outputs(control_flow=control_flow)})
-        elif self.kind == 'data':
+        else:
             return [Node(self.graph, n) for n, d in self.get_outputs(control_flow=control_flow)]
 
     def out_edges(self, control_flow: bool = False):
@@ -263,22 +291,20 @@ class Node:
         return self.graph.node[self.node]
 
     def get_inputs(self, edge_attr: dict = None, control_flow: bool = False):
-        if edge_attr is None:
-            edge_attr = {}
-        in_edges = self.graph.in_edges(self.id, data=True)
+        in_edges = self.graph.get_in_edges_data(self.id)
         if not control_flow:
-            in_edges = [(u, v, d) for u, v, d in in_edges if 'control_flow_edge' not in d or not d['control_flow_edge']]
-        return [(u, d) for u, v, d in in_edges if all([attr in d and d[attr] == edge_attr[attr] for attr in edge_attr])]
+            in_edges = [(u, d) for u, d in in_edges if not d.get('control_flow_edge')]
+        if not edge_attr:
+            return list(in_edges)
+        return [(u, d) for u, d in in_edges if all(attr in d and d[attr] == edge_attr[attr] for attr in edge_attr)]
 
     def get_outputs(self, edge_attr: dict = None, control_flow: bool = False):
-        if edge_attr is None:
-            edge_attr = {}
-        out_edges = self.graph.out_edges(self.id, data=True)
+        out_edges = self.graph.get_out_edges_data(self.id)
         if not control_flow:
-            out_edges = [(u, v, d) for u, v, d in out_edges if
-                         'control_flow_edge' not in d or not d['control_flow_edge']]
-        return [(v, d) for u, v, d in out_edges if
-                all([attr in d and d[attr] == edge_attr[attr] for attr in edge_attr])]
+            out_edges = [(v, d) for v, d in out_edges if not d.get('control_flow_edge')]
+        if not edge_attr:
+            return list(out_edges)
+        return [(v, d) for v, d in out_edges if all(attr in d and d[attr] == edge_attr[attr] for attr in edge_attr)]
 
     def get_sorted_inputs(self, control_flow: bool = False):
         return sorted([x for x in self.get_inputs(control_flow=control_flow) if 'in' in x[1]],
@@ -313,13 +339,14 @@ class Node:
         return edges[0]
 
     def copy_node(self, new_attrs: dict = None, dst_graph=None):
-        ''' Copies node with all attributes (optionally updated) within the same graph or to different graph.'''
+        ''' Copies node with all attributes (optionally updated) within the same graph or to different graph.
+        The attributes from new_attrs are not copied from the node.'''
         if new_attrs is None:
             new_attrs = {}
         if dst_graph is None:
             dst_graph = self.graph
 
-        attrs = deepcopy(self.attrs())
+        attrs = deepcopy({k: v for k, v in self.attrs().items() if k not in new_attrs})
         new_id = dst_graph.unique_id(attrs['name']) if 'name' in attrs else dst_graph.unique_id()
         attrs['name'] = new_id
         attrs.update(new_attrs)
@@ -563,15 +590,269 @@ class Node:
         return self.soft_get('version', 'extension')
 
 
+# node attributes indexed by the graph to answer get_nodes_with_attributes queries without scanning all the nodes
+INDEXED_NODE_ATTRS = ('kind', 'op', 'type')
+
+# the tracker of nodes changed since the previous clean-up of the graph
+CLEAN_UP_TRACKER = 'clean_up'
+# the graph attribute with the undead node types of the previous clean-up
+CLEAN_UP_UNDEAD_TYPES_ATTR = 'clean_up_undead_node_types'
+
+
+class NodeAttrsDict(dict):
+    """
+    Dictionary with node attributes which reports updates of the indexed attributes to the graph nodes dictionary.
+    """
+    __slots__ = ('owner', 'node_id')
+
+    def __init__(self, *args, **kwargs):
+        self.owner = None
+        self.node_id = None
+        super().__init__(*args, **kwargs)
+
+    def __reduce__(self):
+        # copies and pickles are plain dictionaries which are bound to a graph when they are added to it
+        return dict, (dict(self),)
+
+    def __setitem__(self, k, v):
+        owner = self.owner
+        if owner is not None and owner.trackers:
+            for touched in owner.trackers.values():
+                touched.add(self.node_id)
+        if owner is not None and k in INDEXED_NODE_ATTRS:
+            owner.unindex_attr(self.node_id, k, self.get(k))
+            super().__setitem__(k, v)
+            owner.index_attr(self.node_id, k, v)
+        else:
+            super().__setitem__(k, v)
+
+    def __delitem__(self, k):
+        owner = self.owner
+        if owner is not None and owner.trackers:
+            for touched in owner.trackers.values():
+                touched.add(self.node_id)
+        if owner is not None and k in INDEXED_NODE_ATTRS and k in self:
+            owner.unindex_attr(self.node_id, k, self[k])
+        super().__delitem__(k)
+
+    def update(self, *args, **kwargs):
+        if self.owner is None:
+            super().update(*args, **kwargs)
+        else:
+            for k, v in dict(*args, **kwargs).items():
+                self[k] = v
+
+    def setdefault(self, k, default=None):
+        if k not in self:
+            self[k] = default
+        return self[k]
+
+    def pop(self, k, *args):
+        if k in self:
+            value = self[k]
+            del self[k]
+            return value
+        return super().pop(k, *args)
+
+    def popitem(self):
+        k, v = super().popitem()
+        if self.owner is not None:
+            self.owner.touch(self.node_id)
+            if k in INDEXED_NODE_ATTRS:
+                self.owner.unindex_attr(self.node_id, k, v)
+        return k, v
+
+    def clear(self):
+        for k in INDEXED_NODE_ATTRS:
+            if k in self:
+                del self[k]
+        if self.owner is not None:
+            self.owner.touch(self.node_id)
+        super().clear()
+
+
+class IndexedNodesDict(dict):
+    """
+    Dictionary of graph nodes (node id -> attributes dictionary) which maintains the index of INDEXED_NODE_ATTRS
+    values. The index is a dictionary: attribute name -> attribute value -> set of node ids.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.attr_index = {k: {} for k in INDEXED_NODE_ATTRS}
+        # node id -> sequence number of the node addition, used to return nodes in the graph order
+        self.position = {}
+        self.unhashable = {k: set() for k in INDEXED_NODE_ATTRS}
+        self.counter = 0
+        # the index of the node ids scopes which is built on the first query
+        self.scope_index = None
+        # tracker name -> ids of nodes which attributes or edges were changed since the tracker was started
+        self.trackers = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # copies and pickles are cleaned up incrementally as the original graph, other trackers are not kept
+        state = {'trackers': {CLEAN_UP_TRACKER: set(self.trackers[CLEAN_UP_TRACKER])}} \
+            if CLEAN_UP_TRACKER in self.trackers else None
+        return self.__class__, (), state, None, iter(self.items())
+
+    def touch(self, *node_ids):
+        for touched in self.trackers.values():
+            touched.update(node_ids)
+
+    def index_attr(self, node_id, k, v):
+        try:
+            self.attr_index[k].setdefault(v, set()).add(node_id)
+        except TypeError:
+            self.unhashable[k].add(node_id)
+
+    def unindex_attr(self, node_id, k, v):
+        try:
+            nodes = self.attr_index[k].get(v)
+        except TypeError:
+            self.unhashable[k].discard(node_id)
+            return
+        if nodes is not None:
+            nodes.discard(node_id)
+            if len(nodes) == 0:
+                del self.attr_index[k][v]
+
+    def _unbind(self, node_id):
+        attrs = super().__getitem__(node_id)
+        for k in INDEXED_NODE_ATTRS:
+            if k in attrs:
+                self.unindex_attr(node_id, k, attrs[k])
+        if attrs.owner is self:
+            attrs.owner = None
+        del self.position[node_id]
+
+    def __setitem__(self, node_id, attrs):
+        if node_id in self:
+            self._unbind(node_id)
+        elif self.scope_index is not None:
+            if isinstance(node_id, str):
+                self.scope_index.add(node_id)
+            else:
+                self.scope_index = None
+        if not isinstance(attrs, NodeAttrsDict):
+            attrs = NodeAttrsDict(attrs)
+        attrs.owner = self
+        attrs.node_id = node_id
+        super().__setitem__(node_id, attrs)
+        self.touch(node_id)
+        self.position[node_id] = self.counter
+        self.counter += 1
+        for k in INDEXED_NODE_ATTRS:
+            if k in attrs:
+                self.index_attr(node_id, k, attrs[k])
+
+    def __delitem__(self, node_id):
+        self._unbind(node_id)
+        super().__delitem__(node_id)
+        if self.scope_index is not None:
+            self.scope_index.remove(node_id)
+
+    def update(self, *args, **kwargs):
+        for node_id, attrs in dict(*args, **kwargs).items():
+            self[node_id] = attrs
+
+    def setdefault(self, node_id, default=None):
+        if node_id not in self:
+            self[node_id] = {} if default is None else default
+        return self[node_id]
+
+    def pop(self, node_id, *args):
+        if node_id in self:
+            attrs = self[node_id]
+            del self[node_id]
+            return attrs
+        return super().pop(node_id, *args)
+
+    def popitem(self):
+        node_id = next(reversed(self.keys()))
+        return node_id, self.pop(node_id)
+
+    def clear(self):
+        for attrs in self.values():
+            attrs.owner = None
+        super().clear()
+        self.attr_index = {k: {} for k in INDEXED_NODE_ATTRS}
+        self.unhashable = {k: set() for k in INDEXED_NODE_ATTRS}
+        self.position = {}
+        self.scope_index = None
+
+    def name_candidates(self, pattern: str):
+        """
+        Returns the set of node ids which includes all node ids matching the regular expression or None if the query
+        can not be answered from the scope index.
+        """
+        if self.scope_index is None:
+            if not all(isinstance(node_id, str) for node_id in self):
+                return None
+            self.scope_index = ScopeIndex(self)
+        return self.scope_index.candidates(pattern)
+
+    def candidates(self, attrs: dict):
+        """
+        Returns the smallest set of node ids which includes all nodes having the specified values of the indexed
+        attributes or None if the query can not be answered from the index.
+        """
+        candidates = None
+        for k, v in attrs.items():
+            if k not in INDEXED_NODE_ATTRS:
+                continue
+            try:
+                nodes = self.attr_index[k].get(v, set())
+            except TypeError:
+                return None
+            if len(self.unhashable[k]) != 0:
+                nodes = nodes | self.unhashable[k]
+            if candidates is None or len(nodes) < len(candidates):
+                candidates = nodes
+        return candidates
+
+    def nodes_with_attributes(self, attrs: dict):
+        """
+        Returns node ids having all specified attributes with specified values in the order of nodes in the graph or
+        None if the query can not be answered from the index.
+        """
+        candidates = self.candidates(attrs)
+        if candidates is None:
+            return None
+        result = []
+        for node_id in candidates:
+            node_attrs = super().__getitem__(node_id)
+            if all(a in node_attrs.items() for a in attrs.items()):
+                result.append(node_id)
+        if len(result) > 1:
+            position = self.position
+            result.sort(key=lambda n: position[n])
+        return result
+
+
 class Graph(nx.MultiDiGraph):
+    node_dict_factory = IndexedNodesDict
+    node_attr_dict_factory = NodeAttrsDict
+
     def __init__(self, data=None, **attr):
         self.stage = None
         self.strict_mode = True
+        # nodes marked with the 'need_shape_inference' attribute, the dict is used as an insertion-ordered set
+        self.shape_inference_candidates = {}
+        # node id -> list of (node id, edge attributes) tuples for input and output edges of the node, an entry is
+        # removed when edges of the node are added or removed
+        self.in_edges_cache = {}
+        self.out_edges_cache = {}
         super().__init__(data, **attr)
 
         if not hasattr(self, 'node'):
             self.node = self.nodes
 
+        if data is not None:
+            for node_id, attrs in self.nodes(data=True):
+                if attrs.get('need_shape_inference'):
+                    self.shape_inference_candidates[node_id] = None
+
     unique_id_count = 0
 
     # SAFE API DESCRIPTION
@@ -583,6 +864,21 @@ class Graph(nx.MultiDiGraph):
         super().add_node(node_for_adding, **attrs)
         node = Node(self, node_for_adding)
         node.update_node()
+        if self._node[node_for_adding].get('need_shape_inference'):
+            self.shape_inference_candidates[node_for_adding] = None
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        nodes_for_adding = list(nodes_for_adding)
+        super().add_nodes_from(nodes_for_adding, **attr)
+        for n in nodes_for_adding:
+            try:
+                attrs = self._node[n]
+            except TypeError:
+                # the item is a (node, attributes dict) tuple
+                n = n[0]
+                attrs = self._node[n]
+            if attrs.get('need_shape_inference'):
+                self.shape_inference_candidates[n] = None
 
     def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
 
@@ -617,6 +913,9 @@ class Graph(nx.MultiDiGraph):
                     assert unode.has_port('out', attr['out']), "{} Node {} has no out port ({})" \
                                                                "".format(message, unode.name, attr['out'])
 
+        self.in_edges_cache.pop(v_for_edge, None)
+        self.out_edges_cache.pop(u_for_edge, None)
+        self.touch(u_for_edge, v_for_edge)
         return super().add_edge(u_for_edge, v_for_edge, key=key, **attr)
 
     def add_edges_from(self, ebunch_to_add, **attr):
@@ -638,8 +937,95 @@ class Graph(nx.MultiDiGraph):
             self.add_edge(u, v, key=key, **ddd)
 
     def remove_edge(self, u, v, key=None):
+        self.in_edges_cache.pop(v, None)
+        self.out_edges_cache.pop(u, None)
+        self.touch(u, v)
         return super().remove_edge(u, v, key=key)
 
+    def _reset_edges_cache(self, node_id):
+        for u in self._pred[node_id]:
+            self.out_edges_cache.pop(u, None)
+            self.touch(u)
+        for v in self._succ[node_id]:
+            self.in_edges_cache.pop(v, None)
+            self.touch(v)
+        self.in_edges_cache.pop(node_id, None)
+        self.out_edges_cache.pop(node_id, None)
+
+    def remove_node(self, n):
+        if n in self._succ:
+            self._reset_edges_cache(n)
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        nodes = list(nodes)
+        for n in nodes:
+            if n in self._succ:
+                self._reset_edges_cache(n)
+        super().remove_nodes_from(nodes)
+
+    def clear(self):
+        self.in_edges_cache = {}
+        self.out_edges_cache = {}
+        super().clear()
+
+    def clear_edges(self):
+        self.in_edges_cache = {}
+        self.out_edges_cache = {}
+        self.touch(*self.nodes())
+        super().clear_edges()
+
+    def touch(self, *node_ids):
+        """
+        Marks the nodes as changed if the changes of the graph are tracked
+        """
+        if isinstance(self._node, IndexedNodesDict):
+            self._node.touch(*node_ids)
+
+    def start_tracking_changes(self, tracker: str = 'default'):
+        """
+        Starts collecting ids of nodes which attributes or edges are changed. The nodes added to the graph are also
+        collected. Several trackers with different names collect the changes independently.
+        """
+        if isinstance(self._node, IndexedNodesDict):
+            self._node.trackers[tracker] = set()
+
+    def stop_tracking_changes(self, tracker: str = 'default'):
+        """
+        Stops collecting the changed nodes.
+        :return: the set of ids of changed nodes which are in the graph or None if the changes were not tracked.
+        """
+        touched = getattr(self._node, 'trackers', {}).pop(tracker, None)
+        if touched is None:
+            return None
+        return {node_id for node_id in touched if node_id in self._node}
+
+    def get_in_edges_data(self, node_id):
+        """
+        Returns the list of (source node id, edge attributes) tuples for input edges of the node in the same order as
+        in_edges(node_id, data=True) does. The list is cached until edges of the node change and must not be modified.
+        """
+        edges = self.in_edges_cache.get(node_id)
+        if edges is None:
+            edges = [(u, d) for u, key_dict in self._pred[node_id].items() for d in key_dict.values()]
+            if not getattr(self, 'frozen', False):
+                # views of the graph are not notified about changes of the original graph
+                self.in_edges_cache[node_id] = edges
+        return edges
+
+    def get_out_edges_data(self, node_id):
+        """
+        Returns the list of (destination node id, edge attributes) tuples for output edges of the node in the same
+        order as out_edges(node_id, data=True) does. The list is cached until edges of the node change and must not be
+        modified.
+        """
+        edges = self.out_edges_cache.get(node_id)
+        if edges is None:
+            edges = [(v, d) for v, key_dict in self._succ[node_id].items() for d in key_dict.values()]
+            if not getattr(self, 'frozen', False):
+                self.out_edges_cache[node_id] = edges
+        return edges
+
     def erase_node(self, node: Node):
         """
         Erases node from the graph and reconnect edges from input node(s) to output node(s)
@@ -725,13 +1111,49 @@ class Graph(nx.MultiDiGraph):
         If has_value = True, returns data nodes with value
         If has_value = False, returns data nodes without value
         """
-        data_nodes = [Node(self, node) for node in self.nodes() if Node(self, node).soft_get('kind') == 'data']
+        data_nodes = [Node(self, node) for node in self.get_nodes_with_attributes(kind='data')]
         return [node for node in data_nodes if has_value is None or node.has_valid('value') == has_value]
 
     def get_nodes_with_attributes(self, **attrs: dict):
+        if isinstance(self._node, IndexedNodesDict):
+            nodes = self._node.nodes_with_attributes(attrs)
+            if nodes is not None:
+                return nodes
         node_attrs = self.nodes(data=True)
         return [n for n, d in node_attrs if all(a in d.items() for a in attrs.items())]
 
+    def estimate_nodes_with_attributes_count(self, **attrs: dict):
+        """
+        Returns the upper bound of the number of nodes get_nodes_with_attributes returns for the same attributes
+        without checking the nodes. The number of nodes in the graph is returned if the index can not be used.
+        """
+        if isinstance(self._node, IndexedNodesDict):
+            candidates = self._node.candidates(attrs)
+            if candidates is not None:
+                return len(candidates)
+        return self.number_of_nodes()
+
+    def get_nodes_matching_name_pattern(self, pattern: str):
+        """
+        Returns the ids of nodes matching the regular expression in the order of nodes in the graph. The regular
+        expression is matched only with the nodes selected by the scope index if the pattern starts with a literal.
+        """
+        compiled_pattern = re.compile(pattern)
+        candidates = self._node.name_candidates(pattern) if isinstance(self._node, IndexedNodesDict) else None
+        if candidates is None:
+            return [node_id for node_id in self.nodes() if compiled_pattern.match(node_id)]
+        position = self._node.position
+        return sorted([node_id for node_id in candidates if compiled_pattern.match(node_id)],
+                      key=lambda n: position[n])
+
+    def get_nodes_positions(self):
+        """
+        Returns the dictionary mapping node id to the increasing number according to the order of nodes in the graph.
+        """
+        if isinstance(self._node, IndexedNodesDict):
+            return self._node.position
+        return {node: i for i, node in enumerate(self.nodes())}
+
     def unique_id(self, prefix: str = ""):
         """
         Generates a unique node id for a new node in a given graph.
@@ -751,15 +1173,25 @@ class Graph(nx.MultiDiGraph):
                 "Graph contains {} node after executing {}. It considered as error because resulting IR will be "
                 "empty which is not usual".format(len(self.nodes()), description))
 
-    def check_shapes_consistency(self):
-        data_nodes = self.get_data_nodes()
+    def check_shapes_consistency(self, node_ids: set = None):
+        """
+        Checks that data nodes have shapes of the correct type.
+        :param node_ids: ids of nodes to check the data nodes from. All data nodes are checked if it is not specified.
+        """
+        if node_ids is None:
+            data_nodes = self.get_nodes_with_attributes(kind='data')
+        else:
+            position = self.get_nodes_positions()
+            data_nodes = [node_id for node_id in sorted(node_ids, key=lambda n: position[n])
+                          if self.node[node_id].get('kind') == 'data']
         data_nodes_with_wrong_shapes = []
-        for data_node in data_nodes:
-            if not data_node.has('shape'):
-                data_nodes_with_wrong_shapes.append((data_node.name, "no shape attribute"))
+        for node_id in data_nodes:
+            attrs = self.node[node_id]
+            if 'shape' not in attrs:
+                data_nodes_with_wrong_shapes.append((Node(self, node_id).name, "no shape attribute"))
                 continue
-            if data_node.shape is not None and not isinstance(data_node.shape, np.ndarray):
-                data_nodes_with_wrong_shapes.append((data_node.name, type(data_node.shape)))
+            if attrs['shape'] is not None and not isinstance(attrs['shape'], np.ndarray):
+                data_nodes_with_wrong_shapes.append((Node(self, node_id).name, type(attrs['shape'])))
         if len(data_nodes_with_wrong_shapes) > 0:
             raise Error("Graph contains data nodes ({}) with inconsistent shapes: {}".format(
                 len(data_nodes_with_wrong_shapes),
@@ -951,22 +1383,7 @@ class Graph(nx.MultiDiGraph):
         :param visited: set of already visited nodes.
         :return: list of nodes in the DFS-visit order.
         """
-        order = []
-        stack = [node_name]
-        while len(stack) != 0:
-            node_name = stack[0]
-            stack.pop(0)
-            visited.add(node_name)
-            has_child = False
-            for _, out_node_name in self.out_edges(node_name):
-                if out_node_name not in visited:
-                    stack.insert(0, node_name)
-                    stack.insert(0, out_node_name)
-                    has_child = True
-                    break
-            if not has_child:
-                order.append(node_name)
-        return order
+        return dfs_postorder([node_name], successors(self), visited)
 
     def pseudo_topological_sort(self, reverse: bool = False):
         """
@@ -976,15 +1393,9 @@ class Graph(nx.MultiDiGraph):
         :param reverse: flag indicating whether need to reverse nodes order.
         :return: nodes in the topological sort if cycle doesn't exist and in pseudo-topological sort if not.
         """
-        nodes_without_inputs = list()
-        for node_name in self.nodes():
-            if len(self.in_edges(node_name)) == 0:
-                nodes_without_inputs.append(node_name)
-        order = list()
-        visited = set()
-        for node_name in nodes_without_inputs:
-            if node_name not in visited:
-                order.extend(self.dfs(node_name, visited))
+        # the nodes without inputs are not reachable from other nodes, so every node starts the new search
+        nodes_without_inputs = [node_name for node_name, in_degree in self.in_degree() if in_degree == 0]
+        order = dfs_postorder(nodes_without_inputs, successors(self))
 
         order = [Node(self, node) for node in order]
 
@@ -993,20 +1404,46 @@ class Graph(nx.MultiDiGraph):
         else:
             return list(reversed(order))
 
-    def clean_up(self, undead_node_types: list = None):
+    def clean_up(self, undead_node_types: list = None, full: bool = False):
+        """
+        Removes dead nodes and creates Const operations for the constant data nodes. The graph tracks the nodes changed
+        since the previous clean-up, so only them and the nodes depending on them are checked. All the nodes are
+        checked by the first clean-up of the graph, if the 'full' is set or the --full_clean_up option is specified.
+        The unchanged nodes may become dead if the undead node types differ from the previous clean-up, for example
+        when the static_shape parameter is changed, so all the nodes are checked in this case too.
+        :param undead_node_types: list of node types that should survive the elimination.
+        :param full: check all the nodes of the graph.
+        """
         if undead_node_types is None:
             undead_node_types = []
 
         if not getattr(self.graph['cmd_params'], 'static_shape', False):
             undead_node_types.extend(['ShapeOf', 'Shape', 'slice_like'])
 
-        mark_output_reachable_nodes(self)
-        shape_inference(self)
-        mark_undead_nodes(self, undead_node_types)
-        mark_const_producer_nodes(self)
-        eliminate_dead_nodes(self)
+        changed = self.stop_tracking_changes(CLEAN_UP_TRACKER)
+        previous_undead_node_types = self.graph.get(CLEAN_UP_UNDEAD_TYPES_ATTR)
+        self.graph[CLEAN_UP_UNDEAD_TYPES_ATTR] = set(undead_node_types)
+        if changed is not None and not full and not getattr(self.graph['cmd_params'], 'full_clean_up', False) and \
+                previous_undead_node_types == self.graph[CLEAN_UP_UNDEAD_TYPES_ATTR]:
+            self.start_tracking_changes(CLEAN_UP_TRACKER)
+            data_nodes = incremental_clean_up(self, changed, undead_node_types)
+        else:
+            mark_output_reachable_nodes(self)
+            shape_inference(self)
+            mark_undead_nodes(self, undead_node_types)
+            mark_const_producer_nodes(self)
+            # the nodes left without consumers by the elimination are checked by the next clean-up
+            self.start_tracking_changes(CLEAN_UP_TRACKER)
+            eliminate_dead_nodes(self)
+            data_nodes = None
+
+        changed = self.stop_tracking_changes(CLEAN_UP_TRACKER)
         # Add Const op for constant data nodes
-        add_constant_operations(self)
+        const_data_nodes = add_constant_operations(self, data_nodes)
+        # the created Const operations and their data nodes need no checks by the next clean-up
+        self.start_tracking_changes(CLEAN_UP_TRACKER)
+        if changed is not None:
+            self.touch(*changed.difference(const_data_nodes))
 
 
 def fill_graph_with_nodes(graph, src_nodes, get_id: callable, get_attrs: callable):
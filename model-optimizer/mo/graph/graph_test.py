@@ -1628,3 +1628,150 @@ class TestDictIncludesCompareAttrs(unittest.TestCase):
     def test_regular_string(self):
         self.assertTrue(dict_includes_compare_attrs("abc", "abc"))
         self.assertFalse(dict_includes_compare_attrs("abc", "abd"))
+
+
+class TestNodesAttributesIndex(unittest.TestCase):
+    nodes = {
+        'input': {'kind': 'op', 'op': 'Parameter', 'type': 'Parameter'},
+        'input_data': {'kind': 'data', 'value': None, 'shape': None},
+        'relu': {'kind': 'op', 'op': 'ReLU', 'type': 'ReLU'},
+        'relu_data': {'kind': 'data', 'value': None, 'shape': None},
+        'output': {'kind': 'op', 'op': 'Result'},
+    }
+    edges = [('input', 'input_data'), ('input_data', 'relu'), ('relu', 'relu_data'), ('relu_data', 'output')]
+
+    @staticmethod
+    def scan(graph: Graph, **attrs):
+        return [n for n, d in graph.nodes(data=True) if all(a in d.items() for a in attrs.items())]
+
+    def check_index(self, graph: Graph):
+        for attrs in [dict(kind='op'), dict(kind='data'), dict(op='ReLU'), dict(type='ReLU'), dict(op='Result'),
+                      dict(kind='op', op='Parameter'), dict(kind='op', name='relu'), dict(op='Unknown')]:
+            self.assertListEqual(graph.get_nodes_with_attributes(**attrs), self.scan(graph, **attrs))
+
+    def test_build(self):
+        graph = build_graph(self.nodes, self.edges)
+        self.assertListEqual(graph.get_nodes_with_attributes(kind='data'), ['input_data', 'relu_data'])
+        self.check_index(graph)
+
+    def test_node_updates(self):
+        graph = build_graph(self.nodes, self.edges)
+        Node(graph, 'relu')['op'] = 'Result'
+        graph.node['input']['op'] = 'ReLU'
+        graph.node['output'].update({'type': 'ReLU'})
+        del graph.node['relu']['type']
+        self.assertListEqual(graph.get_nodes_with_attributes(op='Result'), ['relu', 'output'])
+        self.assertListEqual(graph.get_nodes_with_attributes(type='ReLU'), ['output'])
+        self.check_index(graph)
+
+    def test_add_remove_nodes(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph.remove_node('relu')
+        graph.add_node('relu', kind='op', op='ReLU', type='ReLU')
+        graph.add_nodes_from([('relu_2', {'kind': 'op', 'op': 'ReLU'})])
+        graph.remove_nodes_from(['input'])
+        self.assertListEqual(graph.get_op_nodes(op='ReLU'), [Node(graph, 'relu'), Node(graph, 'relu_2')])
+        self.check_index(graph)
+
+    def test_copies(self):
+        from copy import deepcopy
+        graph = build_graph(self.nodes, self.edges)
+        for graph_copy in [graph.copy(), deepcopy(graph), Graph(graph)]:
+            graph_copy.node['relu']['op'] = 'Result'
+            self.check_index(graph_copy)
+            self.assertListEqual(graph.get_nodes_with_attributes(op='ReLU'), ['relu'])
+        self.assertIsInstance(deepcopy(graph.node['relu']), dict)
+
+    def test_unhashable_value(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph.node['relu']['type'] = ['ReLU']
+        self.assertListEqual(graph.get_nodes_with_attributes(type=['ReLU']), ['relu'])
+        self.check_index(graph)
+
+
+class TestEdgesCache(unittest.TestCase):
+    nodes = TestNodesAttributesIndex.nodes
+    edges = TestNodesAttributesIndex.edges
+
+    def check_edges(self, graph: Graph):
+        for node_id in graph.nodes():
+            node = Node(graph, node_id)
+            self.assertListEqual(node.get_inputs(control_flow=True),
+                                 [(u, d) for u, _, d in graph.in_edges(node_id, data=True)])
+            self.assertListEqual(node.get_outputs(control_flow=True),
+                                 [(v, d) for _, v, d in graph.out_edges(node_id, data=True)])
+
+    def test_slots(self):
+        graph = build_graph(self.nodes, self.edges)
+        node = Node(graph, 'relu')
+        node.op = 'Result'
+        self.assertEqual(graph.node['relu']['op'], 'Result')
+        self.assertNotIn('__dict__', vars(Node))
+
+    def test_edges_updates(self):
+        graph = build_graph(self.nodes, self.edges)
+        self.check_edges(graph)
+        graph.add_edge('input_data', 'output', **{'in': 1})
+        graph.remove_edge('relu_data', 'output')
+        self.check_edges(graph)
+        graph.add_edges_from([('input', 'relu', {'control_flow_edge': True})])
+        self.assertListEqual([u for u, _ in Node(graph, 'relu').get_inputs()], ['input_data'])
+        self.check_edges(graph)
+        graph.remove_node('input_data')
+        graph.remove_nodes_from(['relu_data'])
+        self.check_edges(graph)
+        graph.clear_edges()
+        self.check_edges(graph)
+
+    def test_edge_attrs_filter(self):
+        graph = build_graph(self.nodes, self.edges)
+        relu = Node(graph, 'relu')
+        self.assertListEqual([v for v, _ in relu.get_outputs(edge_attr={'out': 0})], ['relu_data'])
+        self.assertListEqual(relu.get_outputs(edge_attr={'out': 1}), [])
+        graph['relu']['relu_data'][0]['out'] = 1
+        self.assertListEqual([v for v, _ in relu.get_outputs(edge_attr={'out': 1})], ['relu_data'])
+
+
+class TestChangesTracking(unittest.TestCase):
+    nodes = TestNodesAttributesIndex.nodes
+    edges = TestNodesAttributesIndex.edges
+
+    def test_not_tracked(self):
+        graph = build_graph(self.nodes, self.edges)
+        Node(graph, 'relu')['op'] = 'Result'
+        self.assertIsNone(graph.stop_tracking_changes())
+
+    def test_attrs_changes(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph.start_tracking_changes()
+        Node(graph, 'relu').op = 'Result'
+        graph.node['input_data']['value'] = None
+        del graph.node['relu_data']['shape']
+        self.assertSetEqual(graph.stop_tracking_changes(), {'relu', 'input_data', 'relu_data'})
+        self.assertIsNone(graph.stop_tracking_changes())
+
+    def test_nodes_and_edges_changes(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph.start_tracking_changes()
+        graph.add_node('new_node', kind='op')
+        graph.remove_edge('input', 'input_data')
+        graph.remove_node('output')
+        self.assertSetEqual(graph.stop_tracking_changes(), {'new_node', 'input', 'input_data', 'relu_data'})
+
+    def test_independent_trackers(self):
+        graph = build_graph(self.nodes, self.edges)
+        graph.start_tracking_changes('first')
+        Node(graph, 'relu').op = 'Result'
+        graph.start_tracking_changes('second')
+        graph.node['input_data']['value'] = None
+        self.assertSetEqual(graph.stop_tracking_changes('second'), {'input_data'})
+        self.assertSetEqual(graph.stop_tracking_changes('first'), {'relu', 'input_data'})
+
+
+class TestCopyNode(unittest.TestCase):
+    def test_new_attrs_are_not_copied(self):
+        value = np.ones([4, 4], dtype=np.float32)
+        graph = build_graph({'data': {'kind': 'data', 'value': value, 'shape': np.array([4, 4]), 'name': 'data'}}, [])
+        node_copy = Node(graph, 'data').copy_node({'value': value})
+        self.assertIs(node_copy.value, value)
+        self.assertIsNot(node_copy.shape, Node(graph, 'data').shape)
@@ -0,0 +1,172 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import re
+
+# characters of the regular expression which are not literal
+REGEX_SPECIAL_CHARS = set('.^$*+?{}[]\\|()')
+REGEX_REPEAT_CHARS = set('*+?{')
+
+
+def regex_literal(pattern: str):
+    """
+    Splits the regular expression into the parts used to select the candidate names from the ScopeIndex.
+    :param pattern: the regular expression matched with re.match.
+    :return: tuple (any_prefix, literal) where the matched names start with the literal if any_prefix is False and
+    contain the literal if any_prefix is True, or None if the pattern can not be described this way.
+    """
+    # the alternative branches may not start with the literal
+    if re.search(r'(^|[^\\])(\\\\)*\|', pattern):
+        return None
+    any_prefix = False
+    pos = 0
+    if pattern.startswith('^'):
+        pos = 1
+    elif pattern.startswith('.*'):
+        any_prefix, pos = True, 2
+    literal = []
+    while pos < len(pattern):
+        char = pattern[pos]
+        if char == '\\' and pos + 1 < len(pattern) and not pattern[pos + 1].isalnum():
+            char = pattern[pos + 1]
+            step = 2
+        elif char in REGEX_SPECIAL_CHARS:
+            break
+        else:
+            step = 1
+        # the character followed by the quantifier is optional
+        if pos + step < len(pattern) and pattern[pos + step] in REGEX_REPEAT_CHARS:
+            break
+        literal.append(char)
+        pos += step
+    if len(literal) == 0:
+        return None
+    return any_prefix, ''.join(literal)
+
+
+class ScopeNode:
+    """
+    Node of the ScopeIndex trie for the name scope. The names are the node ids with the full name equal to the scope.
+    """
+    __slots__ = ('parent', 'component', 'children', 'names')
+
+    def __init__(self, parent, component: str):
+        self.parent = parent
+        self.component = component
+        self.children = {}
+        self.names = set()
+
+    def all_names(self, result: set):
+        stack = [self]
+        while stack:
+            scope = stack.pop()
+            result.update(scope.names)
+            stack.extend(scope.children.values())
+        return result
+
+
+class ScopeIndex:
+    """
+    Trie of the '/' separated scopes of the node names which is used to find the nodes with the names matching the
+    regular expression without matching all names of the graph. The trie nodes are also indexed by the last component
+    of the scope to find the names containing the literal.
+    """
+
+    def __init__(self, names=()):
+        self.root = ScopeNode(None, None)
+        self.components = {}
+        # literal -> names containing the literal, the same literals are queried for all sub-graph instances
+        self.containing_cache = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str):
+        self.containing_cache.clear()
+        scope = self.root
+        for component in name.split('/'):
+            child = scope.children.get(component)
+            if child is None:
+                child = scope.children[component] = ScopeNode(scope, component)
+                self.components.setdefault(component, set()).add(child)
+            scope = child
+        scope.names.add(name)
+
+    def remove(self, name: str):
+        scope = self.scope(name.split('/'))
+        if scope is None:
+            return
+        self.containing_cache.clear()
+        scope.names.discard(name)
+        # the empty scopes are removed
+        while scope is not self.root and len(scope.names) == 0 and len(scope.children) == 0:
+            del scope.parent.children[scope.component]
+            scopes = self.components[scope.component]
+            scopes.discard(scope)
+            if len(scopes) == 0:
+                del self.components[scope.component]
+            scope = scope.parent
+
+    def scope(self, components: list, scope: ScopeNode = None):
+        scope = self.root if scope is None else scope
+        for component in components:
+            scope = scope.children.get(component)
+            if scope is None:
+                return None
+        return scope
+
+    def names_with_prefix(self, prefix: str, scope: ScopeNode = None, result: set = None):
+        """
+        Returns the set of names starting with the prefix. The prefix is relative to the scope if it is specified.
+        """
+        result = set() if result is None else result
+        components = prefix.split('/')
+        scope = self.scope(components[:-1], scope)
+        if scope is not None:
+            for component, child in scope.children.items():
+                if component.startswith(components[-1]):
+                    child.all_names(result)
+        return result
+
+    def names_containing(self, literal: str):
+        """
+        Returns the set of names containing the literal. The set must not be modified.
+        """
+        result = self.containing_cache.get(literal)
+        if result is not None:
+            return result
+        result = self.containing_cache[literal] = set()
+        head, sep, tail = literal.partition('/')
+        for component, scopes in self.components.items():
+            if sep:
+                # the literal with the scope separator starts in the end of the scope component
+                if component.endswith(head):
+                    for scope in scopes:
+                        self.names_with_prefix(tail, scope, result)
+            elif head in component:
+                for scope in scopes:
+                    scope.all_names(result)
+        return result
+
+    def candidates(self, pattern: str):
+        """
+        Returns the set of names which includes all names matching the regular expression or None if the names can
+        not be selected using the index.
+        """
+        literal = regex_literal(pattern)
+        if literal is None:
+            return None
+        any_prefix, literal = literal
+        return self.names_containing(literal) if any_prefix else self.names_with_prefix(literal)
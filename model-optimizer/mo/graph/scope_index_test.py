@@ -0,0 +1,71 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import re
+import unittest
+
+from mo.graph.graph import Graph
+from mo.graph.scope_index import ScopeIndex, regex_literal
+
+NAMES = ['input', 'Preprocessor/map/Shape', 'Preprocessor/map/TensorArrayUnstack/Shape', 'Preprocessor/sub',
+         'FeatureExtractor/Preprocessor/mul', 'SecondStagePostprocessor/Reshape', 'SecondStagePostprocessor/Reshape_1',
+         'SecondStageBoxPredictor/map/Shape', 'SecondStageBoxPredictor/map_1/Shape', 'map', '/leading', 'a//b']
+
+PATTERNS = ['.*Preprocessor/', 'Preprocessor/', '.*map/Shape$', '.*Reshape$', 'SecondStageBoxPredictor/map/',
+            'SecondStageBoxPredictor/map_1/', '.*Stage', 'map', '.*/', '.*a//', 'Second.*Shape', 'Preprocessor/m?ap',
+            'Pre|Sec', '[PS].*', '.*', 'input$', r'Preprocessor\/sub', 'a/+b', '.*map_?1']
+
+
+class ScopeIndexTest(unittest.TestCase):
+    def test_regex_literal(self):
+        self.assertEqual(regex_literal('Preprocessor/map/'), (False, 'Preprocessor/map/'))
+        self.assertEqual(regex_literal('.*Preprocessor/'), (True, 'Preprocessor/'))
+        self.assertEqual(regex_literal('^map/Shape$'), (False, 'map/Shape'))
+        self.assertEqual(regex_literal(r'map\.1'), (False, 'map.1'))
+        self.assertEqual(regex_literal('maps?'), (False, 'map'))
+        self.assertEqual(regex_literal(r'map\d'), (False, 'map'))
+        self.assertIsNone(regex_literal('map|shape'))
+        self.assertIsNone(regex_literal('(?i)map'))
+        self.assertIsNone(regex_literal('m*ap'))
+        self.assertIsNone(regex_literal('.*'))
+
+    def test_candidates(self):
+        index = ScopeIndex(NAMES)
+        for pattern in PATTERNS:
+            matched = {name for name in NAMES if re.match(pattern, name)}
+            candidates = index.candidates(pattern)
+            if candidates is not None:
+                self.assertTrue(matched.issubset(candidates), pattern)
+
+    def test_remove(self):
+        index = ScopeIndex(NAMES)
+        index.remove('SecondStageBoxPredictor/map_1/Shape')
+        self.assertSetEqual(index.candidates('SecondStageBoxPredictor/'), {'SecondStageBoxPredictor/map/Shape'})
+        self.assertNotIn('map_1', index.components)
+
+    def test_graph_nodes_matching_name_pattern(self):
+        graph = Graph()
+        graph.add_nodes_from(NAMES)
+        for pattern in PATTERNS:
+            self.assertListEqual(graph.get_nodes_matching_name_pattern(pattern),
+                                 [name for name in NAMES if re.match(pattern, name)], pattern)
+
+        # the index is updated when nodes are added and removed
+        graph.remove_node('Preprocessor/sub')
+        graph.add_node('Preprocessor/add')
+        self.assertListEqual(graph.get_nodes_matching_name_pattern('.*Preprocessor/'),
+                             ['Preprocessor/map/Shape', 'Preprocessor/map/TensorArrayUnstack/Shape',
+                              'FeatureExtractor/Preprocessor/mul', 'Preprocessor/add'])
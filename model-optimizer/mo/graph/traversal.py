@@ -0,0 +1,114 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+"""
+Iterative traversals of the graphs used by the Model Optimizer. The functions accept the callable returning the
+adjacent nodes of the node, so the same traversal is used for the forward and the backward directions, for the
+networkx graphs of the model and for the graphs of the transformations. The orders of the traversals are the same as
+the ones of the original recursive and list-based implementations.
+"""
+
+from collections import deque
+
+
+def successors(graph):
+    """
+    Returns the callable returning the output nodes of the node in the order of the output edges of the graph
+    """
+    return lambda node: graph._succ[node]
+
+
+def predecessors(graph):
+    """
+    Returns the callable returning the input nodes of the node in the order of the input edges of the graph
+    """
+    return lambda node: graph._pred[node]
+
+
+def port_ordered_producers(graph):
+    """
+    Returns the callable returning the input nodes of the node of the model graph sorted by the input ports for the op
+    nodes and in the order of the input edges for the data nodes. The control flow edges are skipped.
+    """
+    def producers(node):
+        if graph._node[node].get('kind') == 'op':
+            ports = {d['in']: u for u, key_dict in graph._pred[node].items() for d in key_dict.values()
+                     if not d.get('control_flow_edge')}
+            return [ports[port] for port in sorted(ports)] if len(ports) > 1 else list(ports.values())
+        return [u for u, key_dict in graph._pred[node].items() for d in key_dict.values()
+                if not d.get('control_flow_edge')]
+    return producers
+
+
+def dfs_postorder(roots: list, adjacent: callable, visited: set = None):
+    """
+    Depth-first search from the root nodes one by one. The root node is traversed even if it was visited by the
+    previous search and the nodes of the visited set are not entered.
+    :param roots: list of nodes to start the search from.
+    :param adjacent: callable returning the ordered adjacent nodes of the node.
+    :param visited: set of already visited nodes. It is updated with the nodes visited by the search.
+    :return: list of nodes in the order of the search completion for them (post-order).
+    """
+    if visited is None:
+        visited = set()
+    order = []
+    for root in roots:
+        visited.add(root)
+        stack = [(root, iter(adjacent(root)))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(adjacent(child))))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+    return order
+
+
+def bfs_order(roots: list, adjacent: callable, visited: set = None):
+    """
+    Breadth-first search from the root nodes.
+    :param roots: list of nodes to start the search from.
+    :param adjacent: callable returning the ordered adjacent nodes of the node.
+    :param visited: set of nodes which are not entered. It is updated with the nodes visited by the search.
+    :return: list of nodes in the BFS order.
+    """
+    if visited is None:
+        visited = set()
+    visited.update(roots)
+    order = []
+    queue = deque(roots)
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for child in adjacent(node):
+            if child not in visited:
+                visited.add(child)
+                queue.append(child)
+    return order
+
+
+def topological_order(roots: list, adjacent: callable):
+    """
+    Topological sort of the nodes reachable from the root nodes as the reversed post-order of the depth-first search.
+    The order is a pseudo-topological one if there are cycles in the graph.
+    """
+    order = dfs_postorder(roots, adjacent)
+    order.reverse()
+    return order
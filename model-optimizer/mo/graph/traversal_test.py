@@ -0,0 +1,65 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import unittest
+
+import networkx as nx
+
+from mo.graph.traversal import bfs_order, dfs_postorder, port_ordered_producers, successors, topological_order
+from mo.utils.unittest.graph import build_graph
+
+
+def diamond_graph():
+    graph = nx.MultiDiGraph()
+    graph.add_edges_from([('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd'), ('d', 'e')])
+    return graph
+
+
+class TraversalTest(unittest.TestCase):
+    def test_dfs_postorder(self):
+        self.assertListEqual(dfs_postorder(['a'], successors(diamond_graph())), ['e', 'd', 'b', 'c', 'a'])
+
+    def test_dfs_postorder_visited(self):
+        visited = {'d'}
+        self.assertListEqual(dfs_postorder(['a'], successors(diamond_graph()), visited), ['b', 'c', 'a'])
+        self.assertSetEqual(visited, {'a', 'b', 'c', 'd'})
+
+    def test_dfs_postorder_cycle(self):
+        graph = diamond_graph()
+        graph.add_edge('e', 'a')
+        self.assertListEqual(dfs_postorder(['a'], successors(graph)), ['e', 'd', 'b', 'c', 'a'])
+
+    def test_dfs_postorder_deep(self):
+        graph = nx.MultiDiGraph()
+        nx.add_path(graph, range(100000))
+        self.assertListEqual(dfs_postorder([0], successors(graph)), list(reversed(range(100000))))
+
+    def test_bfs_order(self):
+        self.assertListEqual(bfs_order(['a'], successors(diamond_graph())), ['a', 'b', 'c', 'd', 'e'])
+
+    def test_topological_order(self):
+        self.assertListEqual(topological_order(['a'], successors(diamond_graph())), ['a', 'c', 'b', 'd', 'e'])
+
+    def test_port_ordered_producers(self):
+        graph = build_graph({'in_1': {'kind': 'op'}, 'in_1_data': {'kind': 'data'},
+                             'in_2': {'kind': 'op'}, 'in_2_data': {'kind': 'data'},
+                             'op': {'kind': 'op'}, 'op_data': {'kind': 'data'}},
+                            [('in_1', 'in_1_data'), ('in_2', 'in_2_data'),
+                             ('in_2_data', 'op', {'in': 0}), ('in_1_data', 'op', {'in': 1}),
+                             ('in_1', 'op', {'in': 2, 'control_flow_edge': True}), ('op', 'op_data')])
+        producers = port_ordered_producers(graph)
+        self.assertListEqual(producers('op'), ['in_2_data', 'in_1_data'])
+        self.assertListEqual(producers('op_data'), ['op'])
@@ -16,11 +16,13 @@
 
 import argparse
 import datetime
+import importlib
 import logging as log
 import os
 import sys
 import platform
 import subprocess
+import time
 import traceback
 from collections import OrderedDict
 
@@ -28,23 +30,30 @@ import numpy as np
 
 import telemetry.telemetry as tm
 from extensions.back.SpecialNodesFinalization import RemoveConstOps, CreateConstNodesReplacement, NormalizeTI
+from mo.back.offline_transformations import apply_offline_transformations
 from mo.graph.graph import Graph
 from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
 from mo.pipeline.common import prepare_emit_ir, get_ir_version
 from mo.pipeline.unified import unified_pipeline
 from mo.utils import import_extensions
+from mo.utils.batch_conversion import convert_batch
 from mo.utils.cli_parser import get_placeholder_shapes, get_tuple_values, get_model_name, \
     get_common_cli_options, get_caffe_cli_options, get_tf_cli_options, get_mxnet_cli_options, get_kaldi_cli_options, \
     get_onnx_cli_options, get_mean_scale_dictionary, parse_tuple_pairs, get_freeze_placeholder_values, get_meta_info
+from mo.utils.conversion_cache import get_conversion_cache
 from mo.utils.error import Error, FrameworkError, classify_error_type
 from mo.utils.get_ov_update_message import get_ov_update_message
 from mo.utils.guess_framework import deduce_framework_by_namespace
 from mo.utils.logger import init_logger
 from mo.utils.model_analysis import AnalysisResults
+from mo.utils.transformations_profiler import enable_profiling, disable_profiling
 from mo.utils.utils import refer_to_faq_msg
 from mo.utils.version import get_version, get_simplified_mo_version, get_simplified_ie_version
 from mo.utils.versions_checker import check_requirements
-from mo.utils.find_ie_version import find_ie_version
+from mo.utils.find_ie_version import find_ie_version, ie_found_in_default_environment
+
+# the time limit of the offline transformations run in the subprocess, in seconds
+OFFLINE_TRANSFORMATIONS_TIMEOUT = 10
 
 
 def replace_ext(name: str, old: str, new: str):
@@ -96,6 +105,25 @@ def print_argv(argv: argparse.Namespace, is_caffe: bool, is_tf: bool, is_mxnet:
     print('\n'.join(lines), flush=True)
 
 
+# the framework and the extensions directories loaded to the current process
+loaded_extensions = None
+
+
+def load_extensions(framework: str, extensions: [list, None], manifest_dir: [str, None]):
+    """
+    Loads the extensions for the framework. The extensions are loaded once per process, so the following conversions
+    of the models of the same framework in the same process, for example in the batch mode, do not load them again.
+    """
+    global loaded_extensions
+    key = (framework, tuple(extensions) if extensions is not None else None)
+    if loaded_extensions == key:
+        return
+    get_front_classes = importlib.import_module('mo.front.{}.register_custom_ops'.format(framework)).get_front_classes
+    import_extensions.load_dirs(framework, list(extensions) if extensions is not None else None, get_front_classes,
+                                manifest_dir)
+    loaded_extensions = key
+
+
 def prepare_ir(argv: argparse.Namespace):
     is_tf, is_caffe, is_mxnet, is_kaldi, is_onnx = deduce_framework_by_namespace(argv)
 
@@ -229,30 +257,50 @@ def prepare_ir(argv: argparse.Namespace):
 
     argv.freeze_placeholder_with_value, argv.input = get_freeze_placeholder_values(argv.input,
                                                                                    argv.freeze_placeholder_with_value)
-    if is_tf:
-        t.send_event('mo', 'framework', 'tf')
-        from mo.front.tf.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_caffe:
-        t.send_event('mo', 'framework', 'caffe')
-        from mo.front.caffe.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_mxnet:
-        t.send_event('mo', 'framework', 'mxnet')
-        from mo.front.mxnet.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_kaldi:
-        t.send_event('mo', 'framework', 'kaldi')
-        from mo.front.kaldi.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
-    elif is_onnx:
-        t.send_event('mo', 'framework', 'onnx')
-        from mo.front.onnx.register_custom_ops import get_front_classes
-        import_extensions.load_dirs(argv.framework, extensions, get_front_classes)
+    # the manifest of the extensions is stored together with the conversion results
+    manifest_dir = argv.cache_dir if getattr(argv, 'cache_dir', None) and not getattr(argv, 'no_cache', False) \
+        else None
+    t.send_event('mo', 'framework', argv.framework)
+    load_extensions(argv.framework, extensions, manifest_dir)
     graph = unified_pipeline(argv)
     return graph
 
 
+def run_offline_transformations(orig_model_name: str, argv: argparse.Namespace):
+    """
+    Runs the offline transformations of the Inference Engine for the generated IR. They are run in the current process
+    if the Inference Engine Python API is importable from it and in the subprocess with the environment found by
+    find_ie_version otherwise.
+    :return: return code of the offline transformations or "not executed" if the Inference Engine is not found
+    """
+    return_code = "not executed"
+    # This try-except is additional reinsurance that the IE
+    # dependency search does not break the MO pipeline
+    try:
+        if not find_ie_version(silent=True):
+            return return_code
+        if ie_found_in_default_environment():
+            try:
+                apply_offline_transformations()
+                return 0
+            except Exception as e:
+                log.debug('Offline transformations failed in the current process, running them in the subprocess: '
+                          '{}'.format(e))
+        path_to_offline_transformations = os.path.join(os.path.realpath(os.path.dirname(__file__)), 'back',
+                                                       'offline_transformations.py')
+        try:
+            status = subprocess.run([sys.executable, path_to_offline_transformations, orig_model_name],
+                                    env=os.environ, timeout=OFFLINE_TRANSFORMATIONS_TIMEOUT)
+            return_code = status.returncode
+        except subprocess.TimeoutExpired:
+            return_code = "timeout"
+        if return_code != 0 and not argv.silent:
+            print("[ WARNING ] offline_transformations return code {}".format(return_code))
+    except Exception as e:
+        pass
+    return return_code
+
+
 def emit_ir(graph: Graph, argv: argparse.Namespace):
     NormalizeTI().find_and_replace_pattern(graph)
     for_graph_and_each_sub_graph_recursively(graph, RemoveConstOps().find_and_replace_pattern)
@@ -270,26 +318,21 @@ def emit_ir(graph: Graph, argv: argparse.Namespace):
         output_dir = argv.output_dir if argv.output_dir != '.' else os.getcwd()
         orig_model_name = os.path.normpath(os.path.join(output_dir, argv.model_name))
 
-        return_code = "not executed"
-        # This try-except is additional reinsurance that the IE
-        # dependency search does not break the MO pipeline
-        try:
-            if find_ie_version(silent=True):
-                path_to_offline_transformations = os.path.join(os.path.realpath(os.path.dirname(__file__)), 'back',
-                                                               'offline_transformations.py')
-                status = subprocess.run([sys.executable, path_to_offline_transformations, orig_model_name], env=os.environ, timeout=10)
-                return_code = status.returncode
-                if return_code != 0 and not argv.silent:
-                    print("[ WARNING ] offline_transformations return code {}".format(return_code))
-        except Exception as e:
-            pass
+        start_time = time.perf_counter()
+        return_code = run_offline_transformations(orig_model_name, argv)
+        elapsed_time = time.perf_counter() - start_time
+        log.info('Offline transformations finished with return code {} in {:.2f} seconds'.format(return_code,
+                                                                                              elapsed_time))
+        if getattr(argv, 'profile_transformations', False):
+            print('[ PROFILE ] Offline transformations time: {:.2f} seconds'.format(elapsed_time))
 
         message = str(dict({
             "platform": platform.system(),
             "mo_version": get_simplified_mo_version(),
             "ie_version": get_simplified_ie_version(env=os.environ),
             "python_version": sys.version,
-            "return_code": return_code
+            "return_code": return_code,
+            "time": round(elapsed_time, 3),
         }))
         t = tm.Telemetry()
         t.send_event('mo', 'offline_transformations_status', message)
@@ -306,11 +349,39 @@ def driver(argv: argparse.Namespace):
 
     start_time = datetime.datetime.now()
 
-    ret_res = emit_ir(prepare_ir(argv), argv)
+    cache = get_conversion_cache(argv)
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(argv)
+        model_name = cache.restore(cache_key, argv.output_dir)
+        if model_name is not None:
+            orig_model_name = os.path.normpath(os.path.join(argv.output_dir, model_name))
+            print('[ SUCCESS ] The conversion result is taken from the cache {}'.format(argv.cache_dir))
+            print('[ SUCCESS ] XML file: {}.xml'.format(orig_model_name))
+            print('[ SUCCESS ] BIN file: {}.bin'.format(orig_model_name))
+            elapsed_time = datetime.datetime.now() - start_time
+            print('[ SUCCESS ] Total execution time: {:.2f} seconds. '.format(elapsed_time.total_seconds()))
+            return 0
+
+    profiler = enable_profiling() if getattr(argv, 'profile_transformations', False) else None
+    try:
+        ret_res = emit_ir(prepare_ir(argv), argv)
+    finally:
+        if profiler is not None:
+            disable_profiling()
 
     if ret_res != 0:
         return ret_res
 
+    if cache is not None:
+        cache.store(cache_key, argv.output_dir, argv.model_name)
+
+    if profiler is not None:
+        print('[ PROFILE ] Transformations sorted by execution time:\n{}'.format(profiler.summary_table(top=50)))
+        json_path, trace_path = profiler.save(argv.output_dir, argv.model_name)
+        print('[ PROFILE ] Transformations statistics: {}'.format(json_path))
+        print('[ PROFILE ] Transformations trace: {}'.format(trace_path))
+
     elapsed_time = datetime.datetime.now() - start_time
     print('[ SUCCESS ] Total execution time: {:.2f} seconds. '.format(elapsed_time.total_seconds()))
 
@@ -342,7 +413,10 @@ def main(cli_parser: argparse.ArgumentParser, framework: str):
         ov_update_message = None
         if not hasattr(argv, 'silent') or not argv.silent:
             ov_update_message = get_ov_update_message()
-        ret_code = driver(argv)
+        if getattr(argv, 'batch_manifest', None):
+            ret_code = convert_batch(argv, cli_parser, framework, sys.argv[1:])
+        else:
+            ret_code = driver(argv)
         if ov_update_message:
             print(ov_update_message)
         telemetry.send_event('mo', 'conversion_result', 'success')
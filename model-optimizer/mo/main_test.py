@@ -15,10 +15,11 @@
 """
 
 import argparse
+import subprocess
 import unittest
 from unittest.mock import patch
 
-from mo.main import main
+from mo.main import main, run_offline_transformations
 from mo.utils.error import FrameworkError
 
 
@@ -29,3 +30,28 @@ class TestMainErrors(unittest.TestCase):
         with self.assertLogs() as logger:
             main(argparse.ArgumentParser(), 'framework_string')
             self.assertEqual(logger.output, ['ERROR:root:FW ERROR MESSAGE'])
+
+
+@patch('mo.main.find_ie_version', return_value=True)
+class TestOfflineTransformations(unittest.TestCase):
+    argv = argparse.Namespace(silent=True)
+
+    @patch('mo.main.subprocess.run')
+    @patch('mo.main.apply_offline_transformations')
+    @patch('mo.main.ie_found_in_default_environment', return_value=True)
+    def test_in_process(self, mock_default_env, mock_apply, mock_run, mock_find):
+        self.assertEqual(run_offline_transformations('model', self.argv), 0)
+        mock_apply.assert_called_once()
+        mock_run.assert_not_called()
+
+    @patch('mo.main.subprocess.run', return_value=subprocess.CompletedProcess([], 0))
+    @patch('mo.main.apply_offline_transformations', side_effect=ImportError('no IE'))
+    @patch('mo.main.ie_found_in_default_environment', return_value=True)
+    def test_subprocess_fallback(self, mock_default_env, mock_apply, mock_run, mock_find):
+        self.assertEqual(run_offline_transformations('model', self.argv), 0)
+        mock_run.assert_called_once()
+
+    @patch('mo.main.subprocess.run', side_effect=subprocess.TimeoutExpired([], 10))
+    @patch('mo.main.ie_found_in_default_environment', return_value=False)
+    def test_subprocess_timeout(self, mock_default_env, mock_run, mock_find):
+        self.assertEqual(run_offline_transformations('model', self.argv), 'timeout')
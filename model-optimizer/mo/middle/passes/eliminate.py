@@ -143,8 +143,16 @@ def eliminate_dead_nodes(graph):
     graph.remove_nodes_from(nodes_to_remove)
 
 
-def add_constant_operations(graph):
-    data_nodes = graph.get_data_nodes(has_value=True)
+def add_constant_operations(graph, data_nodes: list = None):
+    """
+    Creates Const operations for data nodes with values which have consumers but have no producers.
+    :param graph: graph to operate on.
+    :param data_nodes: list of data nodes to check, all data nodes with values are checked by default.
+    :return: list of names of data nodes the Const operations are created for.
+    """
+    if data_nodes is None:
+        data_nodes = graph.get_data_nodes(has_value=True)
+    const_data_nodes = []
     for node in data_nodes:
         # If data node has no producers we create Const operation
         if len(node.in_nodes()) == 0 and len(node.out_nodes()) != 0:
@@ -159,22 +167,261 @@ def add_constant_operations(graph):
                                            correct_data_type=node.soft_get('correct_data_type', False),
                                            )).create_node()
             graph.add_edges_from([(const_node.id, node.id, {'out': 0})])
+            const_data_nodes.append(node.id)
+    return const_data_nodes
+
+
+def nodes_without_path(start, adjacent: callable, is_target: callable, found: set, not_found: set):
+    """
+    Checks whether there is a path from the start node to any target node using the depth-first search. The results of
+    previous searches are reused and updated: the found set contains nodes having a path to the target, the not_found
+    set contains nodes having no such path.
+    :param start: node to start the search from
+    :param adjacent: function returning nodes adjacent to the given node
+    :param is_target: function checking whether the node is the target one
+    :param found: set of nodes known to have a path to the target
+    :param not_found: set of nodes known to have no path to the target
+    :return: None if the path exists, otherwise the set of visited nodes which have no path to the target
+    """
+    if start in found:
+        return None
+    if start in not_found:
+        return set()
+    if is_target(start):
+        found.add(start)
+        return None
+    visited = {start}
+    stack = [(start, iter(adjacent(start)))]
+    while len(stack) != 0:
+        for node in stack[-1][1]:
+            if node in visited or node in not_found:
+                continue
+            if node in found or is_target(node):
+                # all nodes in the stack are on the path to the target
+                found.update(node_name for node_name, _ in stack)
+                found.add(node)
+                return None
+            visited.add(node)
+            stack.append((node, iter(adjacent(node))))
+            break
+        else:
+            stack.pop()
+    not_found.update(visited)
+    return visited
+
+
+def find_unreachable_nodes(graph, nodes: set):
+    """
+    Finds nodes which are not output reachable among the given nodes and their ancestors. The nodes which are not
+    ancestors of the given nodes must be output reachable, so the ancestors are checked only if some of their
+    children are found unreachable.
+    :param graph: graph to operate on.
+    :param nodes: set of node names to check.
+    :return: set of unreachable node names.
+    """
+    reachable, unreachable = set(), set()
+    queue = deque(nodes)
+    while len(queue) != 0:
+        node_name = queue.popleft()
+        if node_name in reachable or node_name in unreachable:
+            continue
+        visited = nodes_without_path(node_name, graph._succ.__getitem__,
+                                     lambda n: graph._node[n].get('op') == 'Result', reachable, unreachable)
+        if visited is not None:
+            for visited_name in visited:
+                queue.extend(graph._pred[visited_name])
+    return unreachable
+
+
+def is_const_producer(graph, node_name: str):
+    """
+    Checks that all consumers of the node produce constant values and the node has no control flow edges. It is the
+    same check as mark_const_producer_nodes does for all the nodes.
+    """
+    for out_node_name, edges in graph._succ[node_name].items():
+        if graph._node[out_node_name].get('value') is None or \
+                any(attrs.get('control_flow_edge', False) for attrs in edges.values()):
+            return False
+    for edges in graph._pred[node_name].values():
+        if any(attrs.get('control_flow_edge', False) for attrs in edges.values()):
+            return False
+    return True
+
+
+def produces_undead_value(node_attrs: dict):
+    """
+    Checks that the 'undead' attribute is propagated to the node from its undead parent as mark_undead_nodes does.
+    """
+    return 'kind' in node_attrs and (node_attrs['kind'] == 'data' and node_attrs.get('value') is not None or
+                                     node_attrs['kind'] == 'op')
+
+
+def incremental_clean_up(graph, changed: set, undead_types: list):
+    """
+    Removes dead nodes checking only the nodes changed since the previous clean-up and the nodes which state may depend
+    on them:
+    1. the changed nodes and their ancestors are checked to be output reachable;
+    2. the changed nodes and their parents are checked to be const producers as their children values may change;
+    3. the changed nodes and their descendants which may inherit the 'undead' attribute are checked to be undead;
+    4. the producers of the data nodes left without consumers by the removal are checked again.
+    The result is the same as of the full clean-up for all nodes but the Const operations which are not changed since
+    the previous clean-up: the full clean-up removes them and creates the new ones for the same data nodes.
+    :param graph: graph to operate on.
+    :param changed: set of names of the nodes changed since the previous clean-up.
+    :param undead_types: list of node types that should survive the elimination.
+    :return: list of data nodes which may need the Const operations.
+    """
+    from mo.graph.graph import Node
+
+    unreachable = find_unreachable_nodes(graph, changed)
+
+    graph.start_tracking_changes('shape_inference')
+    shape_inference(graph)
+    changed = changed | graph.stop_tracking_changes('shape_inference')
+
+    candidates = set()
+    queue = deque(node_name for node_name in changed if node_name not in unreachable)
+    while len(queue) != 0:
+        node_name = queue.popleft()
+        if node_name not in candidates:
+            candidates.add(node_name)
+            queue.extend(out_node_name for out_node_name in graph._succ[node_name]
+                         if produces_undead_value(graph._node[out_node_name]))
+    for node_name in changed:
+        candidates.update(graph._pred[node_name])
+    candidates.difference_update(unreachable)
+
+    undead_types_with_result = undead_types + ['Result']
+
+    def is_undead_source(node_name: str):
+        node = Node(graph, node_name)
+        return node.kind == 'op' and node.soft_get('type', node.soft_get('op')) in undead_types_with_result
+
+    def undead_parents(node_name: str):
+        return graph._pred[node_name] if produces_undead_value(graph._node[node_name]) else ()
+
+    undead, not_undead = set(), set()
+
+    def is_dead(node_name: str):
+        node_attrs = graph._node[node_name]
+        # the same attribute propagation as in the eliminate_dead_nodes
+        if node_attrs.get('type', None) == 'Const' and node_attrs.get('nchw_layout', False):
+            Node(graph, node_name).out_node()['nchw_layout'] = True
+
+        if node_name in unreachable:
+            return True
+        if not is_const_producer(graph, node_name):
+            return False
+        return node_attrs.get('force_dead_node', False) or not node_attrs.get('is_input', False) and \
+            nodes_without_path(node_name, undead_parents, is_undead_source, undead, not_undead) is not None
+
+    removed = set(node_name for node_name in candidates | unreachable if is_dead(node_name))
+    # data nodes which may lose producers or be created with values since the previous clean-up
+    data_nodes = candidates - removed
+    while len(removed) != 0:
+        in_data_nodes = set(in_node_name for node_name in removed for in_node_name in graph._pred[node_name])
+        for node_name in removed:
+            data_nodes.update(graph._succ[node_name])
+        log.debug('Removing the following dead nodes: {}'.format('\n'.join(sorted(map(str, removed)))))
+        graph.remove_nodes_from(removed)
+        # the producers of the data nodes left without consumers are not kept for the Const operations, so they are
+        # checked again as the full clean-up removes the constant producers which are not undead
+        producers = set(producer_name for node_name in in_data_nodes
+                        if node_name in graph._node and graph._node[node_name].get('kind') == 'data' and
+                        len(graph._succ[node_name]) == 0 for producer_name in graph._pred[node_name])
+        removed = set(node_name for node_name in producers if is_dead(node_name))
+
+    positions = graph.get_nodes_positions()
+    data_nodes = sorted((node_name for node_name in data_nodes if node_name in positions), key=positions.get)
+    return [Node(graph, node_name) for node_name in data_nodes
+            if graph._node[node_name].get('kind') == 'data' and graph._node[node_name].get('value') is not None]
+
+
+def topologically_sorted_descendants(graph, nodes: list):
+    """
+    Sorts the nodes reachable from the given nodes (including them) in the topological order. Only the sub-graph
+    reachable from the given nodes is visited.
+    :param graph: graph to operate on
+    :param nodes: list of node names to start from
+    :return: list of node names in the topological order or None if the reachable sub-graph contains a cycle
+    """
+    reachable = dict.fromkeys(nodes)
+    queue = deque(reachable)
+    while len(queue) != 0:
+        for _, out_node_name in graph.out_edges(queue.popleft()):
+            if out_node_name not in reachable:
+                reachable[out_node_name] = None
+                queue.append(out_node_name)
+
+    in_degree = dict.fromkeys(reachable, 0)
+    for node_name in reachable:
+        for _, out_node_name in graph.out_edges(node_name):
+            in_degree[out_node_name] += 1
+
+    queue = deque(node_name for node_name, degree in in_degree.items() if degree == 0)
+    order = []
+    while len(queue) != 0:
+        node_name = queue.popleft()
+        order.append(node_name)
+        for _, out_node_name in graph.out_edges(node_name):
+            in_degree[out_node_name] -= 1
+            if in_degree[out_node_name] == 0:
+                queue.append(out_node_name)
+    return order if len(order) == len(reachable) else None
+
+
+def _infer_marked_node(node):
+    old_out_shapes = [port.data.get_shape() for port in node.out_ports().values() if not port.disconnected()]
+    node.infer(node)
+    new_out_shapes = [port.data.get_shape() for port in node.out_ports().values() if not port.disconnected()]
+    if not node.has_and_set('override_output_shape'):
+        for shape1, shape2 in zip(old_out_shapes, new_out_shapes):
+            if shape1 is not None and not np.array_equal(shape1, shape2):
+                raise Error("After partial shape inference were found shape collision for node {} (old shape: "
+                            "{}, new shape: {})".format(node.name, shape1, shape2))
+    else:
+        del node['override_output_shape']
+    node.need_shape_inference = False
 
 
 def shape_inference(graph):
-    for node in graph.pseudo_topological_sort():
-        if node.has_and_set('need_shape_inference'):
-            old_out_shapes = [port.data.get_shape() for port in node.out_ports().values() if not port.disconnected()]
-            node.infer(node)
-            new_out_shapes = [port.data.get_shape() for port in node.out_ports().values() if not port.disconnected()]
-            if not node.has_and_set('override_output_shape'):
-                for shape1, shape2 in zip(old_out_shapes, new_out_shapes):
-                    if shape1 is not None and not np.array_equal(shape1, shape2):
-                        raise Error("After partial shape inference were found shape collision for node {} (old shape: "
-                                    "{}, new shape: {})".format(node.name, shape1, shape2))
+    """
+    Re-infers shapes for nodes marked with the 'need_shape_inference' attribute. The graph tracks marked nodes so only
+    the sub-graph reachable from them is sorted and visited. Nodes marked during the inference are processed in the
+    same call unless they have been already inferred in it.
+    """
+    candidates = getattr(graph, 'shape_inference_candidates', None)
+    if candidates is None:
+        # the graph does not track marked nodes
+        for node in graph.pseudo_topological_sort():
+            if node.has_and_set('need_shape_inference'):
+                _infer_marked_node(node)
+        return
+
+    from mo.graph.graph import Node
+
+    inferred = set()
+    while True:
+        marked = [node_name for node_name in candidates if node_name not in inferred and graph.has_node(node_name)]
+        if len(marked) == 0:
+            break
+        order = topologically_sorted_descendants(graph, marked)
+        if order is None:
+            order = [node.id for node in graph.pseudo_topological_sort()]
+        marked = set(marked)
+        for node_name in order:
+            if node_name not in marked or not graph.has_node(node_name):
+                continue
+            inferred.add(node_name)
+            node = Node(graph, node_name)
+            if node.has_and_set('need_shape_inference'):
+                _infer_marked_node(node)
             else:
-                del node['override_output_shape']
-            node.need_shape_inference = False
+                candidates.pop(node_name, None)
+
+    # forget nodes removed from the graph
+    for node_name in [node_name for node_name in candidates if not graph.has_node(node_name)]:
+        del candidates[node_name]
 
 
 @deprecated_api('Graph', 'clean_up')
@@ -15,12 +15,14 @@
 """
 
 import unittest
+from argparse import Namespace
 
 import numpy as np
 
-from mo.graph.graph import Node
-from mo.middle.passes.eliminate import mark_output_reachable_nodes, mark_const_producer_nodes
-from mo.utils.unittest.graph import build_graph
+from mo.graph.graph import Node, Graph
+from mo.middle.passes.eliminate import mark_output_reachable_nodes, mark_const_producer_nodes, shape_inference, \
+    topologically_sorted_descendants
+from mo.utils.unittest.graph import build_graph, regular_op_with_empty_data, result, valued_const_with_data
 
 nodes_attributes = {'placeholder_1': {'type': 'Parameter', 'kind': 'op', 'op': 'Parameter'},
                     'placeholder_2': {'type': 'Parameter', 'kind': 'op', 'op': 'Parameter'},
@@ -175,3 +177,170 @@ class TestEliminatePass(unittest.TestCase):
         graph.erase_node(Node(graph, 'node_2'))
 
         self.assertListEqual(sorted(['placeholder_1', 'node_1', 'node_3']), sorted(graph.nodes()))
+
+
+class TestShapeInference(unittest.TestCase):
+    @staticmethod
+    def build_chain():
+        """
+        placeholder_1->node_1->data_node_1->node_2->data_node_2->node_3->data_node_3
+        """
+        return build_graph(nodes_attributes,
+                           [('placeholder_1', 'node_1'),
+                            ('node_1', 'data_node_1'),
+                            ('data_node_1', 'node_2'),
+                            ('node_2', 'data_node_2'),
+                            ('data_node_2', 'node_3'),
+                            ('node_3', 'data_node_3')],
+                           nodes_with_edges_only=True)
+
+    def test_topologically_sorted_descendants(self):
+        graph = self.build_chain()
+        self.assertListEqual(topologically_sorted_descendants(graph, ['node_3', 'node_2']),
+                             ['node_2', 'data_node_2', 'node_3', 'data_node_3'])
+
+    def test_topologically_sorted_descendants_cycle(self):
+        graph = self.build_chain()
+        graph.add_edge('data_node_3', 'node_2', **{'in': 1})
+        self.assertIsNone(topologically_sorted_descendants(graph, ['node_2']))
+
+    def test_marked_nodes_are_tracked(self):
+        graph = self.build_chain()
+        Node(graph, 'node_3')['need_shape_inference'] = True
+        Node(graph, 'node_1')['need_shape_inference'] = True
+        self.assertListEqual(list(graph.shape_inference_candidates), ['node_3', 'node_1'])
+
+        Node(graph, 'node_1')['need_shape_inference'] = False
+        self.assertListEqual(list(graph.shape_inference_candidates), ['node_3'])
+
+        graph.add_node('new_node', kind='op', need_shape_inference=True)
+        self.assertListEqual(list(graph.shape_inference_candidates), ['node_3', 'new_node'])
+
+        self.assertListEqual(list(graph.copy().shape_inference_candidates), ['node_3', 'new_node'])
+
+    def test_shape_inference_order(self):
+        graph = self.build_chain()
+        inferred = []
+
+        def infer(node):
+            inferred.append(node.id)
+            # the node marked during inference is processed in the same call
+            if node.id == 'node_2':
+                Node(graph, 'node_1')['need_shape_inference'] = True
+
+        for node_name in ['node_1', 'node_2', 'node_3']:
+            Node(graph, node_name)['infer'] = infer
+        for node_name in ['data_node_1', 'data_node_2', 'data_node_3']:
+            Node(graph, node_name)['shape'] = np.array([1, 3])
+        Node(graph, 'node_3')['need_shape_inference'] = True
+        Node(graph, 'node_2')['need_shape_inference'] = True
+
+        shape_inference(graph)
+
+        self.assertListEqual(inferred, ['node_2', 'node_3', 'node_1'])
+        self.assertDictEqual(graph.shape_inference_candidates, {})
+        self.assertListEqual(graph.get_nodes_with_attributes(need_shape_inference=True), [])
+
+
+class TestIncrementalCleanUp(unittest.TestCase):
+    @staticmethod
+    def build_graph_after_clean_up():
+        """
+        placeholder_1->placeholder_1_data_node->node_1->data_node_1->node_2->data_node_2->op_output
+                                                                    \
+                                                                     ->node_3->data_node_3->op_output_1
+        """
+        graph = build_graph(nodes_attributes,
+                            [('placeholder_1', 'placeholder_1_data_node'),
+                             ('placeholder_1_data_node', 'node_1'),
+                             ('node_1', 'data_node_1'),
+                             ('data_node_1', 'node_2'),
+                             ('node_2', 'data_node_2'),
+                             ('data_node_2', 'op_output'),
+                             ('data_node_1', 'node_3'),
+                             ('node_3', 'data_node_3'),
+                             ('data_node_3', 'op_output_1')],
+                            nodes_with_edges_only=True)
+        graph.clean_up()
+        return graph
+
+    def check_clean_up(self, change: callable):
+        """
+        Checks that the incremental clean-up removes the same nodes as the full one after the graph change. The Const
+        operations are not compared as the full clean-up re-creates them with new names.
+        """
+        graphs = []
+        for full in [False, True]:
+            graph = self.build_graph_after_clean_up()
+            change(graph)
+            graph.clean_up(full=full)
+            graphs.append(graph)
+        incremental, full = [sorted(node.id for node in graph.get_op_nodes() + graph.get_data_nodes()
+                                    if node.soft_get('type') != 'Const') for graph in graphs]
+        self.assertListEqual(incremental, full)
+        return graphs[0]
+
+    def test_no_changes(self):
+        graph = self.check_clean_up(lambda graph: None)
+        self.assertEqual(len(graph.nodes()), 10)
+
+    def test_unreachable_nodes(self):
+        graph = self.check_clean_up(lambda graph: graph.remove_node('op_output_1'))
+        self.assertListEqual(sorted(graph.nodes()), sorted(['placeholder_1', 'placeholder_1_data_node', 'node_1',
+                                                            'data_node_1', 'node_2', 'data_node_2', 'op_output']))
+
+    def test_const_producer(self):
+        def change(graph: Graph):
+            Node(graph, 'data_node_3')['value'] = np.array([1, 3])
+
+        graph = self.check_clean_up(change)
+        self.assertNotIn('node_3', graph.nodes())
+        self.assertEqual(Node(graph, 'data_node_3').in_node().type, 'Const')
+
+    def test_const_left_without_consumers(self):
+        graphs = []
+        for full in [False, True]:
+            graph = build_graph({**regular_op_with_empty_data('input', {'type': 'Parameter', 'op': 'Parameter'}),
+                                 **valued_const_with_data('const', np.array([1, 2])),
+                                 **regular_op_with_empty_data('add', {'type': 'Add', 'op': 'Add'}),
+                                 **result('result')},
+                                [('input', 'input_d'), ('input_d', 'add'), ('const', 'const_d'), ('const_d', 'add'),
+                                 ('add', 'add_d'), ('add_d', 'result')], nodes_with_edges_only=True)
+            graph.clean_up()
+            graph.remove_edge('input_d', 'add')
+            Node(graph, 'add_d')['value'] = np.array([2, 3])
+            graph.clean_up(full=full)
+            graphs.append(graph)
+
+        # the Const operation of the data node without consumers is removed as the full clean-up does
+        incremental, full = [(sorted(node.id for node in graph.get_op_nodes() + graph.get_data_nodes()
+                                     if node.soft_get('type') != 'Const'),
+                              sorted(node.out_node().id for node in graph.get_op_nodes(type='Const')))
+                             for graph in graphs]
+        self.assertTupleEqual(incremental, full)
+        self.assertListEqual(incremental[1], ['add_d'])
+
+    def test_static_shape_change(self):
+        graph = self.build_graph_after_clean_up()
+        Node(graph, 'node_3')['type'] = 'ShapeOf'
+        Node(graph, 'data_node_3')['value'] = np.array([1, 3])
+        graph.clean_up()
+        self.assertIn('node_3', graph.nodes())
+
+        # the ShapeOf is not undead anymore, so the unchanged nodes are checked again
+        graph.graph['cmd_params'] = Namespace(**{**vars(graph.graph['cmd_params']), 'static_shape': True})
+        graph.clean_up()
+        self.assertNotIn('node_3', graph.nodes())
+        self.assertEqual(Node(graph, 'data_node_3').in_node().type, 'Const')
+
+    def test_nodes_left_without_consumers(self):
+        def change(graph: Graph):
+            Node(graph, 'data_node_3')['value'] = np.array([1, 3])
+            Node(graph, 'data_node_2')['value'] = np.array([1, 3])
+            graph.clean_up()
+            # the data node without consumers is removed by the next clean-up as the full clean-up does
+            self.assertIn('data_node_1', graph.nodes())
+
+        graph = self.check_clean_up(change)
+        self.assertNotIn('data_node_1', graph.nodes())
+        self.assertNotIn('node_1', graph.nodes())
@@ -102,8 +102,7 @@ def _fused_batch_norm_decomposition(graph: Graph, tinput: Port, toutput: Port, g
     # We can broadcast only when const.value is scalar
     if gamma.data.get_shape()[0] != gamma.data.get_value().shape[0]:
         value = gamma.data.get_value()
-        value.resize(gamma.data.get_shape()).fill(value[0])
-        gamma.data.set_value(value)
+        gamma.data.set_value(np.full(gamma.data.get_shape(), value[0], dtype=value.dtype))
 
     # Create second Mul & Add
     mul2_node = Mul(graph, dict(name=batch_norm_name + "/gamma", can_be_fused=can_be_fused)).create_node()
@@ -15,6 +15,8 @@
 """
 
 import logging as log
+from copy import deepcopy
+from types import FunctionType
 
 import networkx as nx
 import numpy as np
@@ -22,6 +24,7 @@ import numpy as np
 # TODO remove it
 from mo.graph.graph import Node, Graph
 from mo.graph.graph import dict_includes
+from mo.ops.op import Op
 from mo.utils.error import Error
 from mo.utils.utils import refer_to_faq_msg, shrink_str_value
 
@@ -82,6 +85,169 @@ def exit_bound_edges(graph: Graph, sources: list, end_node_attrs: dict):
     return result
 
 
+# the attributes which are specific for the node or are used by the IR emitter only, so they are not used by the infer
+# functions
+INFER_CACHE_IGNORED_ATTRS = {'name', 'is_partial_inferred', 'executable', 'fw_tensor_debug_info', 'pb', 'pb_attrs',
+                             'pb_init', 'IE'}
+
+
+# the types of the attribute values which are hashable and are compared by value
+HASHABLE_TYPES = {str, int, float, bool, type(None), bytes}
+
+
+def hashable_attr(value):
+    """
+    Returns the hashable representation of the attribute value which is the same for the equal values
+    """
+    value_type = type(value)
+    if value_type in HASHABLE_TYPES:
+        return value_type, value
+    if isinstance(value, np.ndarray):
+        return np.ndarray, value.dtype.str, value.shape, value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return value_type, tuple(map(hashable_attr, value))
+    if isinstance(value, dict):
+        return dict, tuple((key, hashable_attr(item)) for key, item in value.items())
+    if isinstance(value, FunctionType):
+        # the functions created for every operation instance are equal if the code and the captured values are equal.
+        # The operation instance is represented by its class because the attributes of the operation are the node
+        # attributes
+        closure = value.__closure__ or ()
+        return FunctionType, value.__code__, hashable_attr(value.__defaults__), tuple(
+            type(cell.cell_contents) if isinstance(cell.cell_contents, Op) else hashable_attr(cell.cell_contents)
+            for cell in closure)
+    if type(value).__hash__ is object.__hash__ and hasattr(value, '__dict__') and \
+            not isinstance(value, (type, nx.Graph)):
+        return type(value), hashable_attr(vars(value))
+    try:
+        hash(value)
+        return type(value), value
+    except TypeError:
+        return type(value), id(value)
+
+
+def copy_attr(value):
+    if type(value) in HASHABLE_TYPES:
+        return value
+    if type(value) is np.ndarray:
+        return value.copy()
+    return deepcopy(value)
+
+
+def hashable_attrs(attrs: dict):
+    return {key: hashable_attr(value) for key, value in attrs.items() if key not in INFER_CACHE_IGNORED_ATTRS}
+
+
+class InferCache:
+    """
+    Memoization of the infer function results for the nodes with the same attributes and inputs. The node key contains
+    the hashable representation of the attributes of the node, of its input and output data nodes and edges. The
+    changes of these attributes made by the infer function for the first node are applied to other nodes with the same
+    key instead of calling the infer function. The nodes with the input values and the nodes which infer function
+    propagates the value are not cached. The operation which infer function depends on something else should set the
+    'cacheable_infer' class attribute to False.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.cacheable_ops = self.get_cacheable_ops()
+
+    @staticmethod
+    def get_cacheable_ops():
+        """
+        Returns the names of the operations which all classes are cacheable. The classes derived from the Op
+        subclasses are not registered, so all subclasses are checked.
+        """
+        cacheable = {}
+        classes = Op.__subclasses__()
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+            op = getattr(cls, 'op', None)
+            if op is not None:
+                cacheable[op] = cacheable.get(op, True) and cls.cacheable_infer
+        return {op for op, is_cacheable in cacheable.items() if is_cacheable}
+
+    def node_elements(self, node: Node):
+        """
+        Returns the attributes dictionaries of the node, of its input and output edges and data nodes which may be
+        used or changed by the infer function or None if the node cannot be cached
+        """
+        if node.soft_get('op', None) not in self.cacheable_ops:
+            return None
+        graph = node.graph
+        elements = {('node',): graph.node[node.id]}
+        for src, _, attrs in graph.in_edges(node.id, data=True):
+            data_attrs = graph.node[src]
+            if 'in' not in attrs or ('in', attrs['in']) in elements or data_attrs.get('value') is not None:
+                return None
+            elements[('in', attrs['in'])] = attrs
+            elements[('in_data', attrs['in'])] = data_attrs
+        for _, dst, attrs in graph.out_edges(node.id, data=True):
+            if 'out' not in attrs or ('out', attrs['out']) in elements:
+                return None
+            elements[('out', attrs['out'])] = attrs
+            elements[('out_data', attrs['out'])] = graph.node[dst]
+        return elements
+
+    def infer(self, node: Node):
+        elements = self.node_elements(node)
+        if elements is None:
+            node.infer(node)
+            return
+        try:
+            before = {element: hashable_attrs(attrs) for element, attrs in elements.items()}
+            key = tuple((element, tuple(attrs.items())) for element, attrs in before.items())
+            changes = self.entries.get(key)
+        except (TypeError, ValueError, RecursionError):
+            # some attributes are not hashable, the closure cell is empty or the objects refer to each other
+            node.infer(node)
+            return
+
+        if changes is not None:
+            self.hits += 1
+            for element, changed_attrs, removed_attrs in changes:
+                attrs = elements[element]
+                for name, value in changed_attrs.items():
+                    attrs[name] = copy_attr(value)
+                for name in removed_attrs:
+                    del attrs[name]
+            return
+
+        if key in self.entries:
+            # the infer function of the node with this key propagated values or changed the graph
+            node.infer(node)
+            return
+
+        self.misses += 1
+        nodes_count = node.graph.number_of_nodes()
+        node.infer(node)
+        after_elements = self.node_elements(node)
+        if nodes_count != node.graph.number_of_nodes() or after_elements is None or \
+                after_elements.keys() != elements.keys() or \
+                any(attrs.get('value') is not None for element, attrs in after_elements.items()
+                    if element[0] == 'out_data'):
+            self.entries[key] = None
+            return
+
+        changes = []
+        for element, attrs in after_elements.items():
+            after = hashable_attrs(attrs)
+            changed_attrs = {name: copy_attr(attrs[name]) for name, value in after.items()
+                             if name not in before[element] or before[element][name] != value}
+            removed_attrs = [name for name in before[element] if name not in after]
+            if changed_attrs or removed_attrs:
+                changes.append((element, changed_attrs, removed_attrs))
+        self.entries[key] = changes
+
+    def log_statistics(self):
+        if self.hits + self.misses:
+            log.debug('Infer cache: {} hits, {} misses, hit rate {:.1%}'.format(
+                self.hits, self.misses, self.hits / (self.hits + self.misses)))
+
+
 def partial_infer(graph: Graph, start_node: str = None):
     """
     Tries to execute constant parts of the graph and deduce as much as possible
@@ -118,6 +284,8 @@ def partial_infer(graph: Graph, start_node: str = None):
     nx.set_node_attributes(G=graph, name='executable',
                            values={n: True for n in graph.get_nodes_with_attributes(kind='data')})
 
+    infer_cache = InferCache() if getattr(graph.graph.get('cmd_params'), 'memoize_shape_infer', False) else None
+
     for n in nodes:
         # Data Flow Infer
         try:
@@ -132,7 +300,10 @@ def partial_infer(graph: Graph, start_node: str = None):
                         log.debug('Inputs:')
                         log_debug_dict(node.in_nodes(), 'input')
 
-                    node.infer(node)
+                    if infer_cache is not None:
+                        infer_cache.infer(node)
+                    else:
+                        node.infer(node)
                     out_nodes = node.out_nodes()
 
                     # propagate nchw_layout attributes to data nodes
@@ -199,6 +370,9 @@ def partial_infer(graph: Graph, start_node: str = None):
                         refer_to_faq_msg(38)) from err
         control_flow_infer(graph, n)
 
+    if infer_cache is not None:
+        infer_cache.log_statistics()
+
     not_fully_inferred = graph.get_nodes_with_attributes(is_not_fully_inferred=True)
     for n in not_fully_inferred:
         node = Node(graph, n)
@@ -15,10 +15,13 @@
 """
 
 import unittest
+from argparse import Namespace
 
 import numpy as np
 
+from extensions.ops.activation_ops import ReLU
 from mo.front.common.partial_infer.concat import concat_infer
+from mo.front.common.partial_infer.elemental import copy_shape_infer
 from mo.graph.graph import Node
 from mo.middle.passes.infer import override_placeholder_shapes, partial_infer
 from mo.utils.error import Error
@@ -291,3 +294,51 @@ class CycleTest(unittest.TestCase):
                             nodes_with_edges_only=True)
         with self.assertRaisesRegex(Error, 'Graph contains a cycle. Can not proceed.*'):
             partial_infer(graph)
+
+
+inferred_nodes = []
+
+
+def relu_infer(node: Node):
+    inferred_nodes.append(node.id)
+    copy_shape_infer(node)
+    node['inferred_shape'] = node.out_port(0).data.get_shape()
+
+
+class InferCacheTest(unittest.TestCase):
+    def setUp(self):
+        inferred_nodes.clear()
+
+    def build_graph(self, memoize: bool, input_value=None):
+        relu = {'kind': 'op', 'op': ReLU.op, 'type': ReLU.op, 'infer': relu_infer}
+        data = {'kind': 'data', 'value': None, 'shape': None}
+        graph = build_graph({'input_data': {**data, 'shape': np.array([1, 3]), 'value': input_value},
+                             'relu_1': relu, 'relu_1_data': data,
+                             'relu_2': relu, 'relu_2_data': data,
+                             'relu_3': relu, 'relu_3_data': data,
+                             'op_output': nodes_attributes['op_output']},
+                            [('input_data', 'relu_1'), ('relu_1', 'relu_1_data'),
+                             ('relu_1_data', 'relu_2'), ('relu_2', 'relu_2_data'), ('relu_2_data', 'relu_3'),
+                             ('relu_3', 'relu_3_data'), ('relu_3_data', 'op_output')])
+        graph.graph['cmd_params'] = Namespace(memoize_shape_infer=memoize)
+        return graph
+
+    def test_memoized(self):
+        graph = self.build_graph(memoize=True)
+        partial_infer(graph)
+        self.assertListEqual(inferred_nodes, ['relu_1'])
+        for name in ['relu_2', 'relu_3']:
+            node = Node(graph, name)
+            self.assertListEqual(list(node.out_node().shape), [1, 3])
+            self.assertListEqual(list(node.inferred_shape), [1, 3])
+            # the changed attributes are copied for every node
+            self.assertIsNot(node.inferred_shape, Node(graph, 'relu_1').inferred_shape)
+
+    def test_not_memoized(self):
+        partial_infer(self.build_graph(memoize=False))
+        self.assertListEqual(inferred_nodes, ['relu_1', 'relu_2', 'relu_3'])
+
+    def test_values_are_not_memoized(self):
+        # only the relu_1 input has the value, the relu_3 reuses the result of the relu_2
+        partial_infer(self.build_graph(memoize=True, input_value=np.array([[1, 2, 3]])))
+        self.assertListEqual(inferred_nodes, ['relu_1', 'relu_2'])
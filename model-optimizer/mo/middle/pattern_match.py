@@ -16,10 +16,11 @@
 
 import logging as log
 
+import networkx as nx
 import numpy as np
 from networkx.algorithms import isomorphism as ism
 
-from mo.graph.graph import Node, dict_includes, Graph
+from mo.graph.graph import Node, dict_includes, Graph, INDEXED_NODE_ATTRS
 
 
 def inverse_dict(d: dict):
@@ -32,9 +33,9 @@ def for_each_sub_graph(graph: Graph, func: callable):
         It doesn't search for sub-graphs in found sub-graphs recursively. If the recursion is required,
         a given function `func` should be implemented in a special way to enable fully recursive traversal.
     """
-    for node in graph.nodes():
-        node = Node(graph, node)
-        if node.has_valid('sub_graphs'):
+    for node_id, attrs in graph.nodes(data=True):
+        if attrs.get('sub_graphs') is not None:
+            node = Node(graph, node_id)
             for sub_graph_name in node.sub_graphs:
                 func(node[sub_graph_name])
 
@@ -129,8 +130,7 @@ def edge_match(datasets1, datasets2):
     return values1 == values2
 
 
-def build_matcher(graph: Graph, nodes: list, edges: list, node_attrs: list = None,
-                  edge_attrs: list = None):
+def build_pattern_graph(nodes: list, edges: list, node_attrs: list = None, edge_attrs: list = None):
     if node_attrs is not None or edge_attrs is not None:
         log.warning('\'edge_attrs\' or `\'node_attrs\'` parameter was passed to function \'find_pattern_matches\', '
                     'but they are not used anymore. Pattern matching proceeds according to \'nodes\' and \'edges\' '
@@ -141,16 +141,136 @@ def build_matcher(graph: Graph, nodes: list, edges: list, node_attrs: list = Non
     subgraph = Graph(name='pattern')
     subgraph.add_nodes_from(nodes)
     subgraph.add_edges_from(edges)
+    return subgraph
+
+
+def build_matcher(graph: Graph, nodes: list, edges: list, node_attrs: list = None,
+                  edge_attrs: list = None):
+    subgraph = build_pattern_graph(nodes, edges, node_attrs, edge_attrs)
     return ism.MultiDiGraphMatcher(graph, subgraph, node_match, edge_match)
 
 
+def _indexed_attrs(pattern_attrs: dict):
+    """
+    Returns hashable attributes of the pattern node which can be looked up in the index of graph nodes.
+    """
+    indexed_attrs = {}
+    for k in INDEXED_NODE_ATTRS:
+        v = pattern_attrs.get(k)
+        if v is None or callable(v):
+            continue
+        try:
+            hash(v)
+        except TypeError:
+            continue
+        indexed_attrs[k] = v
+    return indexed_attrs
+
+
+def _edges_correspond(graph: Graph, pattern: Graph, graph_u, graph_v, pattern_u, pattern_v):
+    """
+    Checks that the number of edges between graph nodes and pattern nodes is the same and the edges match
+    """
+    graph_edges = graph.succ[graph_u].get(graph_v)
+    pattern_edges = pattern.succ[pattern_u].get(pattern_v)
+    if len(graph_edges or {}) != len(pattern_edges or {}):
+        return False
+    return not pattern_edges or edge_match(graph_edges, pattern_edges)
+
+
+def match_pattern(graph: Graph, pattern: Graph):
+    """
+    Finds all node-induced sub-graphs of the graph isomorphic to the weakly connected pattern. The result is the same
+    as MultiDiGraphMatcher.subgraph_isomorphisms_iter produces with node_match and edge_match functions.
+
+    The search starts from the graph nodes matching the most selective pattern node by the attributes indexed by the
+    graph and grows the match along the pattern edges visiting only adjacent graph nodes. Edges between matched
+    nodes and node attributes are checked as soon as a node is added to the match.
+    :param graph: graph to search in
+    :param pattern: weakly connected pattern graph
+    :return: list of dictionaries mapping graph node to pattern node ordered by graph positions of matched nodes
+    """
+    pattern_nodes = list(pattern.nodes())
+    if len(pattern_nodes) == 0:
+        return []
+
+    seed, seed_count = pattern_nodes[0], None
+    for pattern_node in pattern_nodes:
+        count = graph.estimate_nodes_with_attributes_count(**_indexed_attrs(pattern.node[pattern_node]))
+        if seed_count is None or count < seed_count:
+            seed, seed_count = pattern_node, count
+    seed_attrs = _indexed_attrs(pattern.node[seed])
+    seed_candidates = graph.get_nodes_with_attributes(**seed_attrs) if len(seed_attrs) else list(graph.nodes())
+
+    # order pattern nodes so each of them except the seed is adjacent to one of the previous nodes
+    order, parents = [seed], {seed: None}
+    for pattern_node in order:
+        for neighbour in list(pattern.succ[pattern_node]) + list(pattern.pred[pattern_node]):
+            if neighbour not in parents:
+                parents[neighbour] = pattern_node
+                order.append(neighbour)
+    assert len(order) == len(pattern_nodes), 'The pattern is not weakly connected'
+
+    def candidates_for(pattern_node, mapping):
+        parent = parents[pattern_node]
+        if parent is None:
+            return seed_candidates
+        if pattern_node in pattern.succ[parent]:
+            pattern_edge, graph_adjacency = pattern.succ[parent][pattern_node][0], graph.succ[mapping[parent]]
+        else:
+            pattern_edge, graph_adjacency = pattern.succ[pattern_node][parent][0], graph.pred[mapping[parent]]
+        # port-aware filtering: at least one edge must have the same attributes as the pattern edge
+        return [n for n, edges in graph_adjacency.items()
+                if any(all(d.get(k) == v for k, v in pattern_edge.items()) for d in edges.values())]
+
+    def is_feasible(pattern_node, graph_node, mapping):
+        if not node_match(graph.node[graph_node], pattern.node[pattern_node]):
+            return False
+        if not _edges_correspond(graph, pattern, graph_node, graph_node, pattern_node, pattern_node):
+            return False
+        for mapped_pattern_node, mapped_graph_node in mapping.items():
+            if not _edges_correspond(graph, pattern, graph_node, mapped_graph_node, pattern_node,
+                                     mapped_pattern_node) or \
+                    not _edges_correspond(graph, pattern, mapped_graph_node, graph_node, mapped_pattern_node,
+                                          pattern_node):
+                return False
+        return True
+
+    matches = []
+    mapping, used = {}, set()
+
+    def extend(depth):
+        if depth == len(order):
+            matches.append({graph_node: pattern_node for pattern_node, graph_node in mapping.items()})
+            return
+        pattern_node = order[depth]
+        for graph_node in candidates_for(pattern_node, mapping):
+            if graph_node in used or not is_feasible(pattern_node, graph_node, mapping):
+                continue
+            mapping[pattern_node] = graph_node
+            used.add(graph_node)
+            extend(depth + 1)
+            del mapping[pattern_node]
+            used.discard(graph_node)
+
+    extend(0)
+
+    if len(matches) > 1:
+        position = graph.get_nodes_positions()
+        matches.sort(key=lambda match: tuple(position[graph_node] for graph_node in
+                                             sorted(match, key=lambda n: pattern_nodes.index(match[n]))))
+    return matches
+
+
 def find_pattern_matches(graph: Graph, nodes: list, edges: list, node_attrs: list = None,
                          edge_attrs: list = None):
     """
     Find all matches of a given sub-graph defined by [nodes, edges] in graph.
     """
-    matcher = build_matcher(graph, nodes, edges, node_attrs, edge_attrs)
-    return matcher.subgraph_isomorphisms_iter()
+    subgraph = build_pattern_graph(nodes, edges, node_attrs, edge_attrs)
+    if not isinstance(graph, Graph) or subgraph.number_of_nodes() == 0 or not nx.is_weakly_connected(subgraph):
+        return ism.MultiDiGraphMatcher(graph, subgraph, node_match, edge_match).subgraph_isomorphisms_iter()
+    return iter(match_pattern(graph, subgraph))
 
 
 def find_isomorphisms(graph: Graph, nodes: list, edges: list):
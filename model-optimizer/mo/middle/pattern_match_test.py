@@ -0,0 +1,103 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import random
+import unittest
+
+from mo.graph.graph import Graph
+from mo.middle.pattern_match import find_pattern_matches, build_matcher
+from mo.utils.unittest.graph import build_graph
+
+nodes_attributes = {
+    'input': {'kind': 'op', 'op': 'Parameter'},
+    'input_data': {'kind': 'data'},
+    'mul': {'kind': 'op', 'op': 'Mul'},
+    'mul_data': {'kind': 'data'},
+    'const': {'kind': 'op', 'op': 'Const'},
+    'const_data': {'kind': 'data'},
+    'add': {'kind': 'op', 'op': 'Add'},
+    'add_data': {'kind': 'data'},
+    'output': {'kind': 'op', 'op': 'Result'},
+}
+
+
+class FindPatternMatchesTest(unittest.TestCase):
+    @staticmethod
+    def vf2_matches(graph: Graph, nodes: list, edges: list):
+        return list(build_matcher(graph, nodes, edges).subgraph_isomorphisms_iter())
+
+    def check_matches(self, graph: Graph, nodes: list, edges: list):
+        matches = list(find_pattern_matches(graph, nodes, edges))
+        key = lambda match: sorted(match.items())
+        self.assertListEqual(sorted(map(key, matches)), sorted(map(key, self.vf2_matches(graph, nodes, edges))))
+        return matches
+
+    def build_graph(self):
+        return build_graph(nodes_attributes,
+                           [('input', 'input_data'),
+                            ('input_data', 'mul', {'in': 0}),
+                            ('const', 'const_data'),
+                            ('const_data', 'mul', {'in': 1}),
+                            ('mul', 'mul_data'),
+                            ('mul_data', 'add', {'in': 0}),
+                            ('const_data', 'add', {'in': 1}),
+                            ('add', 'add_data'),
+                            ('add_data', 'output')])
+
+    def test_ports(self):
+        graph = self.build_graph()
+        matches = self.check_matches(graph,
+                                     [('data', dict(kind='data')), ('op', dict(kind='op', op='Mul'))],
+                                     [('data', 'op', {'in': 1})])
+        self.assertListEqual(matches, [{'const_data': 'data', 'mul': 'op'}])
+
+    def test_induced_sub_graph(self):
+        graph = self.build_graph()
+        # the edge from const_data to add is not in the pattern so the match is rejected
+        self.check_matches(graph,
+                           [('const_data', dict(kind='data')), ('mul', dict(op='Mul')), ('mul_data', dict()),
+                            ('add', dict(op='Add'))],
+                           [('const_data', 'mul'), ('mul', 'mul_data'), ('mul_data', 'add')])
+
+    def test_callable_attribute(self):
+        graph = self.build_graph()
+        matches = self.check_matches(graph,
+                                     [('op', dict(kind='op', op=lambda op: op in ['Mul', 'Add'])),
+                                      ('data', dict(kind='data'))],
+                                     [('op', 'data')])
+        self.assertListEqual(matches, [{'mul': 'op', 'mul_data': 'data'}, {'add': 'op', 'add_data': 'data'}])
+
+    def test_random_graphs(self):
+        rng = random.Random(1)
+        ops = ['A', 'B', 'C']
+        for _ in range(300):
+            graph = Graph()
+            num_nodes = rng.randint(2, 10)
+            for i in range(num_nodes):
+                graph.add_node('n{}'.format(i), kind='op', op=rng.choice(ops))
+            for _ in range(rng.randint(1, 15)):
+                u, v = rng.sample(range(num_nodes), 2)
+                graph.add_edge('n{}'.format(u), 'n{}'.format(v), **{'in': rng.randint(0, 1), 'out': 0})
+
+            num_pattern_nodes = rng.randint(1, 4)
+            nodes = [('p{}'.format(i), dict(kind='op', **({'op': rng.choice(ops)} if rng.random() < 0.7 else {})))
+                     for i in range(num_pattern_nodes)]
+            edges = []
+            for i in range(1, num_pattern_nodes):
+                j = rng.randrange(i)
+                edge = ('p{}'.format(j), 'p{}'.format(i)) if rng.random() < 0.5 else ('p{}'.format(i), 'p{}'.format(j))
+                edges.append(edge + ({'in': rng.randint(0, 1)},) if rng.random() < 0.5 else edge)
+            self.check_matches(graph, nodes, edges)
@@ -26,6 +26,8 @@ class Const(Op):
     Operation producing constant value stored in the attribute 'value' of shape 'shape'.
     """
     op = 'Const'
+    # the value of the constant is propagated to the output
+    cacheable_infer = False
 
     def __init__(self, graph, attrs: dict = None):
         super().__init__(graph, {
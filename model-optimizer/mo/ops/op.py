@@ -15,6 +15,7 @@
 """
 
 import copy
+import importlib
 import logging as log
 from collections import namedtuple
 
@@ -33,6 +34,11 @@ class Op(object):
     registered_cls = []
     # Add the derived class to excluded_classes if one should not be registered in registered_ops
     excluded_classes = []
+    # maps an op to the (module, class name) of the operation class which module is imported on the first request
+    lazy_registered_ops = {}
+    # the infer function changes only the attributes of the node, of its input and output data nodes and edges and the
+    # changes depend only on these attributes, so the result may be reused for the same nodes (see InferCache)
+    cacheable_infer = True
 
     def __init__(self, graph: Graph, attrs1: dict = None, attrs2: dict = None):
         self.graph = graph
@@ -320,6 +326,9 @@ class Op(object):
 
     @staticmethod
     def get_op_class_by_name(name: str):
+        if name not in __class__.registered_ops and name in __class__.lazy_registered_ops:
+            module_name, class_name = __class__.lazy_registered_ops[name]
+            __class__.registered_ops[name] = getattr(importlib.import_module(module_name), class_name)
         return __class__.registered_ops[name]
 
     @classmethod
@@ -338,6 +347,9 @@ class Op(object):
 class PermuteAttrs:
     Permutation = namedtuple('Permutation', ['perm', 'inv'])
     Attr = namedtuple('Attr', ['name', 'port', 'func'])
+    # the qualified names are used to pickle the permutations stored in the graph
+    Permutation.__qualname__ = 'PermuteAttrs.Permutation'
+    Attr.__qualname__ = 'PermuteAttrs.Attr'
 
     common_permutation = lambda node, permutation, attr: node[attr][permutation.perm]
     slice_permutation = lambda node, permutation, attr: node[attr][  # doesn't depend from permutation variable
@@ -27,6 +27,7 @@ from extensions.back.op_versioning import OpVersioning
 from extensions.ops.Cast import Cast
 from mo.back.ie_ir_ver_2.emitter import port_renumber, serialize_constants, generate_ie_ir, serialize_mean_image
 from mo.graph.graph import Node, Graph
+from mo.graph.traversal import dfs_postorder, port_ordered_producers
 from mo.middle.passes import tensor_names, convert_data_type
 from mo.middle.passes.convert_data_type import data_type_str_to_np
 from mo.middle.passes.infer import type_infer
@@ -35,28 +36,17 @@ from mo.utils.error import Error
 
 
 def determined_sort(outputs: list):
+    if len(outputs) == 0:
+        return [], []
+    graph = outputs[0].graph
     op_order = []
     data_order = []
-    stack = list(outputs)
-    visited = set()
-    while len(stack) != 0:
-        node = stack[0]
-        node_id = node.id
-        stack.pop(0)
-        visited.add(node_id)
-        has_child = False
-        in_names = [n.id if isinstance(node.in_nodes(), list) else node.in_node(n).id for n in node.in_nodes()]
-        for in_node_name in in_names:
-            if in_node_name not in visited:
-                stack.insert(0, node)
-                stack.insert(0, Node(node.graph, in_node_name))
-                has_child = True
-                break
-        if not has_child:
-            if node.kind == 'op':
-                op_order.append(node_id)
-            if node.kind == 'data':
-                data_order.append(node_id)
+    for node_id in dfs_postorder([node.id for node in outputs], port_ordered_producers(graph)):
+        kind = graph.node[node_id]['kind']
+        if kind == 'op':
+            op_order.append(node_id)
+        if kind == 'data':
+            data_order.append(node_id)
     return op_order, data_order
 
 
@@ -18,14 +18,19 @@ import argparse
 from mo.graph.graph import Graph
 from mo.pipeline.common import get_ir_version
 from mo.utils import class_registration
+from mo.utils.checkpoint import load_checkpoint
 
 
 def unified_pipeline(argv: argparse.Namespace):
-    graph = Graph(cmd_params=argv, name=argv.model_name, ir_version=get_ir_version(argv))
-    class_registration.apply_replacements(graph, [
+    replacers_order = class_registration.get_replacers_order([
         class_registration.ClassType.LOADER,
         class_registration.ClassType.FRONT_REPLACER,
         class_registration.ClassType.MIDDLE_REPLACER,
         class_registration.ClassType.BACK_REPLACER
     ])
+    if getattr(argv, 'resume_from', None):
+        graph, start = load_checkpoint(argv.resume_from, argv, replacers_order)
+    else:
+        graph, start = Graph(cmd_params=argv, name=argv.model_name, ir_version=get_ir_version(argv)), 0
+    class_registration.apply_replacements_list(graph, replacers_order, start)
     return graph
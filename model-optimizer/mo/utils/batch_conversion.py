@@ -0,0 +1,252 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging as log
+import multiprocessing
+import os
+import time
+import traceback
+
+from mo.utils.error import Error, FrameworkError
+from mo.utils.guess_framework import deduce_framework_by_namespace
+from mo.utils.logger import init_logger
+from mo.utils.model_analysis import AnalysisResults
+
+# the command line parameters which configure the batch conversion itself and are not passed to the models
+BATCH_PARAMETERS = ['--batch_manifest', '--batch_workers']
+
+# the time spent by the current worker process to load the extensions and to order the transformations
+worker_warm_up_time = None
+# the error of the warm up of the current worker process, the models are not converted by the worker if it is set
+worker_warm_up_error = None
+
+
+def read_batch_manifest(path: str):
+    """
+    Reads the batch manifest: the list of the dictionaries with the command line parameters of the models
+    """
+    try:
+        with open(path, 'r') as f:
+            models = json.load(f)
+    except ValueError as e:
+        raise Error('Failed to parse the batch manifest {}: {}', path, e) from e
+    if not isinstance(models, list) or not all(isinstance(model, dict) for model in models):
+        raise Error('The batch manifest {} must contain the list of dictionaries with the command line parameters',
+                    path)
+    return models
+
+
+def model_parameters_to_args(parameters: dict):
+    """
+    Converts the dictionary with the model parameters to the command line arguments. The True value stands for the
+    flag, the parameters with False or None values are not specified. The list values are joined with comma.
+    """
+    args = []
+    for name, value in parameters.items():
+        if value is None or value is False:
+            continue
+        args.append('--' + name)
+        if value is True:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ','.join(str(v) for v in value)
+        args.append(str(value))
+    return args
+
+
+def remove_batch_args(args: list):
+    """
+    Removes the batch conversion parameters with their values from the command line arguments
+    """
+    result = []
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+            continue
+        name = arg.split('=', 1)[0]
+        if name in BATCH_PARAMETERS:
+            skip_value = '=' not in arg
+            continue
+        result.append(arg)
+    return result
+
+
+def warm_up(framework: str, extensions: [str, None], manifest_dir: [str, None], log_level: str):
+    """
+    Initializer of the worker process: loads the extensions and orders the transformations once, so they are reused
+    by all conversions made by the worker. The exception is not raised from the initializer, otherwise the pool
+    restarts the failed workers endlessly, it is reported as the conversion error of every model instead.
+    """
+    global worker_warm_up_time, worker_warm_up_error
+    start = time.perf_counter()
+
+    import telemetry.telemetry as tm
+    from mo.main import load_extensions
+    from mo.utils.class_registration import ClassType, get_replacers_order
+    from mo.utils.version import get_simplified_mo_version
+
+    try:
+        tm.Telemetry(app_name='Model Optimizer', app_version=get_simplified_mo_version())
+        init_logger(log_level, False)
+        load_extensions(framework, extensions.split(',') if extensions else None, manifest_dir)
+        get_replacers_order([ClassType.LOADER, ClassType.FRONT_REPLACER, ClassType.MIDDLE_REPLACER,
+                             ClassType.BACK_REPLACER])
+    except (Exception, SystemExit) as e:
+        worker_warm_up_error = 'Failed to load the extensions: {}'.format(str(e) or type(e).__name__)
+        log.debug(traceback.format_exc())
+    worker_warm_up_time = time.perf_counter() - start
+
+
+def convert_model(task: tuple):
+    """
+    Converts the single model in the worker process. The output of the conversion is captured and returned with the
+    conversion status, so the outputs of the models converted in parallel are not mixed.
+    """
+    from mo.main import driver
+
+    index, argv = task
+    output = io.StringIO()
+    handlers = [h for h in log.getLogger().handlers if isinstance(h, log.StreamHandler)]
+    streams = [h.setStream(output) for h in handlers]
+    # the analysis results are collected per model
+    AnalysisResults.reset()
+
+    status, error = 'fail', worker_warm_up_error
+    start = time.perf_counter()
+    try:
+        if error is None:
+            with contextlib.redirect_stdout(output):
+                if driver(argv) == 0:
+                    status = 'success'
+    except SystemExit as e:
+        error = 'Conversion exited with code {}'.format(e.code)
+    except (Error, FrameworkError) as e:
+        error = str(e)
+        log.debug(traceback.format_exc())
+    except Exception as e:
+        error = str(e)
+        output.write(traceback.format_exc())
+    finally:
+        for handler, stream in zip(handlers, streams):
+            if stream is not None:
+                handler.setStream(stream)
+
+    return {
+        'index': index,
+        'input_model': argv.input_model,
+        'model_name': argv.model_name,
+        'framework': argv.framework,
+        'status': status,
+        'error': error,
+        'time': time.perf_counter() - start,
+        'worker': os.getpid(),
+        'warm_up_time': worker_warm_up_time,
+        'output': output.getvalue(),
+    }
+
+
+def failed_result(index: int, parameters: dict, error: str):
+    return {'index': index, 'input_model': parameters.get('input_model'), 'model_name': parameters.get('model_name'),
+            'framework': parameters.get('framework'), 'status': 'fail', 'error': error, 'time': 0.0, 'worker': None,
+            'warm_up_time': None, 'output': ''}
+
+
+def print_report(results: list, wall_time: float, workers: int):
+    warm_up_times = {r['worker']: r['warm_up_time'] for r in results if r['warm_up_time'] is not None}
+    conversion_time = sum(r['time'] for r in results)
+
+    lines = ['|{:>5} |{:^9}|{:>10} |{:>8} | {}'.format('#', 'status', 'time, s', 'worker', 'model')]
+    for r in results:
+        lines.append('|{:>5} |{:^9}|{:>10.2f} |{:>8} | {}'.format(r['index'], r['status'], r['time'],
+                                                                  str(r['worker'] or '-'), r['input_model']))
+    print('[ BATCH ] Conversion results:\n{}'.format('\n'.join(lines)))
+    print('[ BATCH ] Converted {} of {} models by {} workers'.format(
+        sum(r['status'] == 'success' for r in results), len(results), workers))
+    speedup = conversion_time / wall_time if wall_time else 0.0
+    print('[ BATCH ] Total execution time: {:.2f} seconds, sum of the conversion times: {:.2f} seconds, workers warm '
+          'up time: {:.2f} seconds, speedup: {:.2f}x'.format(wall_time, conversion_time, sum(warm_up_times.values()),
+                                                            speedup))
+
+
+def convert_batch(argv: argparse.Namespace, cli_parser: argparse.ArgumentParser, framework: [str, None],
+                  args: list):
+    """
+    Converts the models listed in the batch manifest by the pool of the worker processes. The models are grouped by
+    the framework and the extensions, so every worker loads the extensions and orders the transformations once.
+
+    :param argv: the parsed command line arguments with the batch_manifest
+    :param cli_parser: the parser to parse the arguments of every model
+    :param framework: the framework forced by the entry point script or None
+    :param args: the command line arguments, they are applied to all models in the manifest
+    :return: 0 if all models are converted successfully and 1 otherwise
+    """
+    init_logger(argv.log_level.upper(), argv.silent)
+    models = read_batch_manifest(argv.batch_manifest)
+    common_args = remove_batch_args(args)
+
+    results = []
+    groups = {}
+    for index, parameters in enumerate(models):
+        try:
+            model_argv = cli_parser.parse_args(common_args + model_parameters_to_args(parameters))
+            if framework:
+                model_argv.framework = framework
+            deduce_framework_by_namespace(model_argv)
+        except SystemExit:
+            results.append(failed_result(index, parameters, 'Invalid command line parameters'))
+            continue
+        except Error as e:
+            results.append(failed_result(index, parameters, str(e)))
+            continue
+        manifest_dir = model_argv.cache_dir if model_argv.cache_dir and not model_argv.no_cache else None
+        group_key = (model_argv.framework, model_argv.extensions, manifest_dir, model_argv.log_level.upper())
+        groups.setdefault(group_key, []).append((index, model_argv))
+
+    workers = argv.batch_workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    for group_key, tasks in groups.items():
+        log.info('Converting {} {} models by {} workers'.format(len(tasks), group_key[0], min(workers, len(tasks))))
+        with multiprocessing.Pool(min(workers, len(tasks)), initializer=warm_up, initargs=group_key) as pool:
+            for result in pool.imap_unordered(convert_model, tasks):
+                log.info('Conversion of the model {}: {} in {:.2f} seconds'.format(
+                    result['input_model'], result['status'], result['time']))
+                results.append(result)
+            pool.close()
+            pool.join()
+    wall_time = time.perf_counter() - start
+
+    results.sort(key=lambda r: r['index'])
+    print_report(results, wall_time, workers)
+
+    for r in results:
+        if r['status'] != 'success':
+            print('[ BATCH ] Conversion of the model {} failed: {}\n{}'.format(r['input_model'], r['error'] or '',
+                                                                               r['output']))
+
+    report_path = os.path.splitext(argv.batch_manifest)[0] + '_report.json'
+    try:
+        with open(report_path, 'w') as f:
+            json.dump({'total_time': wall_time, 'workers': workers, 'models': results}, f, indent=4)
+        print('[ BATCH ] Report: {}'.format(report_path))
+    except OSError as e:
+        log.error('Failed to save the batch conversion report {}: {}'.format(report_path, e))
+
+    return 0 if all(r['status'] == 'success' for r in results) else 1
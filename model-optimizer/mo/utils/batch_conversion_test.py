@@ -0,0 +1,59 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+
+import mo.utils.batch_conversion as batch_conversion
+from mo.utils.batch_conversion import convert_model, model_parameters_to_args, read_batch_manifest, \
+    remove_batch_args, warm_up
+from mo.utils.error import Error
+
+
+class BatchConversionTest(unittest.TestCase):
+    def test_remove_batch_args(self):
+        args = ['--batch_manifest', 'models.json', '--data_type', 'FP16', '--batch_workers=4', '-b', '2']
+        self.assertListEqual(remove_batch_args(args), ['--data_type', 'FP16', '-b', '2'])
+
+    def test_model_parameters_to_args(self):
+        parameters = {'input_model': 'model.onnx', 'output': ['out1', 'out2'], 'scale': 255, 'silent': True,
+                      'disable_fusing': False, 'model_name': None}
+        self.assertListEqual(model_parameters_to_args(parameters),
+                             ['--input_model', 'model.onnx', '--output', 'out1,out2', '--scale', '255', '--silent'])
+
+    def test_read_batch_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'models.json')
+            with open(path, 'w') as f:
+                json.dump([{'input_model': 'model.onnx'}], f)
+            self.assertListEqual(read_batch_manifest(path), [{'input_model': 'model.onnx'}])
+
+            with open(path, 'w') as f:
+                json.dump({'input_model': 'model.onnx'}, f)
+            self.assertRaises(Error, read_batch_manifest, path)
+
+    def test_failed_warm_up(self):
+        # the worker is not terminated by the error, the models are reported as failed instead
+        try:
+            warm_up('unknown_framework', None, None, 'ERROR')
+            result = convert_model((0, Namespace(input_model='model.onnx', model_name=None, framework='onnx')))
+        finally:
+            batch_conversion.worker_warm_up_error = None
+        self.assertEqual(result['status'], 'fail')
+        self.assertRegex(result['error'], 'Failed to load the extensions')
@@ -0,0 +1,352 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import logging as log
+import marshal
+import os
+import pickle
+import shutil
+import sys
+import types
+
+import numpy as np
+from google.protobuf import message
+
+from mo.graph.graph import Graph
+from mo.utils.error import Error
+from mo.utils.version import get_version
+
+CHECKPOINT_VERSION = 2
+
+# phase of the conversion -> the pass separator transformation after which the checkpoint is saved
+CHECKPOINT_PHASES = {
+    'front': 'extensions.front.pass_separator.FrontFinish',
+    'middle': 'extensions.middle.pass_separator.MiddleFinish',
+    'back': 'extensions.back.pass_separator.BackFinish',
+}
+
+GRAPH_FILE_NAME = 'graph.pickle'
+
+# smaller arrays are stored in the graph file instead of the separate .npy files
+MIN_SEPARATE_ARRAY_SIZE = 1024
+
+# command line parameters of the resumed conversion which replace the saved ones, they do not affect the
+# transformations run before the checkpoint
+RESUMED_CONVERSION_PARAMETERS = ('output_dir', 'model_name', 'log_level', 'silent', 'save_checkpoint', 'resume_from',
+                                 'profile_transformations', 'graph_validation', 'graph_validation_period',
+                                 'full_clean_up')
+
+
+def qualified_name(cls):
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+def is_importable(obj):
+    """
+    Checks that the function or the class is pickled by the reference, so it is found by the module and qualified names
+    """
+    found = sys.modules.get(obj.__module__)
+    for name in obj.__qualname__.split('.'):
+        found = getattr(found, name, None)
+    return found is obj
+
+
+def import_module(name: str, path: str):
+    if name in sys.modules or path is None:
+        return importlib.import_module(name)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[name] = module
+    return module
+
+
+def message_module(obj: message.Message):
+    """
+    Returns the generated protobuf module defining the message class
+    """
+    for module in list(sys.modules.values()):
+        if getattr(module, 'DESCRIPTOR', None) is obj.DESCRIPTOR.file:
+            return module
+    raise pickle.PicklingError('Module of the protobuf message {} is not found'.format(obj.DESCRIPTOR.full_name))
+
+
+def message_class_path(obj: message.Message):
+    """
+    Returns the list of names of the message class and the classes containing it in the protobuf module
+    """
+    path = []
+    descriptor = obj.DESCRIPTOR
+    while descriptor is not None:
+        path.insert(0, descriptor.name)
+        descriptor = descriptor.containing_type
+    return path
+
+
+def make_cell(value):
+    return (lambda: value).__closure__[0]
+
+
+def find_attribute_path(container, obj, depth: int = 2):
+    """
+    Returns the path to the object in the attributes of the class or of the module: the attribute name and the keys of
+    the dictionaries, lists and tuples containing the object, for example the lambda functions in the dictionary of
+    the permutations of PermuteAttrs. None is returned if the object is not found.
+    """
+    if isinstance(container, (type, types.ModuleType)):
+        items = vars(container).items()
+    elif isinstance(container, dict):
+        items = container.items()
+    else:
+        items = enumerate(container)
+    for key, value in items:
+        if isinstance(value, staticmethod):
+            value = value.__func__
+        if value is obj:
+            return [key]
+        if depth > 1 and isinstance(value, (dict, list, tuple)):
+            path = find_attribute_path(value, obj, depth - 1)
+            if path is not None:
+                return [key] + path
+    return None
+
+
+def find_container(module: str, container_qualname: str):
+    container = importlib.import_module(module)
+    for name in filter(None, container_qualname.split('.')):
+        container = getattr(container, name)
+    return container
+
+
+def attribute_reference(obj: types.FunctionType):
+    """
+    Returns the reference to the function which is not importable by the qualified name, but it is stored in the
+    attribute of the class or of the module defining it: the qualified name of the container and the path to the
+    function in its attributes. None is returned if there is no such attribute.
+    """
+    if '<locals>' in obj.__qualname__:
+        return None
+    container_qualname = obj.__qualname__.rpartition('.')[0]
+    try:
+        container = find_container(obj.__module__, container_qualname)
+    except (ImportError, AttributeError):
+        return None
+    path = find_attribute_path(container, obj)
+    return None if path is None else (obj.__module__, container_qualname, path)
+
+
+def find_attribute(module: str, container_qualname: str, path: list):
+    value = vars(find_container(module, container_qualname))[path[0]]
+    for key in path[1:]:
+        value = value[key]
+    return value.__func__ if isinstance(value, staticmethod) else value
+
+
+def nested_codes(code: types.CodeType):
+    """
+    Returns the code objects of the functions defined in the code in the depth-first order
+    """
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield const
+            yield from nested_codes(const)
+
+
+def code_reference(module: str, qualname: str, code: types.CodeType):
+    """
+    Returns the reference to the code of the local function, for example the lambda function defined in the __init__
+    of the registered operation class: the qualified name of the importable function defining it, the name and the
+    line of the code and its index among the codes with the same name and line. None is returned if there is no such
+    importable function.
+    """
+    if '.<locals>.' not in qualname:
+        return None
+    enclosing_qualname = qualname.split('.<locals>.')[0]
+    try:
+        enclosing = find_container(module, enclosing_qualname)
+    except (ImportError, AttributeError):
+        return None
+    enclosing_code = getattr(getattr(enclosing, '__func__', enclosing), '__code__', None)
+    if enclosing_code is None:
+        return None
+    same_codes = [c for c in nested_codes(enclosing_code)
+                  if c.co_name == code.co_name and c.co_firstlineno == code.co_firstlineno]
+    for index, same_code in enumerate(same_codes):
+        if same_code is code:
+            return enclosing_qualname, code.co_name, code.co_firstlineno, index
+    return None
+
+
+def find_code(module: str, reference: tuple):
+    enclosing_qualname, name, first_line, index = reference
+    enclosing = find_container(module, enclosing_qualname)
+    same_codes = [c for c in nested_codes(getattr(enclosing, '__func__', enclosing).__code__)
+                  if c.co_name == name and c.co_firstlineno == first_line]
+    if index >= len(same_codes):
+        raise pickle.UnpicklingError('The code of the function {} is not found in the {}.{}'.format(
+            name, module, enclosing_qualname))
+    return same_codes[index]
+
+
+def make_function(module: str, code: tuple, name: str, qualname: str, defaults: tuple, kwdefaults: dict,
+                  closure: tuple):
+    kind, value = code
+    code = find_code(module, value) if kind == 'reference' else marshal.loads(value)
+    func = types.FunctionType(code, importlib.import_module(module).__dict__, name, defaults,
+                              None if closure is None else tuple(make_cell(value) for value in closure))
+    func.__qualname__ = qualname
+    func.__kwdefaults__ = kwdefaults
+    return func
+
+
+class CheckpointPickler(pickle.Pickler):
+    """
+    Pickler which stores the numpy arrays to the separate .npy files. The modules are pickled by the name and the path.
+    The functions which are not importable, for example, lambda functions used for the 'infer' or 'IE' attributes, are
+    pickled by the reference to the attribute of the class or of the module storing them, like the permutations of
+    PermuteAttrs, or with their closures and the reference to their code in the importable function defining them,
+    like the __init__ of the registered operation class. The code of the other functions is pickled by value.
+    """
+
+    def __init__(self, file, checkpoint_dir: str):
+        super().__init__(file, protocol=4)
+        self.checkpoint_dir = checkpoint_dir
+        # id of the object -> (object, persistent id), the object is kept alive so the ids are not reused and the same
+        # persistent id object is pickled once
+        self.persistent_ids = {}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject and obj.nbytes >= MIN_SEPARATE_ARRAY_SIZE:
+            if id(obj) not in self.persistent_ids:
+                file_name = '{}.npy'.format(len(self.persistent_ids))
+                np.save(os.path.join(self.checkpoint_dir, file_name), obj, allow_pickle=False)
+                self.persistent_ids[id(obj)] = (obj, ('array', file_name))
+            return self.persistent_ids[id(obj)][1]
+        if isinstance(obj, types.ModuleType):
+            # the module may be imported from the path which is not in the sys.path, for example, the Caffe parser
+            return 'module', (obj.__name__, getattr(obj, '__file__', None))
+        if isinstance(obj, message.Message) and not is_importable(type(obj)):
+            # the message of the protobuf module which classes are not found by the module name like caffe_pb2 ones
+            return 'message', (message_module(obj), message_class_path(obj), obj.SerializeToString())
+        if isinstance(obj, types.FunctionType) and not is_importable(obj):
+            if id(obj) not in self.persistent_ids:
+                reference = attribute_reference(obj)
+                if reference is not None:
+                    self.persistent_ids[id(obj)] = (obj, ('attribute', reference))
+                else:
+                    reference = code_reference(obj.__module__, obj.__qualname__, obj.__code__)
+                    code = ('reference', reference) if reference is not None else \
+                        ('marshal', marshal.dumps(obj.__code__))
+                    closure = None if obj.__closure__ is None else \
+                        tuple(cell.cell_contents for cell in obj.__closure__)
+                    self.persistent_ids[id(obj)] = (obj, ('function', (
+                        obj.__module__, code, obj.__name__, obj.__qualname__, obj.__defaults__, obj.__kwdefaults__,
+                        closure)))
+            return self.persistent_ids[id(obj)][1]
+        return None
+
+
+class CheckpointUnpickler(pickle.Unpickler):
+    """
+    Unpickler which memory-maps the arrays stored by the CheckpointPickler. The arrays are mapped in the copy-on-write
+    mode, so they may be modified by the transformations without changes of the files.
+    """
+
+    def __init__(self, file, checkpoint_dir: str):
+        super().__init__(file)
+        self.checkpoint_dir = checkpoint_dir
+        # the function pickled once is loaded once
+        self.functions = {}
+
+    def persistent_load(self, pid):
+        kind, value = pid
+        if kind == 'array':
+            return np.load(os.path.join(self.checkpoint_dir, value), mmap_mode='c', allow_pickle=False).view(
+                np.ndarray)
+        if kind == 'module':
+            return import_module(*value)
+        if kind == 'message':
+            module, class_path, serialized = value
+            message_class = module
+            for name in class_path:
+                message_class = getattr(message_class, name)
+            return message_class.FromString(serialized)
+        if kind == 'attribute':
+            return find_attribute(*value)
+        if kind == 'function':
+            if id(value) not in self.functions:
+                self.functions[id(value)] = (value, make_function(*value))
+            return self.functions[id(value)][1]
+        raise pickle.UnpicklingError('Unknown persistent object type "{}"'.format(kind))
+
+
+def checkpoint_dir_name(argv: argparse.Namespace, phase: str):
+    return os.path.join(argv.output_dir, '{}_{}.checkpoint'.format(argv.model_name, phase))
+
+
+def save_checkpoint(graph: Graph, checkpoint_dir: str, phase: str):
+    """
+    Saves the graph to the checkpoint directory: the pickled graph with all the attributes and the .npy file for each
+    large numpy array.
+    """
+    tmp_dir = '{}.{}.tmp'.format(checkpoint_dir, os.getpid())
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    try:
+        with open(os.path.join(tmp_dir, GRAPH_FILE_NAME), 'wb') as f:
+            CheckpointPickler(f, tmp_dir).dump({'checkpoint_version': CHECKPOINT_VERSION, 'mo_version': get_version(),
+                                               'python_version': sys.version, 'phase': phase, 'graph': graph})
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        os.rename(tmp_dir, checkpoint_dir)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, ValueError, RecursionError) as e:
+        raise Error('Failed to save the checkpoint to the "{}": {}', checkpoint_dir, e) from e
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_checkpoint(checkpoint_dir: str, argv: argparse.Namespace, replacers_order: list):
+    """
+    Loads the graph saved by the save_checkpoint. The command line parameters of the graph are the saved ones updated
+    with the RESUMED_CONVERSION_PARAMETERS from the argv.
+    :return: the graph and the index of the transformation in the replacers_order to resume the conversion from
+    """
+    try:
+        with open(os.path.join(checkpoint_dir, GRAPH_FILE_NAME), 'rb') as f:
+            data = CheckpointUnpickler(f, checkpoint_dir).load()
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError) as e:
+        raise Error('Failed to load the checkpoint from the "{}": {}', checkpoint_dir, e) from e
+    # the code of functions is stored in the format specific for the Python version
+    if data.get('checkpoint_version') != CHECKPOINT_VERSION or data.get('mo_version') != get_version() or \
+            data.get('python_version') != sys.version:
+        raise Error('The checkpoint "{}" is saved by the other version of the Model Optimizer or Python',
+                    checkpoint_dir)
+
+    names = [qualified_name(replacer_cls) for replacer_cls in replacers_order]
+    separator = CHECKPOINT_PHASES[data['phase']]
+    if separator not in names:
+        raise Error('The transformation "{}" the checkpoint "{}" is saved after is not found', separator,
+                    checkpoint_dir)
+
+    graph = data['graph']
+    for name in RESUMED_CONVERSION_PARAMETERS:
+        if hasattr(argv, name):
+            setattr(graph.graph['cmd_params'], name, getattr(argv, name))
+    log.debug('The conversion is resumed after the "{}" phase from the checkpoint "{}"'.format(data['phase'],
+                                                                                               checkpoint_dir))
+    return graph, names.index(separator) + 1
@@ -0,0 +1,105 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+
+import numpy as np
+
+from extensions.front.pass_separator import FrontFinish, FrontStart
+from extensions.middle.pass_separator import MiddleFinish
+from mo.graph.graph import Node
+from mo.ops.op import PermuteAttrs
+from mo.utils.checkpoint import load_checkpoint, save_checkpoint
+from mo.utils.error import Error
+from mo.utils.unittest.graph import build_graph
+
+nodes = {
+    'input': {'kind': 'op', 'op': 'Parameter'},
+    'input_data': {'kind': 'data', 'shape': np.array([1, 3]), 'value': None},
+    'add': {'kind': 'op', 'op': 'Add'},
+    'const_data': {'kind': 'data', 'shape': np.array([1024]), 'value': np.arange(1024, dtype=np.float32)},
+    'add_data': {'kind': 'data', 'shape': np.array([1, 3]), 'value': None},
+    'result': {'kind': 'op', 'op': 'Result'},
+}
+
+
+def make_infer(shape: list):
+    return lambda node: node.out_node().__setitem__('shape', np.array(shape))
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_dir = os.path.join(self.tmp_dir.name, 'model_front.checkpoint')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def save_graph(self):
+        graph = build_graph(nodes, [('input', 'input_data'), ('input_data', 'add'), ('const_data', 'add'),
+                                    ('add', 'add_data'), ('add_data', 'result')])
+        graph.graph['cmd_params'] = Namespace(output_dir='saved', static_shape=True)
+        Node(graph, 'add')['infer'] = make_infer([1, 3])
+        Node(graph, 'add')['permutation'] = PermuteAttrs.common_permutation
+        # the function which code is not found by the reference
+        Node(graph, 'add')['type_infer'] = eval('lambda node: node.out_node().__setitem__("data_type", np.float32)')
+        save_checkpoint(graph, self.checkpoint_dir, 'front')
+        return graph
+
+    def test_resume(self):
+        graph = self.save_graph()
+        # only the large array is saved to the separate file
+        self.assertEqual(len([f for f in os.listdir(self.checkpoint_dir) if f.endswith('.npy')]), 1)
+
+        loaded, start = load_checkpoint(self.checkpoint_dir, Namespace(output_dir='resumed', static_shape=False),
+                                        [FrontStart, FrontFinish, MiddleFinish])
+        self.assertEqual(start, 2)
+        self.assertListEqual(list(loaded.nodes()), list(graph.nodes()))
+        self.assertListEqual(list(loaded.edges(keys=True, data=True)), list(graph.edges(keys=True, data=True)))
+        # only the parameters not affecting the saved phases are updated
+        self.assertEqual(loaded.graph['cmd_params'].output_dir, 'resumed')
+        self.assertTrue(loaded.graph['cmd_params'].static_shape)
+
+        # the lambda function is restored with the closure
+        add = Node(loaded, 'add')
+        add.out_node()['shape'] = None
+        add.infer(add)
+        self.assertListEqual(list(add.out_node().shape), [1, 3])
+        # the code of the functions defined by the importable functions and classes is restored by the reference
+        self.assertIs(add.infer.__code__, Node(graph, 'add').infer.__code__)
+        self.assertIs(add.permutation, PermuteAttrs.common_permutation)
+        add.type_infer(add)
+        self.assertEqual(add.out_node().data_type, np.float32)
+
+        value = Node(loaded, 'const_data').value
+        self.assertIsInstance(value.base, np.memmap)
+        self.assertTrue(np.array_equal(value, np.arange(1024, dtype=np.float32)))
+        # the memory-mapped values are modified without changes of the checkpoint
+        value[0] = 10
+        reloaded, _ = load_checkpoint(self.checkpoint_dir, Namespace(), [FrontFinish])
+        self.assertEqual(Node(reloaded, 'const_data').value[0], 0)
+
+    def test_phase_is_not_found(self):
+        self.save_graph()
+        with self.assertRaisesRegex(Error, 'FrontFinish'):
+            load_checkpoint(self.checkpoint_dir, Namespace(), [FrontStart, MiddleFinish])
+
+    def test_no_checkpoint(self):
+        with self.assertRaisesRegex(Error, 'Failed to load the checkpoint'):
+            load_checkpoint(self.checkpoint_dir, Namespace(), [FrontFinish])
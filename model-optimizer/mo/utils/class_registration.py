@@ -20,14 +20,32 @@ from enum import Enum
 import networkx as nx
 
 from mo.graph.graph import Graph
+from mo.graph.traversal import topological_order
 from mo.middle.passes.eliminate import shape_inference
 from mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
+from mo.utils.checkpoint import CHECKPOINT_PHASES, checkpoint_dir_name, qualified_name, save_checkpoint
 from mo.utils.error import Error, InternalError, FrameworkError
 from mo.utils.logger import progress_bar
+from mo.utils.transformations_profiler import profile_transform, profile_stage
 from mo.utils.utils import refer_to_faq_msg
 
 _registered_classes_dict = {}
 
+# manifest of the registered extensions used to order the transformations instead of the imported classes
+_extensions_manifest = None
+
+# maps the tuple of transformation types to the transformations order, it is reset when the registration is updated
+_replacers_order_cache = {}
+
+# number of transformations applied with the periodic graph validation
+_validated_transforms_count = 0
+
+
+def set_extensions_manifest(manifest):
+    global _extensions_manifest
+    _extensions_manifest = manifest
+    _replacers_order_cache.clear()
+
 
 def _check_unique_ids():
     """
@@ -113,6 +131,7 @@ def _update(cls, registered_list: list, registered_dict: dict, key: str, enabled
 
 
 def update_registration(classes: list, enabled_transforms: list, disabled_transforms: list):
+    _replacers_order_cache.clear()
     for cls in classes:
         _update(cls, cls.registered_cls, cls.registered_ops, 'op', enabled_transforms, disabled_transforms)
         _registered_classes_dict.setdefault(cls.class_type(), set()).add(cls)
@@ -198,20 +217,14 @@ class DependencyGraph(Graph):
                 ''.format(transform_name, transform_class, name_to_class_map[transform_name])
             name_to_class_map[transform_name] = transform_class
 
-    def sort_util(self, v, visited, stack):
-        visited.append(v)
-        for i in sorted([child for _, child in self.out_edges(v)], key=lambda x: x.__name__):
-            if i not in visited:
-                self.sort_util(i, visited, stack)
-        stack.insert(0, v)
+    def sorted_children(self, v):
+        return sorted(self.successors(v), key=lambda x: x.__name__)
 
     def determined_sort(self):
         self.cycle_check()
         self.repeated_cls_names_check()
-        transforms = sorted([cls for cls in self.nodes() if len(self.in_edges(cls)) == 0], key=lambda x: x.__name__)
-        order, visited = [], []
-        for transform in transforms:
-            self.sort_util(transform, visited, order)
+        transforms = sorted([cls for cls, in_degree in self.in_degree() if in_degree == 0], key=lambda x: x.__name__)
+        order = topological_order(transforms, self.sorted_children)
 
         graph_copy = self.copy()
         for i in range(len(order) - 1):
@@ -226,14 +239,10 @@ class DependencyGraph(Graph):
         return order
 
 
-def get_replacers_order(transform_types: list):
+def get_registered_replacers(transform_types: list):
     """
-    Gets all transforms that do not have 'op'.
-    If two or more classes replaces the same op (both have op class attribute and values match), such
-    pattern is not applied (while registration it will warn user that we have a conflict).
+    Gets all registered transforms of the given types that are not excluded from the ordering.
     """
-    dependency_graph = DependencyGraph(name="UnifiedPipeline" if len(transform_types) != 1 else transform_types[0].name)
-
     replacers = []
     for class_type, classes_set in _registered_classes_dict.items():
         if class_type in transform_types:
@@ -242,24 +251,84 @@ def get_replacers_order(transform_types: list):
                                     [c for op, c in cls.registered_ops.items() if c]
                 replacers.extend(
                     [replacer for replacer in cur_cls_replacers if replacer not in cls.excluded_replacers])
+    return replacers
+
+
+def get_replacers_order(transform_types: list):
+    """
+    Gets all transforms that do not have 'op'.
+    If two or more classes replaces the same op (both have op class attribute and values match), such
+    pattern is not applied (while registration it will warn user that we have a conflict).
+    If the extensions manifest is set, the dependencies are taken from the manifest and only the classes which may be
+    applied are imported.
+    The order is computed once for the registered classes, so the following conversions in the same process reuse it.
+    """
+    key = tuple(transform_types)
+    if key in _replacers_order_cache:
+        return list(_replacers_order_cache[key])
+
+    dependency_graph = DependencyGraph(name="UnifiedPipeline" if len(transform_types) != 1 else transform_types[0].name)
+
+    if _extensions_manifest is not None:
+        _extensions_manifest.add_dependencies(dependency_graph, transform_types)
+        replacers_order = _extensions_manifest.resolve(dependency_graph.determined_sort())
+    else:
+        replacers = get_registered_replacers(transform_types)
 
-    for replacer_cls in replacers:
-        dependency_graph.add_node(replacer_cls)
+        for replacer_cls in replacers:
+            dependency_graph.add_node(replacer_cls)
 
-    for i, replacer_cls in enumerate(replacers):
-        for cls_after in replacer_cls().run_before():
-            dependency_graph.add_edge(replacer_cls, cls_after)
-        for cls_before in replacer_cls().run_after():
-            dependency_graph.add_edge(cls_before, replacer_cls)
+        for i, replacer_cls in enumerate(replacers):
+            for cls_after in replacer_cls().run_before():
+                dependency_graph.add_edge(replacer_cls, cls_after)
+            for cls_before in replacer_cls().run_after():
+                dependency_graph.add_edge(cls_before, replacer_cls)
 
-    replacers_order = dependency_graph.determined_sort()
+        replacers_order = dependency_graph.determined_sort()
 
     debug_msg_list = ['|  id  | enabled | class ']
     for i, replacer_cls in enumerate(replacers_order):
         debug_msg_list.append('|{:5} |{:^9}| {}'.format(i, str(getattr(replacer_cls, 'enabled', None)), replacer_cls))
     log.debug('Replacers execution order: \n{}'.format('\n'.join(debug_msg_list)))
 
-    return replacers_order
+    _replacers_order_cache[key] = replacers_order
+    return list(replacers_order)
+
+
+def get_graph_validation_level(graph: Graph):
+    """
+    Returns the graph validation level set by the --graph_validation command line parameter. The full validation is
+    done by default if the command line parameters are not available or the DEBUG log level is requested.
+    """
+    argv = graph.graph.get('cmd_params')
+    level = getattr(argv, 'graph_validation', None)
+    if level is None:
+        level = 'full' if getattr(argv, 'log_level', 'DEBUG') == 'DEBUG' else 'touched'
+    if level == 'periodic':
+        global _validated_transforms_count
+        _validated_transforms_count += 1
+        period = getattr(argv, 'graph_validation_period', None) or 1
+        level = 'full' if _validated_transforms_count % period == 0 else 'touched'
+    return level
+
+
+def validate_graph(graph: Graph, replacer_cls, level: str, recursively: bool):
+    """
+    Validates the graph and its sub-graphs if the 'recursively' is True. The 'touched' validation level checks only the
+    nodes which were changed after the Graph.start_tracking_changes call, all nodes are checked in the graphs where the
+    changes were not tracked.
+    """
+    if level == 'off':
+        return
+    graph.check_empty_graph(replacer_cls)
+    graphs = []
+    if recursively:
+        for_graph_and_each_sub_graph_recursively(graph, graphs.append)
+    else:
+        graphs.append(graph)
+    for g in graphs:
+        touched = g.stop_tracking_changes()
+        g.check_shapes_consistency(touched if level == 'touched' else None)
 
 
 @progress_bar
@@ -283,24 +352,32 @@ def apply_transform(graph: Graph, replacer_cls, **kwargs):
 
     log.debug("Run replacer {}".format(replacer_cls))
 
+    run_recursively = not (hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively)
+    validation_level = get_graph_validation_level(graph)
+    tracked_graphs = []
+    if validation_level == 'touched':
+        for_graph_and_each_sub_graph_recursively(graph, tracked_graphs.append)
+        for g in tracked_graphs:
+            g.start_tracking_changes()
+
     try:
-        if hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively:
-            replacer.find_and_replace_pattern(graph)
-        else:
-            for_graph_and_each_sub_graph_recursively(graph, replacer.find_and_replace_pattern)
+        with profile_transform(graph, replacer_cls) as record:
+            with profile_stage(record, 'transform'):
+                if hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively:
+                    replacer.find_and_replace_pattern(graph)
+                else:
+                    for_graph_and_each_sub_graph_recursively(graph, replacer.find_and_replace_pattern)
 
-        if hasattr(replacer, 'force_clean_up') and replacer.force_clean_up:
-            for_graph_and_each_sub_graph_recursively(graph, lambda G: G.clean_up())
+            if hasattr(replacer, 'force_clean_up') and replacer.force_clean_up:
+                with profile_stage(record, 'clean_up'):
+                    for_graph_and_each_sub_graph_recursively(graph, lambda G: G.clean_up())
 
-        if hasattr(replacer, 'force_shape_inference') and replacer.force_shape_inference:
-            shape_inference(graph)
+            if hasattr(replacer, 'force_shape_inference') and replacer.force_shape_inference:
+                with profile_stage(record, 'shape_inference'):
+                    shape_inference(graph)
 
-        if hasattr(replacer, 'run_not_recursively') and replacer.run_not_recursively:
-            graph.check_empty_graph(replacer_cls)
-            graph.check_shapes_consistency()
-        else:
-            for_graph_and_each_sub_graph_recursively(graph, lambda _: graph.check_empty_graph(replacer_cls))
-            for_graph_and_each_sub_graph_recursively(graph, lambda _: graph.check_shapes_consistency())
+            with profile_stage(record, 'validation'):
+                validate_graph(graph, replacer_cls, validation_level, run_recursively)
 
     except Error as err:
         raise Error('Exception occurred during running replacer "{}" ({}): {}'.format(
@@ -316,18 +393,29 @@ def apply_transform(graph: Graph, replacer_cls, **kwargs):
             replacer_cls,
             str(err).replace('[REPLACEMENT_ID]', replacement_id),
         )) from err
+    finally:
+        # the graphs removed by the transformation are not validated
+        for g in tracked_graphs:
+            g.stop_tracking_changes()
 
 
-def apply_replacements_list(graph: Graph, replacers_order: list):
+def apply_replacements_list(graph: Graph, replacers_order: list, start: int = 0):
     """
-    Apply all transformations from replacers_order
+    Apply all transformations from replacers_order starting from the transformation with the 'start' index. The graph
+    is saved to the checkpoint after the pass separator of the phase specified with the --save_checkpoint.
     """
-    for i, replacer_cls in enumerate(replacers_order):
+    checkpoint_phase = getattr(graph.graph.get('cmd_params'), 'save_checkpoint', None)
+    for i, replacer_cls in enumerate(replacers_order[start:], start):
         apply_transform(
             graph=graph,
             replacer_cls=replacer_cls,
             curr_transform_num=i,
             num_transforms=len(replacers_order))
+        if checkpoint_phase is not None and qualified_name(replacer_cls) == CHECKPOINT_PHASES[checkpoint_phase]:
+            checkpoint_dir = checkpoint_dir_name(graph.graph['cmd_params'], checkpoint_phase)
+            save_checkpoint(graph, checkpoint_dir, checkpoint_phase)
+            log.info('The graph after the {} phase is saved to the checkpoint {}'.format(checkpoint_phase,
+                                                                                      checkpoint_dir))
 
 
 def apply_replacements(graph: Graph, replacements_type: list):
@@ -0,0 +1,95 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import unittest
+from argparse import Namespace
+
+import numpy as np
+
+import mo.utils.class_registration as class_registration
+from mo.graph.graph import Graph
+from mo.utils.class_registration import apply_transform
+from mo.utils.error import Error
+from mo.utils.unittest.graph import build_graph
+
+nodes = {
+    'input': {'kind': 'op', 'op': 'Parameter'},
+    'input_data': {'kind': 'data', 'shape': np.array([1, 3]), 'value': None},
+    'relu': {'kind': 'op', 'op': 'ReLU'},
+    'relu_data': {'kind': 'data', 'shape': np.array([1, 3]), 'value': None},
+    'result': {'kind': 'op', 'op': 'Result'},
+}
+
+
+class SetWrongShape:
+    enabled = True
+
+    def find_and_replace_pattern(self, graph: Graph):
+        graph.node['relu_data']['shape'] = [1, 3]
+
+
+class RenameRelu:
+    enabled = True
+
+    def find_and_replace_pattern(self, graph: Graph):
+        graph.node['relu']['name'] = 'relu'
+
+
+class GraphValidationTest(unittest.TestCase):
+    def setUp(self):
+        class_registration._validated_transforms_count = 0
+
+    @staticmethod
+    def build_graph(**kwargs):
+        graph = build_graph(nodes, [('input', 'input_data'), ('input_data', 'relu'), ('relu', 'relu_data'),
+                                    ('relu_data', 'result')])
+        graph.graph['cmd_params'] = Namespace(progress=False, **kwargs)
+        return graph
+
+    @staticmethod
+    def apply(graph: Graph, replacer_cls):
+        apply_transform(graph=graph, replacer_cls=replacer_cls, curr_transform_num=0, num_transforms=1)
+
+    def test_changed_nodes_validation(self):
+        for level in ['touched', 'full', 'periodic']:
+            with self.assertRaisesRegex(Error, 'inconsistent shapes'):
+                self.apply(self.build_graph(graph_validation=level, graph_validation_period=1), SetWrongShape)
+
+    def test_not_changed_nodes_validation(self):
+        graph = self.build_graph(graph_validation='touched')
+        graph.node['input_data']['shape'] = [1, 3]
+        self.apply(graph, RenameRelu)
+        graph.graph['cmd_params'].graph_validation = 'full'
+        with self.assertRaisesRegex(Error, 'inconsistent shapes'):
+            self.apply(graph, RenameRelu)
+
+    def test_periodic_validation(self):
+        graph = self.build_graph(graph_validation='periodic', graph_validation_period=2)
+        graph.node['input_data']['shape'] = [1, 3]
+        self.apply(graph, RenameRelu)
+        with self.assertRaisesRegex(Error, 'inconsistent shapes'):
+            self.apply(graph, RenameRelu)
+
+    def test_validation_off(self):
+        self.apply(self.build_graph(graph_validation='off'), SetWrongShape)
+
+    def test_default_level(self):
+        graph = self.build_graph(log_level='ERROR')
+        graph.node['input_data']['shape'] = [1, 3]
+        self.apply(graph, RenameRelu)
+        graph.graph['cmd_params'].log_level = 'DEBUG'
+        with self.assertRaisesRegex(Error, 'inconsistent shapes'):
+            self.apply(graph, RenameRelu)
@@ -337,6 +337,66 @@ def get_common_cli_parser(parser: argparse.ArgumentParser = None):
     common_group.add_argument('--transformations_config',
                           help='Use the configuration file with transformations description.',
                           action=CanonicalizePathCheckExistenceAction)
+    common_group.add_argument('--profile_transformations',
+                              help='Collect wall time, CPU time, graph size and memory statistics for every '
+                                   'transformation. The table with the slowest transformations is printed at the end '
+                                   'of conversion, full statistics are saved to the output directory as JSON and '
+                                   'Chrome trace files.',
+                              action='store_true', default=False)
+    common_group.add_argument('--cache_dir',
+                              help='Directory of the conversion cache. If the model was already converted with the '
+                                   'same parameters, model files, extensions and Model Optimizer version, the IR is '
+                                   'taken from the cache without conversion. The cache is disabled by default, the '
+                                   'default directory can be set with the MO_CONVERSION_CACHE_DIR environment '
+                                   'variable. The manifest of the extensions is also stored to this directory to speed '
+                                   'up the start.',
+                              action=CanonicalizePathAction,
+                              default=os.environ.get('MO_CONVERSION_CACHE_DIR'))
+    common_group.add_argument('--no_cache',
+                              help='Do not use the conversion cache even if the cache directory is specified.',
+                              action='store_true', default=False)
+    common_group.add_argument('--batch_manifest',
+                              help='JSON file with the list of models to convert. Every element of the list is the '
+                                   'dictionary of the command line parameters for one model, for example '
+                                   '{"input_model": "model.onnx", "output_dir": "ir/model"}. The parameters specified '
+                                   'in the command line are applied to all models. The models are converted in '
+                                   'parallel by the worker processes which load the extensions once.',
+                              action=CanonicalizePathCheckExistenceAction)
+    common_group.add_argument('--batch_workers',
+                              help='Number of the worker processes for the batch conversion. The number of CPU '
+                                   'cores is used by default.',
+                              type=check_positive)
+    common_group.add_argument('--memoize_shape_infer',
+                              help='Reuse the result of the shape inference for the operations with the same '
+                                   'attributes and input shapes instead of running the shape inference for each of '
+                                   'them. The hit rate is reported in the debug log.',
+                              action='store_true', default=False)
+    common_group.add_argument('--graph_validation',
+                              help='Validation of the graph after each transformation: "off" disables it, "touched" '
+                                   'checks only the nodes changed by the transformation, "full" checks all nodes and '
+                                   '"periodic" checks all nodes after every --graph_validation_period transformations '
+                                   'and the changed nodes after other transformations. By default, it is "full" for '
+                                   'the DEBUG log level and "touched" otherwise.',
+                              choices=['off', 'touched', 'full', 'periodic'], default=None)
+    common_group.add_argument('--graph_validation_period',
+                              help='Number of transformations between full validations of the graph for the '
+                                   '"periodic" graph validation.',
+                              type=check_positive, default=10)
+    common_group.add_argument('--full_clean_up',
+                              help='Check all nodes of the graph on each graph clean-up. By default, the clean-up '
+                                   'checks only the nodes changed since the previous one and the nodes depending on '
+                                   'them.',
+                              action='store_true', default=False)
+    common_group.add_argument('--save_checkpoint',
+                              help='Save the graph after the specified phase of the conversion to the '
+                                   '<output_dir>/<model_name>_<phase>.checkpoint directory. The conversion may be '
+                                   'resumed from the checkpoint with the --resume_from.',
+                              choices=['front', 'middle', 'back'], default=None)
+    common_group.add_argument('--resume_from',
+                              help='Path to the checkpoint directory saved with the --save_checkpoint. The conversion '
+                                   'is resumed from the transformation following the saved phase. Other command line '
+                                   'parameters must be the same as for the conversion which saved the checkpoint.',
+                              default=None)
     return parser
 
 
@@ -0,0 +1,224 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import argparse
+import hashlib
+import json
+import logging as log
+import os
+import shutil
+import time
+
+from mo.utils.cli_parser import get_meta_info
+from mo.utils.version import get_version
+
+# the cache size is limited by 10GB by default, the least recently used entries are removed first
+DEFAULT_CACHE_SIZE_LIMIT = 10 * 2 ** 30
+
+# extensions of the files produced by the conversion
+OUTPUT_FILES_EXTENSIONS = ('.xml', '.bin', '.mapping')
+
+# command line parameters with paths to directories which content does not affect the conversion result
+NOT_HASHED_PATH_PARAMETERS = ('output_dir', 'cache_dir')
+
+ENTRY_FILE_NAME = 'entry.json'
+DIGESTS_FILE_NAME = 'file_digests.json'
+
+
+def mo_root_dir():
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+
+class ConversionCache:
+    """
+    On-disk cache of the conversion results. The key of the entry is the digest of the MO version and sources, command
+    line parameters and the content of all files and directories passed with the command line parameters. The entry
+    contains the .xml, .bin and .mapping files generated by the conversion.
+
+    Digests of files are cached in the cache directory together with the size and the modification time of the file,
+    so the unchanged files are not read again.
+    """
+
+    def __init__(self, cache_dir: str, size_limit: int = DEFAULT_CACHE_SIZE_LIMIT):
+        self.cache_dir = cache_dir
+        self.size_limit = size_limit
+        self.file_digests = {}
+        self.file_digests_updated = False
+        os.makedirs(cache_dir, exist_ok=True)
+        try:
+            with open(os.path.join(cache_dir, DIGESTS_FILE_NAME), 'r') as f:
+                self.file_digests = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def file_digest(self, path: str):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        cached = self.file_digests.get(path)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.blake2b()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(2 ** 20), b''):
+                digest.update(chunk)
+        self.file_digests[path] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        self.file_digests_updated = True
+        return digest.hexdigest()
+
+    def path_digest(self, path: str, file_filter: callable = lambda name: True):
+        """
+        Returns the digest of the file content or the digest of the names and the content of all files in the directory
+        """
+        if os.path.isfile(path):
+            return self.file_digest(path)
+        digest = hashlib.blake2b()
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            for name in sorted(files):
+                if not file_filter(name):
+                    continue
+                file_path = os.path.join(root, name)
+                digest.update(os.path.relpath(file_path, path).replace(os.sep, '/').encode('utf-8'))
+                digest.update(self.file_digest(file_path).encode('ascii'))
+        return digest.hexdigest()
+
+    def save_file_digests(self):
+        if not self.file_digests_updated:
+            return
+        # digests of files updated concurrently by other processes may be lost which only costs re-reading of files
+        tmp_path = os.path.join(self.cache_dir, '{}.{}.tmp'.format(DIGESTS_FILE_NAME, os.getpid()))
+        with open(tmp_path, 'w') as f:
+            json.dump(self.file_digests, f)
+        os.replace(tmp_path, os.path.join(self.cache_dir, DIGESTS_FILE_NAME))
+        self.file_digests_updated = False
+
+    def key(self, argv: argparse.Namespace):
+        """
+        Calculates the key of the conversion result for the command line parameters. The parameters are used as they
+        are written to the IR meta data, so the paths differing only by the directory give the same key if the content
+        of the files is the same.
+        """
+        digest = hashlib.blake2b()
+        digest.update(get_version().encode('utf-8'))
+        for source_dir in ['mo', 'extensions']:
+            digest.update(self.path_digest(os.path.join(mo_root_dir(), source_dir),
+                                           lambda name: name.endswith('.py')).encode('ascii'))
+        meta_info = get_meta_info(argv)
+        for name in NOT_HASHED_PATH_PARAMETERS:
+            # the directories may be not created yet
+            if name in meta_info:
+                meta_info[name] = 'DIR'
+        digest.update(json.dumps(meta_info, sort_keys=True, default=str).encode('utf-8'))
+        for name, value in sorted(argv.__dict__.items()):
+            if not isinstance(value, str) or name in NOT_HASHED_PATH_PARAMETERS:
+                continue
+            for path in value.split(','):
+                if os.path.exists(path):
+                    digest.update('{}:{}'.format(name, self.path_digest(path)).encode('utf-8'))
+        self.save_file_digests()
+        return digest.hexdigest()
+
+    def entry_dir(self, key: str):
+        return os.path.join(self.cache_dir, key)
+
+    def restore(self, key: str, output_dir: str):
+        """
+        Creates the files of the cached conversion result in the output directory. The files are hard links to the
+        cached ones if it is possible and copies otherwise.
+        :return: the model name of the cached conversion result or None if there is no entry for the key
+        """
+        entry_dir = self.entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, ENTRY_FILE_NAME), 'r') as f:
+                entry = json.load(f)
+            for file_name, size in entry['files'].items():
+                if os.path.getsize(os.path.join(entry_dir, file_name)) != size:
+                    raise OSError('Size of the cached file {} was changed'.format(file_name))
+        except (OSError, ValueError, KeyError) as e:
+            if os.path.isdir(entry_dir):
+                log.debug('Conversion cache entry {} is broken and will be removed: {}'.format(key, e))
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        os.makedirs(output_dir, exist_ok=True)
+        for file_name in entry['files']:
+            src, dst = os.path.join(entry_dir, file_name), os.path.join(output_dir, file_name)
+            if os.path.lexists(dst):
+                os.remove(dst)
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copyfile(src, dst)
+        # the modification time of the entry file is the last access time used by the eviction
+        os.utime(os.path.join(entry_dir, ENTRY_FILE_NAME))
+        return entry['model_name']
+
+    def store(self, key: str, output_dir: str, model_name: str):
+        files = {model_name + ext: os.path.getsize(os.path.join(output_dir, model_name + ext))
+                 for ext in OUTPUT_FILES_EXTENSIONS if os.path.isfile(os.path.join(output_dir, model_name + ext))}
+        tmp_dir = os.path.join(self.cache_dir, '{}.{}.tmp'.format(key, os.getpid()))
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        try:
+            for file_name in files:
+                shutil.copyfile(os.path.join(output_dir, file_name), os.path.join(tmp_dir, file_name))
+            with open(os.path.join(tmp_dir, ENTRY_FILE_NAME), 'w') as f:
+                json.dump({'model_name': model_name, 'files': files, 'created': time.time()}, f)
+            os.rename(tmp_dir, self.entry_dir(key))
+        except OSError as e:
+            # the entry may be stored by the concurrent process
+            log.debug('Conversion result is not stored to the cache: {}'.format(e))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.evict()
+
+    def entries(self):
+        """
+        Returns the list of (last access time, size, key) for all entries in the cache
+        """
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            entry_file = os.path.join(self.entry_dir(key), ENTRY_FILE_NAME)
+            try:
+                with open(entry_file, 'r') as f:
+                    size = sum(json.load(f)['files'].values())
+                entries.append((os.path.getmtime(entry_file), size, key))
+            except (OSError, ValueError, KeyError):
+                continue
+        return entries
+
+    def evict(self):
+        entries = sorted(self.entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total_size <= self.size_limit:
+                break
+            log.debug('Conversion cache entry {} is evicted'.format(key))
+            shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+            total_size -= size
+
+
+def get_conversion_cache(argv: argparse.Namespace):
+    """
+    Returns the conversion cache if it is enabled with the command line parameters, None otherwise
+    """
+    if not getattr(argv, 'cache_dir', None) or getattr(argv, 'no_cache', False):
+        return None
+    # the conversion has side effects which are not reproduced from the cache
+    if getattr(argv, 'profile_transformations', False) or getattr(argv, 'save_checkpoint', None) or \
+            getattr(argv, 'resume_from', None) or getattr(argv, 'tensorflow_custom_operations_config_update', None):
+        return None
+    return ConversionCache(argv.cache_dir)
@@ -0,0 +1,116 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+from unittest.mock import patch
+
+from mo.utils.conversion_cache import ConversionCache, get_conversion_cache
+
+
+class TestConversionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.path('cache')
+        self.output_dir = self.path('output')
+        os.makedirs(self.output_dir)
+        self.model = self.write(self.path('model.onnx'), b'model')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, *names):
+        return os.path.join(self.tmp_dir.name, *names)
+
+    @staticmethod
+    def write(path: str, content: bytes):
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def argv(self, **kwargs):
+        argv = dict(input_model=self.model, output_dir=self.output_dir, model_name=None, data_type='FP32',
+                    cache_dir=self.cache_dir, no_cache=False)
+        argv.update(kwargs)
+        return Namespace(**argv)
+
+    def convert(self, model_name='model', xml=b'<net/>'):
+        self.write(os.path.join(self.output_dir, model_name + '.xml'), xml)
+        self.write(os.path.join(self.output_dir, model_name + '.bin'), b'weights')
+
+    def test_key(self):
+        cache = ConversionCache(self.cache_dir)
+        key = cache.key(self.argv())
+        self.assertEqual(cache.key(self.argv()), key)
+        self.assertEqual(ConversionCache(self.cache_dir).key(self.argv()), key)
+        self.assertNotEqual(cache.key(self.argv(data_type='FP16')), key)
+        # the output directory does not affect the result
+        self.assertEqual(cache.key(self.argv(output_dir=self.path('not_created'))), key)
+        # the model file with the same name and content in the other directory gives the same result
+        os.makedirs(self.path('other'))
+        self.assertEqual(cache.key(self.argv(input_model=self.write(self.path('other', 'model.onnx'), b'model'))),
+                         key)
+        self.write(self.model, b'updated model')
+        self.assertNotEqual(cache.key(self.argv()), key)
+
+    def test_store_restore(self):
+        cache = ConversionCache(self.cache_dir)
+        key = cache.key(self.argv())
+        self.assertIsNone(cache.restore(key, self.output_dir))
+
+        self.convert()
+        cache.store(key, self.output_dir, 'model')
+        restored_dir = self.path('restored')
+        self.assertEqual(cache.restore(key, restored_dir), 'model')
+        self.assertListEqual(sorted(os.listdir(restored_dir)), ['model.bin', 'model.xml'])
+        with open(os.path.join(restored_dir, 'model.xml'), 'rb') as f:
+            self.assertEqual(f.read(), b'<net/>')
+
+    def test_broken_entry(self):
+        cache = ConversionCache(self.cache_dir)
+        self.convert()
+        cache.store('key', self.output_dir, 'model')
+        self.write(os.path.join(self.cache_dir, 'key', 'model.bin'), b'truncated')
+        self.assertIsNone(cache.restore('key', self.path('restored')))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, 'key')))
+
+    def test_eviction(self):
+        cache = ConversionCache(self.cache_dir, size_limit=3 * len(b'<net/>weights'))
+        for idx, key in enumerate(['a', 'b', 'c']):
+            self.convert()
+            cache.store(key, self.output_dir, 'model')
+            os.utime(os.path.join(self.cache_dir, key, 'entry.json'), (idx, idx))
+        # the access to the entry makes it the most recently used
+        cache.restore('a', self.path('restored'))
+        self.convert()
+        cache.store('d', self.output_dir, 'model')
+        self.assertListEqual(sorted(key for _, _, key in cache.entries()), ['a', 'c', 'd'])
+
+    def test_enabled(self):
+        self.assertIsNotNone(get_conversion_cache(self.argv()))
+        self.assertIsNone(get_conversion_cache(self.argv(no_cache=True)))
+        self.assertIsNone(get_conversion_cache(self.argv(cache_dir=None)))
+        self.assertIsNone(get_conversion_cache(self.argv(profile_transformations=True)))
+
+    def test_file_digests_reused(self):
+        cache = ConversionCache(self.cache_dir)
+        digest = cache.file_digest(self.model)
+        cache.save_file_digests()
+        with patch('builtins.open', side_effect=AssertionError('The file is read again')):
+            self.assertEqual(cache.file_digest(self.model), digest)
+        self.assertEqual(ConversionCache(self.cache_dir).file_digests, cache.file_digests)
@@ -283,7 +283,7 @@ class CustomReplacementDescriptorScope(CustomReplacementDescriptor):
 
         pattern = self.instances[0]  # use the first instance pattern to find input/output nodes patterns
         # TODO verify that all instances will produce the same sub-graph
-        matched_nodes = nodes_matching_name_pattern(graph, pattern)
+        matched_nodes = set(nodes_matching_name_pattern(graph, pattern))
 
         output_tensors = set()
         input_nodes_mapping = dict()  # key is the input tensor name, value is the pair: (input_port, output_node_name)
@@ -0,0 +1,216 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import hashlib
+import importlib
+import json
+import logging as log
+import os
+import sys
+from collections import Counter
+
+from mo.ops.op import Op
+from mo.utils.class_registration import ClassType, DependencyGraph, _registered_classes_dict, \
+    get_enabled_and_disabled_transforms, get_registered_replacers
+
+MANIFEST_VERSION = 1
+
+REPLACER_TYPES = [ClassType.LOADER, ClassType.FRONT_REPLACER, ClassType.MIDDLE_REPLACER, ClassType.BACK_REPLACER]
+
+
+def qualified_name(cls):
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+class ClassReference:
+    """
+    Reference to the class by the module and the class name which is used as a node of the DependencyGraph instead of
+    the class itself, so the class is not imported until it is resolved. There is the single reference for each class
+    in the graph, so the references are compared by identity.
+    """
+
+    def __init__(self, module: str, name: str, enabled: bool = None):
+        self.module = module
+        self.__name__ = name
+        self.enabled = enabled
+
+    def __repr__(self):
+        return "<class '{}.{}'>".format(self.module, self.__name__)
+
+    def resolve(self):
+        """
+        Returns the referenced class. The module of the disabled class is not imported, so None is returned for such
+        class if it was not imported already.
+        """
+        if self.enabled is False and self.module not in sys.modules:
+            return None
+        return getattr(importlib.import_module(self.module), self.__name__)
+
+
+def sources_state(dirs: list):
+    """
+    Returns the size and the modification time of all Python files in the directories
+    """
+    state = {}
+    for path in dirs:
+        for root, sub_dirs, files in os.walk(path):
+            sub_dirs[:] = [d for d in sub_dirs if d != '__pycache__']
+            for name in files:
+                if name.endswith('.py'):
+                    file_path = os.path.join(root, name)
+                    stat = os.stat(file_path)
+                    state[file_path] = [stat.st_size, stat.st_mtime_ns]
+    return state
+
+
+def is_lazy_class(registry, cls, op_keys_count: Counter):
+    """
+    Checks that the module with the registered class may be not imported until the class is requested. It is the
+    case for the operations which are requested by the op name and for the disabled transformations.
+    """
+    if registry is Op:
+        op = getattr(cls, 'op', None)
+        return op is None or (Op.registered_ops.get(op) is cls and op_keys_count[op.lower()] == 1)
+    return registry.class_type() in REPLACER_TYPES and getattr(cls, 'enabled', None) is False
+
+
+class ExtensionsManifest:
+    """
+    Manifest of the extensions registered from the directories: the dependencies between the transformations, their
+    enabled flags, the operations and the modules that may be not imported at the start.
+
+    The manifest is stored to the directory and it is valid while the Python files in the extensions directories are
+    not changed. The MO_ENABLED_TRANSFORMS and MO_DISABLED_TRANSFORMS environment variables are the part of the key.
+    """
+
+    def __init__(self, framework: str, dirs: list, data: dict):
+        self.framework = framework
+        self.dirs = dirs
+        self.data = data
+        self.skipped_modules = set(data['skipped_modules'])
+
+    @staticmethod
+    def file_name(framework: str, dirs: list):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([MANIFEST_VERSION, sys.version, framework, dirs,
+                                  get_enabled_and_disabled_transforms()]).encode('utf-8'))
+        return 'extensions_manifest_{}.json'.format(digest.hexdigest())
+
+    @classmethod
+    def load(cls, manifest_dir: str, framework: str, dirs: list):
+        """
+        Returns the manifest stored to the directory or None if there is no manifest or the extensions were changed
+        """
+        try:
+            with open(os.path.join(manifest_dir, cls.file_name(framework, dirs)), 'r') as f:
+                data = json.load(f)
+            if data['sources'] != sources_state(dirs):
+                log.debug('Extensions manifest is outdated')
+                return None
+            return cls(framework, dirs, data)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def build(cls, framework: str, dirs: list, module_names: list, registering_modules: set = ()):
+        """
+        Builds the manifest from the currently registered classes. The module_names is the list of all modules found
+        in the extensions directories. Only the modules with the classes restored from the manifest are skipped, so
+        the modules without registered classes and the registering_modules which register extensions on import, for
+        example by register_caffe_python_extractor, are always imported.
+        """
+        op_keys_count = Counter(c.op.lower() for c in Op.registered_cls if getattr(c, 'op', None) is not None)
+        lazy_ops = {}
+        required_modules = set(registering_modules)
+        lazy_modules = set()
+        for registries in _registered_classes_dict.values():
+            for registry in registries:
+                for c in set(registry.registered_cls) | set(filter(None, registry.registered_ops.values())):
+                    if not is_lazy_class(registry, c, op_keys_count):
+                        required_modules.add(c.__module__)
+                        continue
+                    lazy_modules.add(c.__module__)
+                    if registry is Op and getattr(c, 'op', None) is not None:
+                        lazy_ops[c.op] = [c.__module__, c.__name__]
+        skipped_modules = sorted(lazy_modules.intersection(module_names) - required_modules)
+        skipped_modules_set = set(skipped_modules)
+
+        classes = {}
+
+        def add_class(c):
+            return classes.setdefault(qualified_name(c), {
+                'module': c.__module__, 'name': c.__name__, 'enabled': getattr(c, 'enabled', None),
+                'run_before': [], 'run_after': []})
+
+        replacers = {}
+        for class_type in REPLACER_TYPES:
+            replacers[class_type.name] = []
+            for replacer_cls in get_registered_replacers([class_type]):
+                entry = add_class(replacer_cls)
+                run_before, run_after = replacer_cls().run_before(), replacer_cls().run_after()
+                for c in list(run_before) + list(run_after):
+                    add_class(c)
+                entry['run_before'] = [qualified_name(c) for c in run_before]
+                entry['run_after'] = [qualified_name(c) for c in run_after]
+                replacers[class_type.name].append(qualified_name(replacer_cls))
+
+        data = {
+            'sources': sources_state(dirs),
+            'skipped_modules': skipped_modules,
+            'lazy_ops': {op: m for op, m in lazy_ops.items() if m[0] in skipped_modules_set},
+            'replacers': replacers,
+            'classes': classes,
+        }
+        return cls(framework, dirs, data)
+
+    def store(self, manifest_dir: str):
+        os.makedirs(manifest_dir, exist_ok=True)
+        path = os.path.join(manifest_dir, self.file_name(self.framework, self.dirs))
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.debug('Extensions manifest is not stored: {}'.format(e))
+
+    def register_lazy_ops(self):
+        """
+        Registers the operations from the modules which were not imported
+        """
+        for op, (module_name, class_name) in self.data['lazy_ops'].items():
+            if op not in Op.registered_ops:
+                Op.lazy_registered_ops[op] = (module_name, class_name)
+
+    def add_dependencies(self, graph: DependencyGraph, transform_types: list):
+        classes = self.data['classes']
+        references = {name: ClassReference(entry['module'], entry['name'], entry['enabled'])
+                      for name, entry in classes.items()}
+        names = [name for class_type in transform_types for name in self.data['replacers'].get(class_type.name, [])]
+        for name in names:
+            graph.add_node(references[name])
+        for name in names:
+            for name_after in classes[name]['run_before']:
+                graph.add_edge(references[name], references[name_after])
+            for name_before in classes[name]['run_after']:
+                graph.add_edge(references[name_before], references[name])
+
+    @staticmethod
+    def resolve(order: list):
+        """
+        Resolves the ordered class references. The disabled classes which were not imported are omitted.
+        """
+        return [cls for cls in [reference.resolve() for reference in order] if cls is not None]
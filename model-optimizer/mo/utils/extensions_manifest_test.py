@@ -0,0 +1,133 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from mo.ops.op import Op
+from mo.utils.class_registration import ClassType, get_replacers_order, set_extensions_manifest
+from mo.utils.extensions_manifest import ExtensionsManifest, sources_state
+from mo.utils.import_extensions import import_by_path
+
+
+class ReplacerB:
+    enabled = True
+
+
+class ReplacerA:
+    enabled = True
+
+
+class ManifestOp:
+    op = 'ManifestOp'
+
+
+class ImportRegistry:
+    registered_ops = {}
+
+
+def class_entry(name: str, module: str = __name__, enabled: bool = True, run_before: list = (),
+                run_after: list = ()):
+    return {'module': module, 'name': name, 'enabled': enabled, 'run_before': list(run_before),
+            'run_after': list(run_after)}
+
+
+class ExtensionsManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.sources_dir = os.path.join(self.tmp_dir.name, 'extensions')
+        os.makedirs(self.sources_dir)
+        with open(os.path.join(self.sources_dir, 'ext.py'), 'w') as f:
+            f.write('# extension\n')
+
+    def tearDown(self):
+        set_extensions_manifest(None)
+        Op.lazy_registered_ops.pop('ManifestOp', None)
+        Op.registered_ops.pop('ManifestOp', None)
+        self.tmp_dir.cleanup()
+
+    def manifest(self, replacers: list = (), classes: dict = None, lazy_ops: dict = None):
+        return ExtensionsManifest('onnx', [self.sources_dir], {
+            'sources': sources_state([self.sources_dir]),
+            'skipped_modules': [],
+            'lazy_ops': lazy_ops or {},
+            'replacers': {ClassType.FRONT_REPLACER.name: list(replacers)},
+            'classes': classes or {},
+        })
+
+    def test_load_stored(self):
+        self.manifest().store(self.tmp_dir.name)
+        manifest = ExtensionsManifest.load(self.tmp_dir.name, 'onnx', [self.sources_dir])
+        self.assertIsNotNone(manifest)
+        self.assertIsNone(ExtensionsManifest.load(self.tmp_dir.name, 'caffe', [self.sources_dir]))
+
+    def test_invalidated_on_change(self):
+        self.manifest().store(self.tmp_dir.name)
+        path = os.path.join(self.sources_dir, 'ext.py')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNone(ExtensionsManifest.load(self.tmp_dir.name, 'onnx', [self.sources_dir]))
+
+    def test_invalidated_on_new_file(self):
+        self.manifest().store(self.tmp_dir.name)
+        with open(os.path.join(self.sources_dir, 'new_ext.py'), 'w') as f:
+            f.write('# new extension\n')
+        self.assertIsNone(ExtensionsManifest.load(self.tmp_dir.name, 'onnx', [self.sources_dir]))
+
+    def test_order_keeps_dependencies_of_not_imported_classes(self):
+        # ReplacerB -> Disabled -> ReplacerA while the alphabetical order is ReplacerA, ReplacerB
+        disabled = 'not_imported_module.Disabled'
+        classes = {
+            __name__ + '.ReplacerA': class_entry('ReplacerA'),
+            __name__ + '.ReplacerB': class_entry('ReplacerB', run_before=[disabled]),
+            disabled: class_entry('Disabled', 'not_imported_module', False, [__name__ + '.ReplacerA']),
+        }
+        set_extensions_manifest(self.manifest(classes.keys(), classes))
+        self.assertListEqual(get_replacers_order([ClassType.FRONT_REPLACER]), [ReplacerB, ReplacerA])
+
+    def test_lazy_op(self):
+        self.manifest(lazy_ops={'ManifestOp': [__name__, 'ManifestOp']}).register_lazy_ops()
+        self.assertNotIn('ManifestOp', Op.registered_ops)
+        self.assertIs(Op.get_op_class_by_name('ManifestOp'), ManifestOp)
+
+    def test_modules_registering_on_import(self):
+        package_dir = os.path.join(self.tmp_dir.name, 'manifest_test_ext')
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, 'plain_ext.py'), 'w') as f:
+            f.write('# extension\n')
+        with open(os.path.join(package_dir, 'registering_ext.py'), 'w') as f:
+            f.write('from {} import ImportRegistry\n'
+                    'ImportRegistry.registered_ops["ImportedOp"] = None\n'.format(__name__))
+
+        registering_modules = set()
+        sys.path.insert(0, self.tmp_dir.name)
+        try:
+            module_names = import_by_path(package_dir, ['manifest_test_ext'], registries=[ImportRegistry],
+                                          registering_modules=registering_modules)
+        finally:
+            sys.path.remove(self.tmp_dir.name)
+            for name in [m for m in sys.modules if m.startswith('manifest_test_ext')]:
+                del sys.modules[name]
+            ImportRegistry.registered_ops.clear()
+        self.assertSetEqual(set(module_names), {'manifest_test_ext.plain_ext', 'manifest_test_ext.registering_ext'})
+        self.assertSetEqual(registering_modules, {'manifest_test_ext.registering_ext'})
+
+    def test_modules_without_restored_classes_are_not_skipped(self):
+        # the modules without registered classes and the modules registering on import are always imported
+        manifest = ExtensionsManifest.build('onnx', [self.sources_dir], ['ext', 'registering_ext'], {'registering_ext'})
+        self.assertSetEqual(manifest.skipped_modules, set())
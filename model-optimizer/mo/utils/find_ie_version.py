@@ -16,6 +16,9 @@
  limitations under the License.
 """
 
+import hashlib
+import importlib.util
+import json
 import os
 import sys
 import platform
@@ -32,6 +35,9 @@ if python_path_key not in os.environ:
 lib_path_orig = os.environ[lib_env_key]
 python_path_orig = os.environ[python_path_key]
 
+# result of the Inference Engine search which is already applied to the environment of the current process
+ie_search_result = None
+
 
 def setup_env(module="", libs=[]):
     """
@@ -51,13 +57,14 @@ def reset_env():
     os.environ[lib_env_key] = lib_path_orig
 
 
-def try_to_import_ie(module="", libs=[], silent=False):
+def check_ie_bindings(module="", libs=[], silent=False):
     """
     Check if Inference Engine Python API modules exists and in case of success
     environment will be set with given values.
     :param module: path to python module
     :param libs: list with paths to libraries
     :param silent: hide all output
+    :return: tuple of the check result and the output of the check
     """
     path_to_script = os.path.join(os.path.realpath(os.path.dirname(__file__)), 'check_ie_bindings.py')
     # We need to execute python modules checker in subprocess to avoid issue with environment
@@ -70,12 +77,80 @@ def try_to_import_ie(module="", libs=[], silent=False):
     if silent:
         cmd_args.append("--silent")
 
-    status = subprocess.run(cmd_args, env=os.environ)
+    status = subprocess.run(cmd_args, env=os.environ, stdout=subprocess.PIPE, universal_newlines=True)
     if status.returncode == 0:
-        return True
+        return True, status.stdout
     else:
         reset_env()
-        return False
+        return False, status.stdout
+
+
+def try_to_import_ie(module="", libs=[], silent=False):
+    """
+    Check if Inference Engine Python API modules exists and in case of success
+    environment will be set with given values.
+    :param module: path to python module
+    :param libs: list with paths to libraries
+    :param silent: hide all output
+    """
+    found, output = check_ie_bindings(module=module, libs=libs, silent=silent)
+    print(output, end='')
+    return found
+
+
+def search_cache_file():
+    """
+    Returns the path to the file with the cached results of the Inference Engine search
+    """
+    if platform.system() == 'Windows':
+        base_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base_dir, 'openvino', 'model_optimizer', 'ie_search.json')
+
+
+def search_key(bindings_paths: list):
+    """
+    Returns the key of the Inference Engine search result. The key covers the interpreter, sys.path, the library and
+    the python paths from the environment and the state of the locations where the bindings may be found.
+    """
+    def path_state(path: str):
+        try:
+            return [path, os.stat(path).st_mtime_ns]
+        except OSError:
+            return [path, None]
+
+    try:
+        spec = importlib.util.find_spec('openvino')
+        openvino_location = list(spec.submodule_search_locations or [spec.origin]) if spec is not None else []
+    except (ImportError, ValueError):
+        openvino_location = []
+    state = [sys.executable, sys.version, sys.path, python_path_orig, lib_path_orig,
+             [path_state(path) for path in openvino_location],
+             [path_state(item['module']) for item in bindings_paths]]
+    return hashlib.blake2b(json.dumps(state).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_search_results():
+    try:
+        with open(search_cache_file(), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def store_search_result(key: str, result: dict):
+    results = load_search_results()
+    results[key] = result
+    path = search_cache_file()
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 
 def find_ie_version(silent=False):
@@ -87,10 +162,56 @@ def find_ie_version(silent=False):
         if find_ie_version():
             subprocess.run([sys.executable, path_to_script], env=os.environ)
 
+    The search is done once per process. The result is cached on disk together with the output of the check, so the
+    next processes with the same interpreter, sys.path and library paths do not run the check in the subprocess.
+    """
+    global ie_search_result
+    if ie_search_result is not None:
+        return ie_search_result['found']
+
+    bindings_paths = get_bindings_paths()
+    key = search_key(bindings_paths)
+    result = load_search_results().get(key)
+    # the output of the check is not known if the previous search was silent
+    if result is None or (not silent and result['output'] is None):
+        result = search_ie_bindings(bindings_paths, silent)
+        store_search_result(key, result)
+    elif result['found']:
+        setup_env(module=result['module'], libs=result['libs'])
+
+    if not silent:
+        print(result['output'], end='')
+    ie_search_result = result
+    return result['found']
+
+
+def ie_found_in_default_environment():
+    """
+    Checks that the Inference Engine Python API was found by find_ie_version without changes of the environment, so it
+    may be imported in the current process
+    """
+    return ie_search_result is not None and ie_search_result['found'] and ie_search_result['module'] == ""
+
+
+def search_ie_bindings(bindings_paths: list, silent=False):
     """
-    if try_to_import_ie(silent=silent):
-        return True
+    Checks the Inference Engine Python API bindings in the default environment and in the bindings_paths.
+    :return: dictionary with the search result, the found module and libraries paths and the output of the checks
+    """
+    outputs = []
+    for module, libs in [("", [])] + [(os.path.normpath(item['module']), item['libs'] if 'libs' in item else [])
+                                      for item in bindings_paths if os.path.exists(item['module'])]:
+        found, output = check_ie_bindings(module=module, libs=libs, silent=silent)
+        outputs.append(output)
+        if found:
+            return {'found': True, 'module': module, 'libs': libs, 'output': None if silent else ''.join(outputs)}
+    return {'found': False, 'module': None, 'libs': None, 'output': None if silent else ''.join(outputs)}
+
 
+def get_bindings_paths():
+    """
+    Returns the list of the locations of the Inference Engine Python API bindings relative to the Model Optimizer
+    """
     python_version = 'python{}.{}'.format(sys.version_info[0], sys.version_info[1])
 
     script_path = os.path.realpath(os.path.dirname(__file__))
@@ -134,14 +255,7 @@ def find_ie_version(silent=False):
         }
     ]
 
-    for item in bindings_paths:
-        module = item['module']
-        if not os.path.exists(module):
-            continue
-        if try_to_import_ie(module=os.path.normpath(module), libs=item['libs'] if 'libs' in item else [], silent=silent):
-            return True
-
-    return False
+    return bindings_paths
 
 
 if __name__ == "__main__":
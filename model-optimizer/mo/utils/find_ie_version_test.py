@@ -0,0 +1,79 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import mo.utils.find_ie_version as find_ie
+from mo.utils.find_ie_version import find_ie_version, reset_env, python_path_key
+
+
+class FindIEVersionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmp_dir.name, 'ie_search.json')
+        find_ie.ie_search_result = None
+
+    def tearDown(self):
+        find_ie.ie_search_result = None
+        reset_env()
+        self.tmp_dir.cleanup()
+
+    def find(self, check_result: tuple, silent: bool = True):
+        """
+        Runs the search in the new process which is simulated by resetting of the search result in the current one
+        """
+        find_ie.ie_search_result = None
+        reset_env()
+
+        def check(module='', libs=[], silent=False):
+            find_ie.setup_env(module=module, libs=libs)
+            return check_result
+
+        with mock.patch.object(find_ie, 'search_cache_file', return_value=self.cache_file), \
+                mock.patch.object(find_ie, 'check_ie_bindings', side_effect=check) as check_mock, \
+                mock.patch('builtins.print') as print_mock:
+            found = find_ie_version(silent=silent)
+        return found, check_mock.call_count, print_mock
+
+    def test_result_is_cached(self):
+        self.assertEqual(self.find((True, 'IE found\n'))[:2], (True, 1))
+        found, checks, _ = self.find((False, ''))
+        self.assertEqual((found, checks), (True, 0))
+        self.assertIn(os.pathsep, os.environ[python_path_key])
+
+    def test_searched_once_per_process(self):
+        self.find((True, ''))
+        with mock.patch.object(find_ie, 'check_ie_bindings') as check_mock:
+            self.assertTrue(find_ie_version(silent=True))
+        check_mock.assert_not_called()
+
+    def test_output_of_silent_search_is_not_cached(self):
+        self.find((True, 'IE found\n'), silent=True)
+        found, checks, print_mock = self.find((True, 'IE found\n'), silent=False)
+        self.assertEqual((found, checks), (True, 1))
+        print_mock.assert_called_once_with('IE found\n', end='')
+
+        found, checks, print_mock = self.find((True, ''), silent=False)
+        self.assertEqual((found, checks), (True, 0))
+        print_mock.assert_called_once_with('IE found\n', end='')
+
+    def test_key_depends_on_sys_path(self):
+        self.find((False, ''))
+        with mock.patch('sys.path', ['another_path']):
+            self.assertEqual(self.find((False, ''))[1], 1)
@@ -16,11 +16,11 @@
 
 import logging as log
 from collections import deque
-from re import match, compile
 
 import networkx as nx
 
 from mo.graph.graph import Node, Graph
+from mo.graph.traversal import bfs_order, dfs_postorder, successors
 from mo.utils.error import Error
 from mo.utils.utils import refer_to_faq_msg
 
@@ -60,21 +60,9 @@ def bfs_search(graph: Graph, start_nodes: list = list()):
     have input nodes.
     :return: the list of nodes in the BFS order.
     """
-    result = list()
     if len(start_nodes) == 0:
-        start_nodes = [node_name for node_name in graph.nodes() if len(graph.in_edges(node_name)) == 0]
-
-    visited = set(start_nodes)
-    d = deque(start_nodes)
-
-    while len(d) != 0:
-        cur_node_name = d.popleft()
-        result.append(cur_node_name)
-        for src_node, dst_node in graph.out_edges(cur_node_name):
-            if dst_node not in visited:
-                d.append(dst_node)
-                visited.add(dst_node)
-    return result
+        start_nodes = [node_name for node_name, in_degree in graph.in_degree() if in_degree == 0]
+    return bfs_order(start_nodes, successors(graph))
 
 
 def nodes_matching_name_pattern(graph: Graph, pattern: str):
@@ -84,8 +72,7 @@ def nodes_matching_name_pattern(graph: Graph, pattern: str):
     :param pattern: regular expression describing node name pattern.
     :return: list of matched node names.
     """
-    compiled_pattern = compile(pattern)
-    return [node_name for node_name in list(graph.nodes()) if match(compiled_pattern, node_name)]
+    return graph.get_nodes_matching_name_pattern(pattern)
 
 
 def is_connected_component(graph: Graph, node_names: list):
@@ -134,33 +121,37 @@ def sub_graph_between_nodes(graph: Graph, start_nodes: list, end_nodes: list, de
     visited = set(start_nodes)
     d = deque(start_nodes)
     extra_start_nodes = []
+    start_nodes_set, end_nodes_set = set(start_nodes), set(end_nodes)
 
     nx.set_node_attributes(G=graph, name='prev', values=None)
     while len(d) != 0:
         cur_node_id = d.popleft()
         sub_graph_nodes.append(cur_node_id)
-        if cur_node_id not in end_nodes:  # do not add output nodes of the end_nodes
-            for _, dst_node_name, attrs in graph.out_edges(cur_node_id, data=True):
-                if dst_node_name not in visited and (include_control_flow or not attrs.get('control_flow_edge', False)):
-                    d.append(dst_node_name)
-                    visited.add(dst_node_name)
-                    graph.node[dst_node_name]['prev'] = cur_node_id
-
-        for src_node_name, _, attrs in graph.in_edges(cur_node_id, data=True):
+        if cur_node_id not in end_nodes_set:  # do not add output nodes of the end_nodes
+            for dst_node_name, key_dict in graph._succ[cur_node_id].items():
+                for attrs in key_dict.values():
+                    if dst_node_name not in visited and \
+                            (include_control_flow or not attrs.get('control_flow_edge', False)):
+                        d.append(dst_node_name)
+                        visited.add(dst_node_name)
+                        graph.node[dst_node_name]['prev'] = cur_node_id
+
+        if cur_node_id in start_nodes_set:
+            continue
+        for src_node_name, key_dict in graph._pred[cur_node_id].items():
             # add input nodes for the non-start_nodes
-            if cur_node_id not in start_nodes and src_node_name not in visited and\
-                    (include_control_flow or not attrs.get('control_flow_edge', False)):
-                if detect_extra_start_node is not None and detect_extra_start_node(Node(graph, cur_node_id)):
-                    extra_start_nodes.append(cur_node_id)
-                else:
-                    d.append(src_node_name)
-                    graph.node[src_node_name]['prev'] = cur_node_id
-                    visited.add(src_node_name)
+            for attrs in key_dict.values():
+                if src_node_name not in visited and (include_control_flow or not attrs.get('control_flow_edge', False)):
+                    if detect_extra_start_node is not None and detect_extra_start_node(Node(graph, cur_node_id)):
+                        extra_start_nodes.append(cur_node_id)
+                    else:
+                        d.append(src_node_name)
+                        graph.node[src_node_name]['prev'] = cur_node_id
+                        visited.add(src_node_name)
 
     # use forward dfs to check that all end nodes are reachable from at least one of input nodes
     forward_visited = set()
-    for start_node in start_nodes:
-        graph.dfs(start_node, forward_visited)
+    dfs_postorder(start_nodes, successors(graph), forward_visited)
     for end_node in end_nodes:
         if end_node not in forward_visited:
             raise Error('End node "{}" is not reachable from start nodes: {}. '.format(end_node, start_nodes) +
@@ -24,13 +24,33 @@ from extensions.load.loader import Loader
 from mo.back.replacement import BackReplacementPattern
 from mo.middle.replacement import MiddleReplacementPattern
 from mo.ops.op import Op
-from mo.utils.class_registration import _check_unique_ids, update_registration, get_enabled_and_disabled_transforms
+from mo.utils.class_registration import _check_unique_ids, update_registration, get_enabled_and_disabled_transforms, \
+    set_extensions_manifest
+from mo.utils.extensions_manifest import ExtensionsManifest
 from mo.utils.model_analysis import AnalyzeAction
 
 
-def import_by_path(path: str, middle_names: list = ()):
+def registries_state(registries: list):
+    return [dict(getattr(registry, 'registered_ops', {})) for registry in registries]
+
+
+def import_by_path(path: str, middle_names: list = (), skipped_modules: set = (), registries: list = (),
+                   registering_modules: set = None):
+    """
+    Imports all modules from the directory except the skipped ones and returns the list of the found module names.
+    If registering_modules is specified, the modules which change the registered_ops of the registries while the
+    import are added to it.
+    """
+    module_names = []
     for module_loader, name, ispkg in pkgutil.iter_modules([path]):
-        importlib.import_module('{}.{}'.format('.'.join(middle_names), name))
+        module_name = '{}.{}'.format('.'.join(middle_names), name)
+        module_names.append(module_name)
+        if module_name not in skipped_modules:
+            state = registries_state(registries) if registering_modules is not None else None
+            importlib.import_module(module_name)
+            if state is not None and state != registries_state(registries):
+                registering_modules.add(module_name)
+    return module_names
 
 
 def default_path():
@@ -38,7 +58,8 @@ def default_path():
     return os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, EXT_DIR_NAME))
 
 
-def load_dir(framework: str, path: str, get_front_classes: callable):
+def load_dir(framework: str, path: str, get_front_classes: callable, skipped_modules: set = (),
+             registering_modules: set = None):
     """
     Assuming the following sub-directory structure for path:
 
@@ -65,6 +86,10 @@ def load_dir(framework: str, path: str, get_front_classes: callable):
     1, 2, 3 can concur for the same op, but 4 registers a transformation pass
     and it shouldn't conflict with any stuff loaded by 1, 2 or 3.
     It doesn't load files from front/<other_directories>
+
+    Modules from skipped_modules are not imported. The function returns the list of the modules found in the
+    sub-directories. If registering_modules is specified, the modules which register extensions by the code executed
+    on import are added to it.
     """
     log.info("Importing extensions from: {}".format(path))
     root_dir, ext = os.path.split(path)
@@ -85,13 +110,22 @@ def load_dir(framework: str, path: str, get_front_classes: callable):
     if ext == 'mo':
         internal_dirs[('front', framework, 'extractors')] = front_classes
 
+    registries = list({registry for registries in internal_dirs.values() for registry in registries})
+    module_names = []
     for p in internal_dirs.keys():
-        import_by_path(os.path.join(path, *p), [ext, *p])
+        module_names.extend(import_by_path(os.path.join(path, *p), [ext, *p], skipped_modules, registries,
+                                           registering_modules))
         update_registration(internal_dirs[p], enabled_transforms, disabled_transforms)
     sys.path.remove(root_dir)
+    return module_names
 
 
-def load_dirs(framework: str, dirs: list, get_front_classes: callable):
+def load_dirs(framework: str, dirs: list, get_front_classes: callable, manifest_dir: str = None):
+    """
+    Loads extensions from all directories. If manifest_dir is specified, the manifest of the registered extensions is
+    stored to this directory and it is used on the next runs to skip import of modules which are not needed until the
+    extension from them is requested and to order the transformations without instantiating them.
+    """
     if dirs is None:
         return
 
@@ -100,7 +134,21 @@ def load_dirs(framework: str, dirs: list, get_front_classes: callable):
     dirs = [os.path.abspath(e) for e in dirs]
     if default_path() not in dirs:
         dirs.insert(0, default_path())
+
+    manifest = ExtensionsManifest.load(manifest_dir, framework, dirs) if manifest_dir else None
+    skipped_modules = manifest.skipped_modules if manifest is not None else set()
+    # the modules registering extensions on import are found when the manifest is built
+    registering_modules = set() if manifest_dir and manifest is None else None
+    module_names = []
     for path in dirs:
-        load_dir(framework, path, get_front_classes)
+        module_names.extend(load_dir(framework, path, get_front_classes, skipped_modules, registering_modules))
 
     _check_unique_ids()
+
+    if manifest_dir:
+        if manifest is None:
+            manifest = ExtensionsManifest.build(framework, dirs, module_names, registering_modules)
+            manifest.store(manifest_dir)
+        else:
+            manifest.register_lazy_ops()
+        set_extensions_manifest(manifest)
@@ -350,8 +350,8 @@ def copy_graph_with_ops(graph: Graph) -> Graph:
         if op_type in custom_ops:
             node = custom_ops[op_type](new_graph, op.attrs()).create_node()
         else:
-            assert op_type in Op.registered_ops, 'Operation {} not found in MO operations, ' \
-                                                 'please check it!'.format(op_type)
+            assert op_type in Op.registered_ops or op_type in Op.lazy_registered_ops, \
+                'Operation {} not found in MO operations, please check it!'.format(op_type)
             node = Op.get_op_class_by_name(op_type)(new_graph, op.attrs()).create_node()
 
         if op.has_and_set('need_copy_input_blobs'):
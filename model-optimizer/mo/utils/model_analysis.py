@@ -61,6 +61,13 @@ class AnalysisResults:
     def add_message(cls, message):
         cls.messages.append(message)
 
+    @classmethod
+    def reset(cls):
+        """
+        Removes the results of the previous analysis, so the next instance is created empty
+        """
+        cls._instance = None
+
 
 class AnalyzeAction(object):
     registered_cls = []
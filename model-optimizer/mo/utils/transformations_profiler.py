@@ -0,0 +1,220 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import json
+import logging as log
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+_active_profiler = None
+
+
+def _current_rss():
+    """
+    Returns current resident set size of the process in bytes. Falls back to the peak RSS on platforms where the
+    current value is not available without third-party packages.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+    except ImportError:
+        return 0
+
+
+class TransformationRecord:
+    """
+    Statistics collected for a single application of a transformation.
+    """
+
+    def __init__(self, name: str, index: int):
+        self.name = name
+        self.index = index
+        self.start = None
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.nodes_before = 0
+        self.edges_before = 0
+        self.nodes_after = 0
+        self.edges_after = 0
+        self.memory_delta = 0
+        # maps stage name to the list [start time, wall time]
+        self.stages = {}
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'index': self.index,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'nodes_before': self.nodes_before,
+            'nodes_after': self.nodes_after,
+            'edges_before': self.edges_before,
+            'edges_after': self.edges_after,
+            'memory_delta': self.memory_delta,
+            'stages': {stage: wall_time for stage, (_, wall_time) in self.stages.items()},
+        }
+
+
+class TransformationsProfiler:
+    """
+    Collects per-transformation statistics from mo.utils.class_registration.apply_transform.
+
+    The profiler is activated with the enable_profiling function. Subclasses may override the on_record method to
+    receive statistics for every transformation as soon as it is finished.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.origin = time.perf_counter()
+
+    def on_record(self, record: TransformationRecord):
+        pass
+
+    @contextmanager
+    def transform(self, graph, replacer_cls):
+        record = TransformationRecord('.'.join([replacer_cls.__module__, replacer_cls.__name__]), len(self.records))
+        record.nodes_before, record.edges_before = graph.number_of_nodes(), graph.number_of_edges()
+        rss_before = _current_rss()
+        cpu_start = time.process_time()
+        record.start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_time = time.perf_counter() - record.start
+            record.cpu_time = time.process_time() - cpu_start
+            record.memory_delta = _current_rss() - rss_before
+            record.nodes_after, record.edges_after = graph.number_of_nodes(), graph.number_of_edges()
+            self.records.append(record)
+            self.on_record(record)
+
+    def summary_table(self, top: int = None):
+        """
+        Returns the table with collected statistics sorted by the transformation wall time in descending order.
+        :param top: the number of the slowest transformations to include into the table, all of them by default
+        :return: the table as a string
+        """
+        stage_names = []
+        for record in self.records:
+            for stage in record.stages:
+                if stage not in stage_names:
+                    stage_names.append(stage)
+
+        header = ['|  #  | wall, s | cpu, s |  nodes   |  edges   | mem, MB |'] + \
+                 ['{:^10}|'.format(stage[:10]) for stage in stage_names] + [' transformation']
+        lines = [''.join(header)]
+        records = sorted(self.records, key=lambda r: r.wall_time, reverse=True)
+        for record in records[:top]:
+            line = ['|{:4} |{:8.3f} |{:7.3f} |{:+9} |{:+9} |{:8.1f} |'.format(
+                record.index, record.wall_time, record.cpu_time, record.nodes_after - record.nodes_before,
+                record.edges_after - record.edges_before, record.memory_delta / 2 ** 20)]
+            line += ['{:9.3f} |'.format(record.stages[stage][1]) if stage in record.stages else '{:>9} |'.format('-')
+                     for stage in stage_names]
+            line.append(' ' + record.name)
+            lines.append(''.join(line))
+        lines.append('Total time spent in transformations: {:.2f} seconds'.format(
+            sum(record.wall_time for record in self.records)))
+        return '\n'.join(lines)
+
+    def to_json(self):
+        return json.dumps([record.to_dict() for record in self.records], indent=2)
+
+    def to_chrome_trace(self):
+        """
+        Returns the collected statistics in the Chrome Trace Event format which can be loaded to chrome://tracing or
+        https://ui.perfetto.dev
+        """
+        def to_us(seconds):
+            return round(seconds * 1e6, 3)
+
+        events = []
+        for record in self.records:
+            events.append({'name': record.name, 'cat': 'transformation', 'ph': 'X', 'pid': 0, 'tid': 0,
+                           'ts': to_us(record.start - self.origin), 'dur': to_us(record.wall_time),
+                           'args': record.to_dict()})
+            for stage, (start, wall_time) in record.stages.items():
+                events.append({'name': stage, 'cat': 'stage', 'ph': 'X', 'pid': 0, 'tid': 0,
+                               'ts': to_us(start - self.origin), 'dur': to_us(wall_time)})
+        return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+    def save(self, output_dir: str, model_name: str):
+        """
+        Saves the collected statistics to the JSON and Chrome trace files in the output directory.
+        :return: tuple with paths to the saved files
+        """
+        json_path = os.path.join(output_dir, model_name + '.transformations_profile.json')
+        trace_path = os.path.join(output_dir, model_name + '.transformations_trace.json')
+        with open(json_path, 'w') as f:
+            f.write(self.to_json())
+        with open(trace_path, 'w') as f:
+            f.write(self.to_chrome_trace())
+        log.debug('Transformations profile is saved to {} and {}'.format(json_path, trace_path))
+        return json_path, trace_path
+
+
+def enable_profiling(profiler: TransformationsProfiler = None):
+    """
+    Activates profiling of transformations.
+    :param profiler: profiler instance to collect statistics to, the new one is created if not specified
+    :return: the active profiler
+    """
+    global _active_profiler
+    _active_profiler = profiler if profiler is not None else TransformationsProfiler()
+    return _active_profiler
+
+
+def disable_profiling():
+    global _active_profiler
+    _active_profiler = None
+
+
+def get_profiler():
+    return _active_profiler
+
+
+@contextmanager
+def profile_transform(graph, replacer_cls):
+    """
+    Collects statistics for the transformation if the profiling is enabled. Yields the record to be passed to the
+    profile_stage or None if the profiling is disabled.
+    """
+    if _active_profiler is None:
+        yield None
+    else:
+        with _active_profiler.transform(graph, replacer_cls) as record:
+            yield record
+
+
+@contextmanager
+def profile_stage(record: TransformationRecord, stage: str):
+    """
+    Measures the time of the transformation stage. Does nothing if the record is None.
+    """
+    if record is None:
+        yield
+    else:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record.stages[stage] = [start, time.perf_counter() - start]
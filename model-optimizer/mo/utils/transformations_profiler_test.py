@@ -0,0 +1,96 @@
+"""
+ Copyright (C) 2018-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import json
+import unittest
+from argparse import Namespace
+
+from mo.graph.graph import Graph
+from mo.utils.class_registration import apply_transform
+from mo.utils.transformations_profiler import enable_profiling, disable_profiling, get_profiler, \
+    TransformationsProfiler
+from mo.utils.unittest.graph import build_graph
+
+nodes = {
+    'input': {'kind': 'op', 'op': 'Parameter'},
+    'input_data': {'kind': 'data', 'shape': None, 'value': None},
+    'result': {'kind': 'op', 'op': 'Result'},
+}
+
+
+class AddNodeTransformation:
+    enabled = True
+    force_shape_inference = True
+
+    def find_and_replace_pattern(self, graph: Graph):
+        graph.add_node('new_node', kind='op', op='Identity')
+
+
+class TransformationsProfilerTest(unittest.TestCase):
+    def tearDown(self):
+        disable_profiling()
+
+    def apply(self, graph: Graph):
+        apply_transform(graph=graph, replacer_cls=AddNodeTransformation, curr_transform_num=0, num_transforms=1)
+
+    def build_graph(self):
+        graph = build_graph(nodes, [('input', 'input_data'), ('input_data', 'result')])
+        graph.graph['cmd_params'] = Namespace(progress=False)
+        return graph
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_profiler())
+        self.apply(self.build_graph())
+        self.assertIsNone(get_profiler())
+
+    def test_record(self):
+        profiler = enable_profiling()
+        self.apply(self.build_graph())
+
+        self.assertEqual(len(profiler.records), 1)
+        record = profiler.records[0]
+        self.assertTrue(record.name.endswith('AddNodeTransformation'))
+        self.assertEqual((record.nodes_before, record.nodes_after), (3, 4))
+        self.assertEqual((record.edges_before, record.edges_after), (2, 2))
+        self.assertListEqual(sorted(record.stages.keys()), ['shape_inference', 'transform', 'validation'])
+        self.assertGreaterEqual(record.wall_time, sum(wall_time for _, wall_time in record.stages.values()))
+
+    def test_custom_profiler(self):
+        class CountingProfiler(TransformationsProfiler):
+            def __init__(self):
+                super().__init__()
+                self.finished = []
+
+            def on_record(self, record):
+                self.finished.append(record.name)
+
+        profiler = enable_profiling(CountingProfiler())
+        self.apply(self.build_graph())
+        self.apply(self.build_graph())
+        self.assertEqual(len(profiler.finished), 2)
+
+    def test_reports(self):
+        profiler = enable_profiling()
+        self.apply(self.build_graph())
+
+        table = profiler.summary_table()
+        self.assertIn('AddNodeTransformation', table)
+        self.assertIn('shape_infe', table)
+
+        self.assertEqual(json.loads(profiler.to_json())[0]['nodes_after'], 4)
+        events = json.loads(profiler.to_chrome_trace())['traceEvents']
+        self.assertListEqual(sorted(event['name'] for event in events if event['cat'] == 'stage'),
+                             ['shape_inference', 'transform', 'validation'])
@@ -15,12 +15,22 @@
 """
 
 
+import importlib
+import importlib.util
 import logging as log
 import os
 import re
 import sys
 from distutils.version import LooseVersion
 
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
+
 modules = {
     "protobuf": "google.protobuf",
     "test-generator": "generator",
@@ -185,6 +195,34 @@ def version_check(name, installed_v, required_v, sign, not_satisfied_v, exit_cod
     return exit_code
 
 
+def get_module_version(name):
+    """
+    Please do not add parameter type annotations (param:type).
+    Because we import this file while checking Python version.
+    Python 2.x will fail with no clear message on type annotations.
+
+    Returns installed version of the module. The version is read from the distribution metadata, so the module is not
+    imported. If there is no distribution with the requirement name (e.g. the module is installed from the
+    tensorflow-cpu distribution), the module is imported and its __version__ is returned.
+    Raises ImportError if the module is not installed.
+    :param name: name of the module in the requirements file
+    :return: version string
+    """
+    if importlib_metadata is not None:
+        try:
+            return importlib_metadata.version(name)
+        except importlib_metadata.PackageNotFoundError:
+            pass
+    importable_name = modules.get(name, name)
+    try:
+        spec = importlib.util.find_spec(importable_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        raise ImportError('No module named {}'.format(importable_name))
+    return importlib.import_module(importable_name).__version__
+
+
 def get_environment_setup():
     """
     Get environment setup such as Python version, TensorFlow version
@@ -196,9 +234,7 @@ def get_environment_setup():
                                        sys.version_info.micro)
     env_setup['python_version'] = python_version
     try:
-        exec("import tensorflow")
-        env_setup['tensorflow'] = sys.modules["tensorflow"].__version__
-        exec("del tensorflow")
+        env_setup['tensorflow'] = get_module_version('tensorflow')
     except (AttributeError, ImportError):
         pass
     return env_setup
@@ -234,11 +270,8 @@ def check_requirements(framework=None):
     exit_code = 0
     for name, key, required_version in requirements_list:
         try:
-            importable_name = modules.get(name, name)
-            exec("import {}".format(importable_name))
-            installed_version = sys.modules[importable_name].__version__
+            installed_version = get_module_version(name)
             exit_code = version_check(name, installed_version, required_version, key, not_satisfied_versions, exit_code)
-            exec("del {}".format(importable_name))
         except (AttributeError, ImportError):
             if key is not None and required_version is not None:
                 not_satisfied_versions.append((name, 'not installed', 'required: {} {}'.format(key, required_version)))
@@ -18,7 +18,8 @@ import unittest
 import unittest.mock as mock
 from unittest.mock import mock_open
 
-from mo.utils.versions_checker import get_module_version_list_from_file, parse_and_filter_versions_list
+from mo.utils.versions_checker import get_module_version_list_from_file, parse_and_filter_versions_list, \
+    get_module_version, importlib_metadata
 
 
 class TestingVersionsChecker(unittest.TestCase):
@@ -87,3 +88,19 @@ class TestingVersionsChecker(unittest.TestCase):
                     ('mxnet', '<=', '1.3.1')]
         for i, v in enumerate(req_list):
             self.assertEqual(v, ref_list[i])
+
+    def test_get_module_version_from_metadata(self):
+        with mock.patch.object(importlib_metadata, 'version', return_value='1.2.3') as version:
+            with mock.patch('importlib.import_module') as import_module:
+                self.assertEqual(get_module_version('test-generator'), '1.2.3')
+                import_module.assert_not_called()
+        version.assert_called_once_with('test-generator')
+
+    def test_get_module_version_without_metadata(self):
+        import numpy
+        with mock.patch.object(importlib_metadata, 'version', side_effect=importlib_metadata.PackageNotFoundError):
+            self.assertEqual(get_module_version('numpy'), numpy.__version__)
+
+    def test_get_module_version_not_installed(self):
+        with self.assertRaises(ImportError):
+            get_module_version('not_installed_module_name')
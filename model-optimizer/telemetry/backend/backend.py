@@ -62,6 +62,15 @@ class TelemetryBackend(metaclass=TelemetryBackendMetaClass):
         :return: None
         """
 
+    def send_batch(self, messages: list):
+        """
+        Sends the batch of messages to the backend. Sends messages one by one by default.
+        :param messages: The list of Message objects to send
+        :return: None
+        """
+        for message in messages:
+            self.send(message)
+
     @abc.abstractmethod
     def build_event_message(self, event_category: str, event_action: str, event_label: str, event_value: int = 1,
                             **kwargs):
@@ -48,6 +48,12 @@ class GABackend(TelemetryBackend):
         except Exception:
             pass
 
+    def send_batch(self, messages: list):
+        # the errors are not suppressed, so the spooled messages are kept if they are not sent
+        import requests
+        for message in messages:
+            requests.post(self.backend_url, message.attrs, timeout=1.0).raise_for_status()
+
     def build_event_message(self, event_category: str, event_action: str, event_label: str, event_value: int = 1,
                             **kwargs):
         data = self.default_message_attrs.copy()
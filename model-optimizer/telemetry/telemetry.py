@@ -13,10 +13,13 @@
  See the License for the specific language governing permissions and
  limitations under the License.
 """
+import os
+
 import telemetry.utils.isip as isip
 
 from telemetry.backend.backend import BackendRegistry
 from telemetry.utils.sender import TelemetrySender
+from telemetry.utils.spool import TelemetrySpool, SPOOL_DIR_ENV_KEY
 
 
 class SingletonMetaClass(type):
@@ -34,9 +37,13 @@ class Telemetry(metaclass=SingletonMetaClass):
     """
     The main class to send telemetry data. It uses singleton pattern. The instance should be initialized with the
     application name, version and tracking id just once. Later the instance can be created without parameters.
+
+    If the spool directory is specified directly or with the OPENVINO_TELEMETRY_SPOOL_DIR environment variable, the
+    messages are stored to the directory instead of sending. They are sent later with the flush_spool method or with
+    "python -m telemetry.utils.spool".
     """
     def __init__(self, app_name: str = None, app_version: str = None, tid: [None, str] = None,
-                 backend: [str, None] = 'ga'):
+                 backend: [str, None] = 'ga', spool_dir: [str, None] = None):
         if not hasattr(self, 'tid'):
             self.tid = None
         if app_name is not None:
@@ -45,7 +52,10 @@ class Telemetry(metaclass=SingletonMetaClass):
             if tid is not None:
                 self.tid = tid
             self.backend = BackendRegistry.get_backend(backend)(self.tid, app_name, app_version)
-            self.sender = TelemetrySender()
+            if spool_dir is None:
+                spool_dir = os.environ.get(SPOOL_DIR_ENV_KEY)
+            self.spool = TelemetrySpool(spool_dir) if spool_dir else None
+            self.sender = TelemetrySender(spool=self.spool)
         else:  # use already configured instance
             assert self.sender is not None, 'The first instantiation of the Telemetry should be done with the ' \
                                             'application name and version'
@@ -59,6 +69,16 @@ class Telemetry(metaclass=SingletonMetaClass):
         """
         self.sender.force_shutdown(timeout)
 
+    def flush_spool(self):
+        """
+        Sends the messages stored to the spool directory.
+
+        :return: the number of sent messages
+        """
+        if self.spool is None or not self.consent:
+            return 0
+        return self.spool.flush(self.backend)
+
     def send_event(self, event_category: str, event_action: str, event_label: str, event_value: int = 1, **kwargs):
         """
         Send single event.
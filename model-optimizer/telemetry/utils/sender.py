@@ -15,32 +15,46 @@
 """
 import threading
 from concurrent import futures
-from time import sleep
 
 from telemetry.backend.backend import TelemetryBackend
 from telemetry.utils.message import Message
+from telemetry.utils.spool import TelemetrySpool
 
 MAX_QUEUE_SIZE = 1000
 
 
 class TelemetrySender:
-    def __init__(self, max_workers=None):
+    """
+    Sends messages in the background threads. If the spool is specified, the messages are appended to the spool
+    instead and no network operations are made.
+    """
+    def __init__(self, max_workers=None, spool: TelemetrySpool = None):
         self.executor = futures.ThreadPoolExecutor(max_workers=max_workers)
         self.queue_size = 0
+        self.pending = set()
+        self.spool = spool
         self._lock = threading.Lock()
 
     def send(self, backend: TelemetryBackend, message: Message):
+        if self.spool is not None:
+            self.spool.append(backend.id, message)
+            return
+
         def _future_callback(future):
             with self._lock:
                 self.queue_size -= 1
+                self.pending.discard(future)
 
         with self._lock:
             if self.queue_size < MAX_QUEUE_SIZE:
                 fut = self.executor.submit(backend.send, message)
-                fut.add_done_callback(_future_callback)
+                self.pending.add(fut)
                 self.queue_size += 1
             else:
-                pass  # dropping a message because the queue is full
+                fut = None  # dropping a message because the queue is full
+        if fut is not None:
+            # the callback is called immediately if the message is already sent, so it is added without the lock
+            fut.add_done_callback(_future_callback)
 
     def force_shutdown(self, timeout: float):
         """
@@ -49,13 +63,15 @@ class TelemetrySender:
         attribute. The operation with low-level attributes is wrapped with the try/except to avoid potential crash if
         these attributes will removed or renamed.
 
-        :param timeout: timeout to wait before the shutdown
+        :param timeout: maximum time to wait for the queued messages to be sent before the shutdown
         :return: None
         """
         try:
             with self._lock:
-                if self.queue_size > 0:
-                    sleep(timeout)
+                pending = list(self.pending)
+            if pending:
+                futures.wait(pending, timeout=timeout)
+            with self._lock:
                 self.executor.shutdown(wait=False)
                 self.executor._threads.clear()
                 futures.thread._threads_queues.clear()
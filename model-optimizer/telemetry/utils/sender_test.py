@@ -0,0 +1,103 @@
+"""
+ Copyright (C) 2017-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import tempfile
+import time
+import unittest
+
+from telemetry.backend.backend import TelemetryBackend
+from telemetry.utils.message import Message, MessageType
+from telemetry.utils.sender import TelemetrySender
+from telemetry.utils.spool import TelemetrySpool
+
+
+class StubBackend(TelemetryBackend):
+    id = 'stub'
+
+    def __init__(self, tid: str = None, app_name: str = None, app_version: str = None, failed_batch: int = None):
+        self.sent = []
+        self.batches = []
+        self.failed_batch = failed_batch
+
+    def send(self, message: Message):
+        self.sent.append(message.attrs)
+
+    def send_batch(self, messages: list):
+        if len(self.batches) == self.failed_batch:
+            raise ConnectionError('network is unreachable')
+        self.batches.append(len(messages))
+        super().send_batch(messages)
+
+    def build_event_message(self, event_category: str, event_action: str, event_label: str, event_value: int = 1,
+                            **kwargs):
+        return Message(MessageType.EVENT, {'ec': event_category, 'ea': event_action, 'el': event_label,
+                                           'ev': event_value})
+
+    def build_error_message(self, error_msg: str, **kwargs):
+        pass
+
+    def build_stack_trace_message(self, error_msg: str, **kwargs):
+        pass
+
+    def build_session_start_message(self, **kwargs):
+        return Message(MessageType.SESSION_START, {'sc': 'start'})
+
+    def build_session_end_message(self, **kwargs):
+        return Message(MessageType.SESSION_END, {'sc': 'end'})
+
+
+class TelemetrySenderTest(unittest.TestCase):
+    def test_shutdown_does_not_wait_for_timeout(self):
+        backend = StubBackend()
+        sender = TelemetrySender()
+        sender.send(backend, backend.build_event_message('mo', 'version', '1.0'))
+        start = time.perf_counter()
+        sender.force_shutdown(30.0)
+        self.assertLess(time.perf_counter() - start, 10.0)
+        self.assertEqual(len(backend.sent), 1)
+
+    def test_spool(self):
+        backend = StubBackend()
+        with tempfile.TemporaryDirectory() as spool_dir:
+            spool = TelemetrySpool(spool_dir)
+            sender = TelemetrySender(spool=spool)
+            sender.send(backend, backend.build_session_start_message())
+            for i in range(4):
+                sender.send(backend, backend.build_event_message('mo', 'event', str(i)))
+            sender.force_shutdown(1.0)
+            self.assertListEqual(backend.sent, [])
+
+            self.assertEqual(spool.flush(backend, batch_size=2), 5)
+            self.assertListEqual(backend.batches, [2, 2, 1])
+            self.assertDictEqual(backend.sent[0], {'sc': 'start'})
+            self.assertListEqual([attrs['el'] for attrs in backend.sent[1:]], ['0', '1', '2', '3'])
+
+            # the flushed messages are removed from the spool
+            self.assertEqual(spool.flush(backend), 0)
+
+    def test_spool_keeps_not_sent_messages(self):
+        with tempfile.TemporaryDirectory() as spool_dir:
+            spool = TelemetrySpool(spool_dir)
+            backend = StubBackend(failed_batch=1)
+            for i in range(5):
+                spool.append(backend.id, backend.build_event_message('mo', 'event', str(i)))
+
+            self.assertEqual(spool.flush(backend, batch_size=2), 2)
+            self.assertListEqual([attrs['el'] for attrs in backend.sent], ['0', '1'])
+
+            backend.failed_batch = None
+            self.assertEqual(spool.flush(backend, batch_size=2), 3)
+            self.assertListEqual([attrs['el'] for attrs in backend.sent], ['0', '1', '2', '3', '4'])
@@ -0,0 +1,112 @@
+"""
+ Copyright (C) 2017-2021 Intel Corporation
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from telemetry.utils.message import Message, MessageType
+
+# the environment variable with the directory to spool the telemetry messages to instead of sending them
+SPOOL_DIR_ENV_KEY = 'OPENVINO_TELEMETRY_SPOOL_DIR'
+
+DEFAULT_BATCH_SIZE = 20
+
+
+class TelemetrySpool:
+    """
+    Stores the telemetry messages to the local files, one file per backend, so the messages are sent later by the
+    flush method without any network operations when the message is sent by the application.
+    """
+
+    def __init__(self, spool_dir: str):
+        self.spool_dir = spool_dir
+
+    def spool_file(self, backend_id: str):
+        return os.path.join(self.spool_dir, '{}.jsonl'.format(backend_id))
+
+    def append(self, backend_id: str, message: Message):
+        try:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            # the line is written with the single call, so the lines written by concurrent processes are not mixed
+            with open(self.spool_file(backend_id), 'a') as f:
+                f.write(json.dumps({'type': message.type.name, 'attrs': message.attrs}) + '\n')
+        except Exception:
+            pass
+
+    def flush(self, backend, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Sends the messages spooled for the backend in batches and removes them from the spool. If the backend fails to
+        send the batch, the messages which are not sent are kept in the spool.
+
+        :param backend: the TelemetryBackend instance to send messages with
+        :param batch_size: maximum number of messages in the batch
+        :return: the number of sent messages
+        """
+        spool_file = self.spool_file(backend.id)
+        # the messages appended during the flush go to the new spool file
+        flushed_file = '{}.{}.flush'.format(spool_file, os.getpid())
+        try:
+            os.replace(spool_file, flushed_file)
+        except OSError:
+            return 0
+
+        messages = []
+        with open(flushed_file, 'r') as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    messages.append(Message(MessageType[data['type']], data['attrs']))
+                except (ValueError, KeyError):
+                    # the line may be not completed if the application was terminated
+                    continue
+
+        sent = 0
+        try:
+            for start in range(0, len(messages), batch_size):
+                batch = messages[start:start + batch_size]
+                backend.send_batch(batch)
+                sent += len(batch)
+        except Exception:
+            # the messages of the failed batch and the following ones are spooled again to be sent by the next flush
+            for message in messages[sent:]:
+                self.append(backend.id, message)
+        # the flushed file is removed when all messages are sent or spooled again
+        os.remove(flushed_file)
+        return sent
+
+
+def main():
+    from telemetry.backend.backend import BackendRegistry
+
+    parser = argparse.ArgumentParser(description='Sends the spooled telemetry messages')
+    parser.add_argument('--spool_dir', default=os.environ.get(SPOOL_DIR_ENV_KEY),
+                        help='Directory with the spooled messages. The {} environment variable value is used by '
+                             'default'.format(SPOOL_DIR_ENV_KEY))
+    parser.add_argument('--backend', default='ga', help='Id of the backend to send messages with')
+    parser.add_argument('--batch_size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    if not args.spool_dir:
+        parser.error('the spool directory is not specified')
+
+    backend = BackendRegistry.get_backend(args.backend)()
+    print('Sent {} telemetry messages'.format(TelemetrySpool(args.spool_dir).flush(backend, args.batch_size)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())